@@ -0,0 +1,14 @@
+from allauth.account.adapter import DefaultAccountAdapter
+from django import forms
+
+from board import bot
+from utils.messages import MESSAGES
+
+
+class AccountAdapter(DefaultAccountAdapter):
+    """Keeps the computer player's username out of reach of signups, see 'board.bot'."""
+
+    def clean_username(self, username, shallow=False):
+        if username.lower() == bot.get_bot_username().lower():
+            raise forms.ValidationError(MESSAGES["SYS018"].value)
+        return super().clean_username(username, shallow=shallow)
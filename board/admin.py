@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from board.models import Board, Nodes
+from board.models import Board, Move, PlayerStats, Tournament, TournamentPlayer
 
 
 @admin.register(Board)
@@ -8,8 +8,23 @@ class BoardAdmin(admin.ModelAdmin):
     pass
 
 
-@admin.register(Nodes)
-class NodesAdmin(admin.ModelAdmin):
+@admin.register(Move)
+class MoveAdmin(admin.ModelAdmin):
+    pass
+
+
+@admin.register(PlayerStats)
+class PlayerStatsAdmin(admin.ModelAdmin):
+    pass
+
+
+@admin.register(Tournament)
+class TournamentAdmin(admin.ModelAdmin):
+    pass
+
+
+@admin.register(TournamentPlayer)
+class TournamentPlayerAdmin(admin.ModelAdmin):
     pass
 
 
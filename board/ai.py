@@ -0,0 +1,181 @@
+"""
+Negamax search with alpha-beta pruning used by the computer player.
+
+Positions are stored in a transposition table under their canonical form, the smallest of the position's images
+under the symmetries of the board (the D4 group for square boards), so mirrored and rotated positions are only ever
+searched once. Searchers are cached per geometry and shared by every game played in the process.
+"""
+from board import constants, engine
+
+EXACT, LOWER, UPPER = 0, 1, 2
+# Larger than any heuristic evaluation, wins found after n plies score 'WIN - n'.
+WIN = 1_000_000
+
+
+def _symmetries(geometry):
+    def cell(row, column):
+        return row * geometry.columns + column
+
+    last_row, last_column = geometry.rows - 1, geometry.columns - 1
+    transforms = [
+        lambda row, column: (row, column),
+        lambda row, column: (row, last_column - column),
+        lambda row, column: (last_row - row, column),
+        lambda row, column: (last_row - row, last_column - column),
+    ]
+    if geometry.rows == geometry.columns:
+        transforms += [
+            lambda row, column: (column, row),
+            lambda row, column: (column, last_row - row),
+            lambda row, column: (last_column - column, row),
+            lambda row, column: (last_column - column, last_row - row),
+        ]
+    return tuple(
+        tuple(
+            cell(*transform(*divmod(index, geometry.columns)))
+            for index in range(geometry.size)
+        )
+        for transform in transforms
+    )
+
+
+class Searcher:
+    """Searches positions of a single geometry, keeping its transposition table between calls."""
+
+    def __init__(self, geometry=engine.CLASSIC, max_depth=None, table_size=1_000_000):
+        self.geometry = geometry
+        self.max_depth = geometry.size if max_depth is None else max_depth
+        self.table_size = table_size
+        self.table = {}
+        self.symmetries = _symmetries(geometry)[1:]
+        # Cells on more lines are tried first, they are the likeliest to cause cutoffs.
+        self.ordering = sorted(
+            range(geometry.size), key=lambda cell: -len(geometry.lines_through[cell])
+        )
+
+    def canonical(self, state):
+        key = (state.cross, state.circle)
+        for permutation in self.symmetries:
+            cross = circle = 0
+            for cell in engine.iter_cells(state.cross):
+                cross |= 1 << permutation[cell]
+            for cell in engine.iter_cells(state.circle):
+                circle |= 1 << permutation[cell]
+            key = min(key, (cross, circle))
+        return key
+
+    def ordered_moves(self, state):
+        empty = self.geometry.full & ~state.occupied
+        return [cell for cell in self.ordering if empty >> cell & 1]
+
+    def best_move(self, state):
+        """Returns the best cell for the side to move along with its score, the higher the better for that side."""
+        if len(self.table) > self.table_size:
+            self.table.clear()
+        best_cell, alpha, beta = None, -WIN, WIN
+        for cell in self.ordered_moves(state):
+            score = -self.negamax(
+                *engine.apply_move(state, cell, geometry=self.geometry),
+                1,
+                -beta,
+                -alpha,
+            )
+            if best_cell is None or score > alpha:
+                best_cell, alpha = cell, score
+        return best_cell, alpha
+
+    def negamax(self, state, status, depth, alpha, beta):
+        """Score of ``state`` for the side to move, reached after ``depth`` plies from the searched root."""
+        if status != constants.UNFINISHED:
+            # Faster wins score higher, so the side that just played should have won as early as possible.
+            return 0 if status == constants.DRAW else depth - WIN
+        remaining = self.max_depth - depth
+        if remaining <= 0:
+            return self.evaluate(state)
+
+        original_alpha = alpha
+        key = self.canonical(state)
+        entry = self.table.get(key)
+        if entry is not None and entry[0] >= remaining:
+            flag, value = entry[1], self.from_table(entry[2], depth)
+            if flag == EXACT:
+                return value
+            if flag == LOWER:
+                alpha = max(alpha, value)
+            else:
+                beta = min(beta, value)
+            if alpha >= beta:
+                return value
+
+        value = -WIN
+        moves = self.ordered_moves(state)
+        circle = state.circle_to_move
+        children = [
+            engine.apply_move(state, cell, circle=circle, geometry=self.geometry)
+            for cell in moves
+        ]
+        if any(
+            status not in (constants.UNFINISHED, constants.DRAW)
+            for _, status in children
+        ):
+            # An immediate win can't be improved on.
+            value = WIN - depth - 1
+        else:
+            for child, child_status in children:
+                value = max(
+                    value, -self.negamax(child, child_status, depth + 1, -beta, -alpha)
+                )
+                alpha = max(alpha, value)
+                if alpha >= beta:
+                    break
+
+        if value <= original_alpha:
+            flag = UPPER
+        elif value >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        self.table[key] = (remaining, flag, self.to_table(value, depth))
+        return value
+
+    def evaluate(self, state):
+        """Heuristic score of a position the search didn't reach the end of: lines still open for each side."""
+        if state.circle_to_move:
+            own, other = state.circle, state.cross
+        else:
+            own, other = state.cross, state.circle
+        score = 0
+        for line in self.geometry.lines:
+            if not line & other and line & own:
+                score += 1
+            elif not line & own and line & other:
+                score -= 1
+        return score
+
+    def is_decided(self, value):
+        return abs(value) >= WIN - self.geometry.size - 1
+
+    def to_table(self, value, depth):
+        """Win and loss scores are stored relative to the position instead of the root they were searched from."""
+        if not self.is_decided(value):
+            return value
+        return value + depth if value > 0 else value - depth
+
+    def from_table(self, value, depth):
+        if not self.is_decided(value):
+            return value
+        return value - depth if value > 0 else value + depth
+
+
+_searchers = {}
+
+
+def get_searcher(geometry=engine.CLASSIC, max_depth=None):
+    key = (geometry.columns, geometry.rows, geometry.k, max_depth)
+    if key not in _searchers:
+        _searchers[key] = Searcher(geometry, max_depth=max_depth)
+    return _searchers[key]
+
+
+def best_move(state, geometry=engine.CLASSIC, max_depth=None):
+    return get_searcher(geometry, max_depth).best_move(state)[0]
@@ -0,0 +1,76 @@
+from django.utils.translation import gettext_lazy as _
+from drf_yasg import openapi
+
+pairing_schema = openapi.Schema(
+    title=_("Pairing"),
+    type=openapi.TYPE_OBJECT,
+    required=["player_cross", "player_circle"],
+    properties={
+        "player_cross": openapi.Schema(
+            type=openapi.TYPE_INTEGER,
+            description=_("ID of the user playing crosses."),
+        ),
+        "player_circle": openapi.Schema(
+            type=openapi.TYPE_INTEGER,
+            description=_("ID of the user playing circles."),
+        ),
+    },
+)
+
+create_boards_body = openapi.Schema(
+    type=openapi.TYPE_OBJECT,
+    required=["boards"],
+    properties={
+        "boards": openapi.Schema(
+            type=openapi.TYPE_ARRAY,
+            items=pairing_schema,
+            description=_("One pairing for every game to create."),
+        )
+    },
+)
+
+create_boards_response_dict = {
+    "201": openapi.Response(
+        description=_("Every game was created."),
+        schema=openapi.Schema(
+            title=_("Created games."),
+            type=openapi.TYPE_OBJECT,
+            read_only=True,
+            description=_("Schema of a 201 status code response for this view"),
+            properties={
+                "success": openapi.Schema(
+                    type=openapi.TYPE_BOOLEAN,
+                    read_only=True,
+                    description=_("Boolean value, True if the games were created"),
+                ),
+                "ids": openapi.Schema(
+                    type=openapi.TYPE_ARRAY,
+                    items=openapi.Schema(type=openapi.TYPE_INTEGER),
+                    read_only=True,
+                    description=_(
+                        "IDs of the new boards, in the order of the pairings."
+                    ),
+                ),
+            },
+        ),
+        examples={"application/json": {"success": True, "ids": [1, 2]}},
+    ),
+    "400": openapi.Response(
+        description=_("A pairing is invalid, no game was created."),
+        examples={
+            "application/json": {
+                "type": "BAD_REQUEST",
+                "errors": ["A single user can't play both teams."],
+            }
+        },
+    ),
+    "412": openapi.Response(
+        description=_("There was a problem with the sent payload."),
+        examples={
+            "application/json": {
+                "type": "PRECONDITION_FAILED",
+                "errors": ["1 validation error for NewBoardsStructure"],
+            }
+        },
+    ),
+}
@@ -0,0 +1,56 @@
+from django.utils.translation import gettext_lazy as _
+from drf_yasg import openapi
+
+board_id_parameter = openapi.Parameter(
+    "board_id",
+    openapi.IN_QUERY,
+    description=_("ID of the board to get a hint for."),
+    type=openapi.TYPE_INTEGER,
+    required=True,
+)
+
+hint_response_dict = {
+    "200": openapi.Response(
+        description=_("Best move for the side to play."),
+        schema=openapi.Schema(
+            title=_("Hint."),
+            type=openapi.TYPE_OBJECT,
+            read_only=True,
+            description=_("Schema of a 200 status code response for this view"),
+            properties={
+                "position": openapi.Schema(
+                    type=openapi.TYPE_STRING,
+                    read_only=True,
+                    description=_("Best position to play, as 'column_row'."),
+                ),
+                "value": openapi.Schema(
+                    type=openapi.TYPE_INTEGER,
+                    read_only=True,
+                    description=_(
+                        "Result with perfect play for the side to move, 1 for a victory, 0 for a draw and -1 for a "
+                        "defeat."
+                    ),
+                ),
+            },
+        ),
+        examples={"application/json": {"position": "A_1", "value": 0}},
+    ),
+    "400": openapi.Response(
+        description=_("The board doesn't exist or has no moves left."),
+        examples={
+            "application/json": {
+                "type": "BAD_REQUEST",
+                "errors": ["This game is already finished."],
+            }
+        },
+    ),
+    "412": openapi.Response(
+        description=_("There was a problem with the sent parameters."),
+        examples={
+            "application/json": {
+                "type": "PRECONDITION_FAILED",
+                "errors": ["Not a vaid ID, this field should be a numerical string."],
+            }
+        },
+    ),
+}
@@ -0,0 +1,120 @@
+from django.utils.translation import gettext_lazy as _
+from drf_yasg import openapi
+
+leaderboard_parameters = [
+    openapi.Parameter(
+        "limit",
+        openapi.IN_QUERY,
+        description=_("Players per page, up to 100."),
+        type=openapi.TYPE_INTEGER,
+        default=20,
+    ),
+    openapi.Parameter(
+        "after_rating",
+        openapi.IN_QUERY,
+        description=_("Rating of the last player of the previous page."),
+        type=openapi.TYPE_NUMBER,
+    ),
+    openapi.Parameter(
+        "after_user",
+        openapi.IN_QUERY,
+        description=_("ID of the last player of the previous page."),
+        type=openapi.TYPE_INTEGER,
+    ),
+]
+
+player_schema = openapi.Schema(
+    type=openapi.TYPE_OBJECT,
+    read_only=True,
+    properties={
+        "user_id": openapi.Schema(type=openapi.TYPE_INTEGER, read_only=True),
+        "username": openapi.Schema(type=openapi.TYPE_STRING, read_only=True),
+        "rating": openapi.Schema(type=openapi.TYPE_NUMBER, read_only=True),
+    },
+)
+
+leaderboard_response_dict = {
+    "200": openapi.Response(
+        description=_("Page of players, best rated first."),
+        schema=openapi.Schema(
+            title=_("Leaderboard."),
+            type=openapi.TYPE_OBJECT,
+            read_only=True,
+            description=_("Schema of a 200 status code response for this view"),
+            properties={
+                "results": openapi.Schema(
+                    type=openapi.TYPE_ARRAY, read_only=True, items=player_schema
+                ),
+                "next": openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    read_only=True,
+                    description=_(
+                        "Query parameters of the next page, null on the last one."
+                    ),
+                ),
+            },
+        ),
+        examples={
+            "application/json": {
+                "results": [{"user_id": 1, "username": "Erick", "rating": 1216.0}],
+                "next": {"after_rating": 1216.0, "after_user": 1},
+            }
+        },
+    ),
+    "412": openapi.Response(
+        description=_("There was a problem with the sent parameters."),
+        examples={
+            "application/json": {
+                "type": "PRECONDITION_FAILED",
+                "errors": ["'after_rating' and 'after_user' go together."],
+            }
+        },
+    ),
+}
+
+user_id_parameter = openapi.Parameter(
+    "user_id",
+    openapi.IN_QUERY,
+    description=_("ID of the player, the logged in user by default."),
+    type=openapi.TYPE_INTEGER,
+)
+
+rank_response_dict = {
+    "200": openapi.Response(
+        description=_("Position of the player in the leaderboard."),
+        schema=openapi.Schema(
+            title=_("Rank."),
+            type=openapi.TYPE_OBJECT,
+            read_only=True,
+            description=_("Schema of a 200 status code response for this view"),
+            properties={
+                "user_id": openapi.Schema(type=openapi.TYPE_INTEGER, read_only=True),
+                "rank": openapi.Schema(
+                    type=openapi.TYPE_INTEGER,
+                    read_only=True,
+                    description=_("Players with the same rating share their rank."),
+                ),
+                "rating": openapi.Schema(type=openapi.TYPE_NUMBER, read_only=True),
+            },
+        ),
+        examples={"application/json": {"user_id": 1, "rank": 3, "rating": 1216.0}},
+    ),
+    "400": openapi.Response(
+        description=_("The player hasn't finished any game."),
+        examples={
+            "application/json": {
+                "type": "BAD_REQUEST",
+                "errors": ["This player hasn't finished any game yet."],
+            }
+        },
+    ),
+    "412": openapi.Response(
+        description=_("There was a problem with the sent parameters."),
+        examples={
+            "application/json": {
+                "type": "PRECONDITION_FAILED",
+                "errors": ["Not a vaid ID, this field should be a numerical string."],
+            }
+        },
+    ),
+}
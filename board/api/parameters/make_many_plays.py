@@ -0,0 +1,92 @@
+from django.utils.translation import gettext_lazy as _
+from drf_yasg import openapi
+
+from board.api.parameters.make_a_play import make_a_play_body
+
+make_many_plays_body = openapi.Schema(
+    type=openapi.TYPE_OBJECT,
+    required=["moves"],
+    properties={
+        "moves": openapi.Schema(
+            type=openapi.TYPE_ARRAY,
+            items=make_a_play_body,
+            description=_("Moves to make, at most one per board is recommended."),
+        )
+    },
+)
+
+move_result_schema = openapi.Schema(
+    title=_("Move result."),
+    type=openapi.TYPE_OBJECT,
+    read_only=True,
+    properties={
+        "board_id": openapi.Schema(
+            type=openapi.TYPE_INTEGER,
+            read_only=True,
+            description=_("ID of the board the move was sent for."),
+        ),
+        "success": openapi.Schema(
+            type=openapi.TYPE_BOOLEAN,
+            read_only=True,
+            description=_("Boolean value, True if the play was successful"),
+        ),
+        "message": openapi.Schema(
+            type=openapi.TYPE_STRING,
+            read_only=True,
+            description=_("Status of the game after a successful move."),
+        ),
+        "errors": openapi.Schema(
+            type=openapi.TYPE_ARRAY,
+            items=openapi.Schema(type=openapi.TYPE_STRING),
+            read_only=True,
+            description=_("Why the move was rejected."),
+        ),
+    },
+)
+
+make_many_plays_response_dict = {
+    "200": openapi.Response(
+        description=_(
+            "Every valid move was played, each result tells how its own move went."
+        ),
+        schema=openapi.Schema(
+            title=_("Results of the moves."),
+            type=openapi.TYPE_OBJECT,
+            read_only=True,
+            description=_("Schema of a 200 status code response for this view"),
+            properties={
+                "results": openapi.Schema(
+                    type=openapi.TYPE_ARRAY,
+                    items=move_result_schema,
+                    read_only=True,
+                    description=_("One result per move, in the order they were sent."),
+                )
+            },
+        ),
+        examples={
+            "application/json": {
+                "results": [
+                    {
+                        "board_id": 1,
+                        "success": True,
+                        "message": _("Great! Now wait for your opponent to play."),
+                    },
+                    {
+                        "board_id": 2,
+                        "success": False,
+                        "errors": [_("It's not your turn.")],
+                    },
+                ]
+            }
+        },
+    ),
+    "412": openapi.Response(
+        description=_("The payload isn't a list of moves."),
+        examples={
+            "application/json": {
+                "type": "PRECONDITION_FAILED",
+                "errors": ["1 validation error for NewMovesStructure"],
+            }
+        },
+    ),
+}
@@ -1,42 +1,74 @@
-from typing import List
+from typing import Any
 
 from django.core.exceptions import ValidationError
-from pydantic import BaseModel, Field, conlist, constr, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 
-from board.models import Board
+from board import constants
 from utils.messages import MESSAGES
 
+MAX_BATCH_MOVES = 500
+MAX_LEADERBOARD_PAGE = 100
+
+
+def _first(v):
+    """Form payloads come as QueryDict lists, only the first value is taken into account."""
+    if isinstance(v, (list, tuple)):
+        if not v:
+            raise ValueError("At least one value is required.")
+        return v[0]
+    return v
+
 
 class NewMoveStructure(BaseModel):
-    board_id: conlist(constr(min_length=1), min_length=1)
-    position: conlist(constr(min_length=1), min_length=1)
+    """Shape of a move's payload, parsed once and without touching the database."""
 
-    @field_validator("board_id")
-    def board_exists(cls, v, values, **kwargs):
+    board_id: int
+    position: tuple[str, str]
+
+    @field_validator("board_id", mode="before")
+    def valid_id(cls, v, values, **kwargs):
         try:
-            int(v[0])
-        except ValueError:
+            return int(_first(v))
+        except (TypeError, ValueError):
             raise ValidationError(MESSAGES["SYS006"].value)
-        exists = Board.objects.filter(id=int(v[0])).exists()
-        if not exists:
-            raise ValidationError(
-                MESSAGES["SYS003"].value.format(f"{Board._meta.verbose_name.title()}")
-            )
-        return v
-
-    @field_validator("position")
+
+    @field_validator("position", mode="before")
     def valid_position(cls, v, values, **kwargs):
-        if values.data.get("board_id", None):
-            board = Board.objects.get(id=values.data.get("board_id")[0])
-            column, row = v[0].split("_")
+        try:
+            column, row = str(_first(v)).split("_")
+        except ValueError:
+            raise ValidationError(MESSAGES["SYS002"].value)
+        if not column or not row:
+            raise ValidationError(MESSAGES["SYS002"].value)
+        return column, row
+
+
+class NewMovesStructure(BaseModel):
+    """Batch of moves, each one is parsed with 'NewMoveStructure' on its own so a malformed move only fails itself."""
+
+    moves: list[Any] = Field(min_length=1, max_length=MAX_BATCH_MOVES)
+
+
+class PairingStructure(BaseModel):
+    player_cross: int
+    player_circle: int
+
+
+class NewBoardsStructure(BaseModel):
+    """Pairings of a bulk creation, players are checked against the database by 'board.services.create_boards'."""
+
+    boards: list[PairingStructure] = Field(min_length=1)
+
 
-            if column not in ["A", "B", "C"] or int(row) not in [1, 2, 3]:
-                raise ValidationError(MESSAGES["SYS004"].value)
+class LeaderboardStructure(BaseModel):
+    """Query of a leaderboard page, ``after_rating`` and ``after_user`` come from the previous page's ``next``."""
 
-            if (
-                int(row) in board.positions_circle[column]
-                or int(row) in board.positions_cross[column]
-            ):
-                raise ValidationError(MESSAGES["SYS005"].value)
+    limit: int = Field(default=20, ge=1, le=MAX_LEADERBOARD_PAGE)
+    after_rating: float | None = None
+    after_user: int | None = Field(default=None, ge=1, le=constants.MAX_ID)
 
-        return v
+    @model_validator(mode="after")
+    def complete_cursor(self):
+        if (self.after_rating is None) != (self.after_user is None):
+            raise ValueError("'after_rating' and 'after_user' go together.")
+        return self
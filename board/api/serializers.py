@@ -4,3 +4,12 @@ from rest_framework import serializers
 class NewMoveStructureSerializer(serializers.Serializer):
     position = serializers.CharField()
     board_id = serializers.IntegerField()
+
+
+class PairingStructureSerializer(serializers.Serializer):
+    player_cross = serializers.IntegerField()
+    player_circle = serializers.IntegerField()
+
+
+class NewBoardsStructureSerializer(serializers.Serializer):
+    boards = PairingStructureSerializer(many=True)
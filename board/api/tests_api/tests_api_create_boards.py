@@ -0,0 +1,81 @@
+import json
+
+from django.contrib.auth import get_user_model
+from django.shortcuts import reverse
+from rest_framework.test import APITestCase
+
+from board.models import Board
+
+User = get_user_model()
+
+
+class CreateBoardsTests(APITestCase):
+    """Tests for 'board:api_create_boards' api view."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user1 = User.objects.create_user(username="Erick", password="abc*.123")
+        cls.user2 = User.objects.create_user(username="Erick1", password="abc*.123")
+        cls.admin = User.objects.create_superuser(
+            username="Erick2", password="abc*.123"
+        )
+
+        cls.url = reverse("board:api_create_boards")
+
+    def test_permissions(self):
+        """Test to check only staff users can create games in bulk."""
+        data = {
+            "boards": [{"player_cross": self.user1.pk, "player_circle": self.user2.pk}]
+        }
+        response = self.client.post(self.url, data=data, format="json")
+        success = [response.status_code == 403]
+        self.client.force_login(user=self.user1)
+        response = self.client.post(self.url, data=data, format="json")
+        success.extend([response.status_code == 403, not Board.objects.exists()])
+        self.assertTrue(all(success))
+
+    def test_create_boards(self):
+        """Test to check games are created for every pairing and wrong payloads or pairings create none."""
+        self.client.force_login(user=self.admin)
+        success = []
+        for data, status_code in [
+            ({}, 412),
+            ({"boards": []}, 412),
+            ({"boards": [{"player_cross": "a", "player_circle": 1}]}, 412),
+            (
+                {
+                    "boards": [
+                        {"player_cross": self.user1.pk, "player_circle": self.user1.pk}
+                    ]
+                },
+                400,
+            ),
+        ]:
+            response = self.client.post(self.url, data=data, format="json")
+            success.append(response.status_code == status_code)
+        success.append(not Board.objects.exists())
+
+        data = {
+            "boards": [
+                {"player_cross": self.user1.pk, "player_circle": self.user2.pk},
+                {"player_cross": self.user2.pk, "player_circle": self.user1.pk},
+            ]
+        }
+        response = self.client.post(self.url, data=data, format="json")
+        content = json.loads(response.content)
+        success.extend(
+            [
+                response.status_code == 201,
+                content["success"] is True,
+                list(
+                    Board.objects.filter(pk__in=content["ids"])
+                    .order_by("pk")
+                    .values_list("player_cross", "player_circle")
+                )
+                == [
+                    (self.user1.pk, self.user2.pk),
+                    (self.user2.pk, self.user1.pk),
+                ],
+            ]
+        )
+        self.assertTrue(all(success))
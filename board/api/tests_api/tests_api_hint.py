@@ -0,0 +1,56 @@
+import json
+
+from django.contrib.auth import get_user_model
+from django.shortcuts import reverse
+from rest_framework.test import APITestCase
+
+from board.models import Board
+
+User = get_user_model()
+
+
+class HintTests(APITestCase):
+    """Tests for 'board:api_hint' api view."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user1 = User.objects.create_user(username="Erick", password="abc*.123")
+        cls.user2 = User.objects.create_user(username="Erick1", password="abc*.123")
+        cls.board = Board.objects.create(
+            player_circle=cls.user1, player_cross=cls.user2
+        )
+
+        cls.url = reverse("board:api_hint")
+
+    def test_wrong_parameters(self):
+        """Test to check that this view reacts correctly in front of missing or invalid boards."""
+        success = []
+        for params, status_code in [
+            ({}, 412),
+            ({"board_id": "a"}, 412),
+            ({"board_id": 1000}, 400),
+            ({"board_id": 10**23}, 412),
+        ]:
+            response = self.client.get(self.url, params)
+            success.append(response.status_code == status_code)
+        self.assertTrue(all(success))
+
+    def test_hint(self):
+        """Test to check the best move is returned and finished games get no hint."""
+        self.board.positions_circle["A"] = [1, 2]
+        self.board.positions_cross["B"] = [2]
+        self.board.save()
+        response = self.client.get(self.url, {"board_id": self.board.pk})
+        content = json.loads(response.content)
+        success = [
+            response.status_code == 200,
+            content["position"] == "A_3",
+            content["value"] == 0,
+        ]
+
+        self.board.positions_circle["A"] = [1, 2, 3]
+        self.board.positions_cross["B"] = [1, 2]
+        self.board.save()
+        response = self.client.get(self.url, {"board_id": self.board.pk})
+        success.append(response.status_code == 400)
+        self.assertTrue(all(success))
@@ -0,0 +1,65 @@
+import json
+
+from django.contrib.auth import get_user_model
+from django.shortcuts import reverse
+from rest_framework.test import APITestCase
+
+from board.models import PlayerStats
+
+User = get_user_model()
+
+
+class LeaderboardTests(APITestCase):
+    """Tests for 'board:api_leaderboard' and 'board:api_rank' api views."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.users = [
+            User.objects.create_user(username=username, password="abc*.123")
+            for username in ["Erick", "Erick1", "Erick2"]
+        ]
+        for user, rating in zip(cls.users, [1200, 1250, 1200]):
+            PlayerStats.objects.create(user=user, rating=rating)
+        cls.leaderboard_url = reverse("board:api_leaderboard")
+        cls.rank_url = reverse("board:api_rank")
+
+    def test_wrong_parameters(self):
+        """Test to check that these views react correctly in front of invalid parameters or players without games."""
+        success = []
+        for url, params, status_code in [
+            (self.leaderboard_url, {"limit": 0}, 412),
+            (self.leaderboard_url, {"limit": "a"}, 412),
+            (self.leaderboard_url, {"after_rating": 1200}, 412),
+            (self.leaderboard_url, {"after_rating": 1200, "after_user": 10**23}, 412),
+            (self.rank_url, {}, 412),
+            (self.rank_url, {"user_id": "a"}, 412),
+            (self.rank_url, {"user_id": 10**23}, 412),
+            (self.rank_url, {"user_id": 1000}, 400),
+        ]:
+            response = self.client.get(url, params)
+            success.append(response.status_code == status_code)
+        self.assertTrue(all(success))
+
+    def test_leaderboard(self):
+        """Test to check pages follow each other without repeating or skipping players with the same rating."""
+        usernames, params = [], {"limit": 2}
+        while params is not None:
+            response = self.client.get(self.leaderboard_url, params)
+            content = json.loads(response.content)
+            usernames.extend(player["username"] for player in content["results"])
+            params = content["next"] and {"limit": 2, **content["next"]}
+        self.assertEqual(usernames, ["Erick1", "Erick", "Erick2"])
+
+    def test_rank(self):
+        """Test to check players with the same rating share their rank, and logged in users get their own."""
+        response = self.client.get(self.rank_url, {"user_id": self.users[2].pk})
+        content = json.loads(response.content)
+        success = [
+            response.status_code == 200,
+            (content["rank"], content["rating"]) == (2, 1200),
+        ]
+        self.client.force_login(self.users[1])
+        response = self.client.get(self.rank_url)
+        content = json.loads(response.content)
+        success.append((content["user_id"], content["rank"]) == (self.users[1].pk, 1))
+        self.assertTrue(all(success))
@@ -1,10 +1,13 @@
 import json
 
 from django.contrib.auth import get_user_model
+from django.db import connection
 from django.db.models import Q
 from django.shortcuts import reverse
+from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APITestCase
 
+from board import bot
 from board.forms import CreateBoardForm
 from board.models import Board
 
@@ -114,9 +117,7 @@ class MakeAPlayTests(APITestCase):
             ]
         )
         self.board.positions_circle["B"] = [2]
-        self.board.nodes.next_player = self.user2
         self.board.save()
-        self.board.nodes.save()
 
         data_dict.update({"board_id": self.board.pk, "position": "B_2"})
         response = self.client.post(self.url, data=data_dict)
@@ -142,6 +143,8 @@ class MakeAPlayTests(APITestCase):
         self.board.positions_circle["A"] = [1, 2]
         self.board.positions_cross["B"] = [1, 2]
         self.board.save()
+        # Positions are set by hand on every case, so moves logged by the previous one don't apply.
+        self.board.moves.all().delete()
         data_dict = {
             "board_id": self.board.pk,
             "position": "A_3",
@@ -159,9 +162,10 @@ class MakeAPlayTests(APITestCase):
 
         # Circle diagonal victory, status expected 3
         self.board.positions_circle["A"], self.board.positions_circle["B"] = [1], [2]
-        self.board.positions_cross["C"] = [1, 2]
+        self.board.positions_cross["B"], self.board.positions_cross["C"] = [1], [1]
         self.board.status = 1
         self.board.save()
+        self.board.moves.all().delete()
         data_dict.update({"position": "C_3"})
         response = self.client.post(self.url, data=data_dict)
         board = Board.objects.get(id=self.board.pk)
@@ -178,9 +182,10 @@ class MakeAPlayTests(APITestCase):
         self.client.logout()
         self.client.force_login(user=self.user2)
         self.board.positions_circle["A"], self.board.positions_circle["B"] = [1], [2, 3]
-        self.board.positions_cross["C"] = [1, 2]
+        self.board.positions_cross["B"], self.board.positions_cross["C"] = [], [1, 2]
         self.board.status = 1
         self.board.save()
+        self.board.moves.all().delete()
         data_dict.update({"position": "C_3"})
         response = self.client.post(self.url, data=data_dict)
         board = Board.objects.get(id=self.board.pk)
@@ -200,6 +205,7 @@ class MakeAPlayTests(APITestCase):
         self.board.positions_cross["C"] = [2, 3]
         self.board.status = 1
         self.board.save()
+        self.board.moves.all().delete()
         data_dict.update({"position": "C_1"})
         response = self.client.post(self.url, data=data_dict)
         board = Board.objects.get(id=self.board.pk)
@@ -213,21 +219,20 @@ class MakeAPlayTests(APITestCase):
         )
 
         # Draw, status expected 4
-        self.client.logout()
-        self.client.force_login(user=self.user2)
         (
             self.board.positions_circle["A"],
             self.board.positions_circle["C"],
             self.board.positions_circle["B"],
-        ) = ([1, 2], [1, 2], [3])
+        ) = ([1, 2], [1, 2], [])
         (
             self.board.positions_cross["A"],
             self.board.positions_cross["B"],
             self.board.positions_cross["C"],
-        ) = ([3], [1], [3])
+        ) = ([3], [1, 2], [3])
         self.board.status = 1
         self.board.save()
-        data_dict.update({"position": "B_2"})
+        self.board.moves.all().delete()
+        data_dict.update({"position": "B_3"})
         response = self.client.post(self.url, data=data_dict)
         board = Board.objects.get(id=self.board.pk)
         success.extend(
@@ -254,6 +259,7 @@ class MakeAPlayTests(APITestCase):
         ) = ([3], [1], [])
         self.board.status = 1
         self.board.save()
+        self.board.moves.all().delete()
         data_dict.update({"position": "B_2"})
         response = self.client.post(self.url, data=data_dict)
         board = Board.objects.get(id=self.board.pk)
@@ -268,3 +274,61 @@ class MakeAPlayTests(APITestCase):
         )
 
         self.assertTrue(all(success))
+
+    def test_computer_reply(self):
+        """Test to check the computer answers right after a move and never lets an opening win through."""
+        computer = bot.get_bot_user()
+        board = Board.objects.create(player_circle=self.user1, player_cross=computer)
+        self.client.force_login(user=self.user1)
+        response = self.client.post(
+            self.url, data={"board_id": board.pk, "position": "A_1"}
+        )
+        board.refresh_from_db()
+        success = [
+            response.status_code == 200,
+            json.loads(response.content)["message"].startswith("The computer played"),
+            sum(len(rows) for rows in board.positions_cross.values()) == 1,
+            # Anything but the center loses against an opening corner.
+            board.positions_cross["B"] == [2],
+            board.status == 1,
+        ]
+        self.assertTrue(all(success))
+
+    def test_turn_and_membership(self):
+        """
+        Test to check only the players of a board can move, each on their own turn, with the board loaded and updated
+        once.
+        """
+        success = []
+        data_dict = {"board_id": self.board.pk, "position": "A_1"}
+        for user, message in [
+            (self.user3, "You are not playing this game."),
+            (self.user2, "It's not your turn."),
+        ]:
+            self.client.force_login(user=user)
+            response = self.client.post(self.url, data=data_dict)
+            success.extend(
+                [
+                    response.status_code == 400,
+                    json.loads(response.content)["errors"][0] == message,
+                ]
+            )
+
+        self.client.force_login(user=self.user1)
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(self.url, data=data_dict)
+        board_selects = [
+            query["sql"]
+            for query in context.captured_queries
+            if query["sql"].startswith("SELECT")
+            and 'FROM "board_board"' in query["sql"]
+        ]
+        updates = [
+            query["sql"]
+            for query in context.captured_queries
+            if query["sql"].startswith("UPDATE")
+        ]
+        success.extend(
+            [response.status_code == 200, len(board_selects) == 1, len(updates) == 1]
+        )
+        self.assertTrue(all(success))
@@ -0,0 +1,78 @@
+import json
+
+from django.contrib.auth import get_user_model
+from django.shortcuts import reverse
+from rest_framework.test import APITestCase
+
+from board.models import Board
+from utils.messages import MESSAGES
+
+User = get_user_model()
+
+
+class MakeManyPlaysTests(APITestCase):
+    """Tests for 'board:api_make_movements' api view."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user1 = User.objects.create_user(username="Erick", password="abc*.123")
+        cls.user2 = User.objects.create_user(username="Erick1", password="abc*.123")
+        cls.board1 = Board.objects.create(
+            player_circle=cls.user1, player_cross=cls.user2
+        )
+        cls.board2 = Board.objects.create(
+            player_circle=cls.user1, player_cross=cls.user2
+        )
+
+        cls.url = reverse("board:api_make_movements")
+
+    def test_wrong_payload(self):
+        """Test to check payloads that aren't a list of moves are rejected as a whole."""
+        self.client.force_login(user=self.user1)
+        success = []
+        for data in [{}, {"moves": []}, {"moves": "A_1"}]:
+            response = self.client.post(self.url, data=data, format="json")
+            success.extend(
+                [
+                    response.status_code == 412,
+                    json.loads(response.content)["type"] == "PRECONDITION_FAILED",
+                ]
+            )
+        self.assertTrue(all(success))
+
+    def test_make_many_plays(self):
+        """Test to check every move gets its own result and malformed, invalid or out of range ones don't stop the others."""
+        self.client.force_login(user=self.user1)
+        data = {
+            "moves": [
+                {"board_id": self.board1.pk, "position": "A_1"},
+                {"board_id": self.board2.pk, "position": "A 1"},
+                "A_1",
+                {"board_id": self.board2.pk, "position": "D_1"},
+                {"board_id": self.board2.pk, "position": "C_3"},
+                {"board_id": 10**23, "position": "B_2"},
+            ]
+        }
+        response = self.client.post(self.url, data=data, format="json")
+        results = json.loads(response.content)["results"]
+        success = [
+            response.status_code == 200,
+            [result["success"] for result in results]
+            == [True, False, False, False, True, False],
+            [result["board_id"] for result in results]
+            == [
+                self.board1.pk,
+                self.board2.pk,
+                None,
+                self.board2.pk,
+                self.board2.pk,
+                10**23,
+            ],
+            results[0]["message"] == "Great! Now wait for your opponent to play.",
+            results[3]["errors"][0]
+            == "Not a vaid position, columns go from 'A' to 'C' and rows from 1 to 3.",
+            results[5]["errors"] == [MESSAGES["SYS006"].value],
+            Board.objects.get(pk=self.board2.pk).positions_circle
+            == {"A": [], "B": [], "C": [3]},
+        ]
+        self.assertTrue(all(success))
@@ -118,9 +118,7 @@ class MakeAPlayTests(APITestCase):
             ]
         )
         self.board.positions_circle["B"] = [2]
-        self.board.nodes.next_player = self.user2
         self.board.save()
-        self.board.nodes.save()
 
         data_dict.update({"board_id": self.board.pk, "position": "B_2"})
         response = self.client.post(self.url, data=data_dict)
@@ -147,6 +145,8 @@ class MakeAPlayTests(APITestCase):
         self.board.positions_circle["A"] = [1, 2]
         self.board.positions_cross["B"] = [1, 2]
         self.board.save()
+        # Positions are set by hand on every case, so moves logged by the previous one don't apply.
+        self.board.moves.all().delete()
         data_dict = {
             "board_id": self.board.pk,
             "position": "A_3",
@@ -164,9 +164,10 @@ class MakeAPlayTests(APITestCase):
 
         # Circle diagonal victory, status expected 3
         self.board.positions_circle["A"], self.board.positions_circle["B"] = [1], [2]
-        self.board.positions_cross["C"] = [1, 2]
+        self.board.positions_cross["B"], self.board.positions_cross["C"] = [1], [1]
         self.board.status = 1
         self.board.save()
+        self.board.moves.all().delete()
         data_dict.update({"position": "C_3"})
         response = self.client.post(self.url, data=data_dict)
         board = Board.objects.get(id=self.board.pk)
@@ -183,9 +184,10 @@ class MakeAPlayTests(APITestCase):
         self.client.logout()
         self.client.force_login(user=self.user2)
         self.board.positions_circle["A"], self.board.positions_circle["B"] = [1], [2, 3]
-        self.board.positions_cross["C"] = [1, 2]
+        self.board.positions_cross["B"], self.board.positions_cross["C"] = [], [1, 2]
         self.board.status = 1
         self.board.save()
+        self.board.moves.all().delete()
         data_dict.update({"position": "C_3"})
         response = self.client.post(self.url, data=data_dict)
         board = Board.objects.get(id=self.board.pk)
@@ -205,6 +207,7 @@ class MakeAPlayTests(APITestCase):
         self.board.positions_cross["C"] = [2, 3]
         self.board.status = 1
         self.board.save()
+        self.board.moves.all().delete()
         data_dict.update({"position": "C_1"})
         response = self.client.post(self.url, data=data_dict)
         board = Board.objects.get(id=self.board.pk)
@@ -218,21 +221,20 @@ class MakeAPlayTests(APITestCase):
         )
 
         # Draw, status expected 4
-        self.client.logout()
-        self.client.force_login(user=self.user2)
         (
             self.board.positions_circle["A"],
             self.board.positions_circle["C"],
             self.board.positions_circle["B"],
-        ) = ([1, 2], [1, 2], [3])
+        ) = ([1, 2], [1, 2], [])
         (
             self.board.positions_cross["A"],
             self.board.positions_cross["B"],
             self.board.positions_cross["C"],
-        ) = ([3], [1], [3])
+        ) = ([3], [1, 2], [3])
         self.board.status = 1
         self.board.save()
-        data_dict.update({"position": "B_2"})
+        self.board.moves.all().delete()
+        data_dict.update({"position": "B_3"})
         response = self.client.post(self.url, data=data_dict)
         board = Board.objects.get(id=self.board.pk)
         success.extend(
@@ -259,6 +261,7 @@ class MakeAPlayTests(APITestCase):
         ) = ([3], [1], [])
         self.board.status = 1
         self.board.save()
+        self.board.moves.all().delete()
         data_dict.update({"position": "B_2"})
         response = self.client.post(self.url, data=data_dict)
         board = Board.objects.get(id=self.board.pk)
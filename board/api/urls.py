@@ -3,7 +3,9 @@ from drf_yasg import openapi
 from drf_yasg.views import get_schema_view
 from rest_framework import permissions
 
-from board.api.views import api_make_movement, make_movement
+from board.api.views import (api_create_boards, api_hint, api_leaderboard,
+                             api_make_movement, api_make_movements, api_rank,
+                             make_movement)
 
 schema_view = get_schema_view(
     openapi.Info(
@@ -30,4 +32,9 @@ urlpatterns = [
     path("redoc/", schema_view.with_ui("redoc", cache_timeout=0), name="schema-redoc"),
     path("move/", make_movement, name="make_movement"),
     path("api/move", api_make_movement, name="api_make_movement"),
+    path("api/moves", api_make_movements, name="api_make_movements"),
+    path("api/hint", api_hint, name="api_hint"),
+    path("api/boards", api_create_boards, name="api_create_boards"),
+    path("api/leaderboard", api_leaderboard, name="api_leaderboard"),
+    path("api/rank", api_rank, name="api_rank"),
 ]
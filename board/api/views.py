@@ -1,9 +1,7 @@
 from django.contrib import messages
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
-from django.db import transaction
 from django.http import HttpResponseRedirect
-from django.shortcuts import redirect, reverse
-from django.urls import reverse_lazy
+from django.shortcuts import reverse
 from django.utils.translation import gettext_lazy as _
 from drf_yasg.utils import swagger_auto_schema
 from pydantic import ValidationError as PyValidationError
@@ -12,10 +10,22 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from board import constants, engine, services, solved, stats
+from board.api.parameters.create_boards import (create_boards_body,
+                                                create_boards_response_dict)
+from board.api.parameters.hint import board_id_parameter, hint_response_dict
+from board.api.parameters.leaderboard import (leaderboard_parameters,
+                                              leaderboard_response_dict,
+                                              rank_response_dict,
+                                              user_id_parameter)
 from board.api.parameters.make_a_play import (make_a_play_body,
                                               make_a_play_response_dict)
-from board.api.schemas import NewMoveStructure
-from board.api.serializers import NewMoveStructureSerializer
+from board.api.parameters.make_many_plays import (
+    make_many_plays_body, make_many_plays_response_dict)
+from board.api.schemas import (LeaderboardStructure, NewBoardsStructure,
+                               NewMovesStructure, NewMoveStructure)
+from board.api.serializers import (NewBoardsStructureSerializer,
+                                   NewMoveStructureSerializer)
 from board.models import Board
 from utils.messages import MESSAGES
 
@@ -23,50 +33,16 @@ from utils.messages import MESSAGES
 class BoardGameplay(viewsets.GenericViewSet, APIView):
     permission_classes = [permissions.AllowAny]
     serializer_class = NewMoveStructureSerializer
-    template_to_use = "board/board_list.html"
 
     @action(detail=False, methods=["post"])
     def make_a_play(self, request):
         errors = None
-        message = None
         board_id = None
         try:
-            NewMoveStructure(**request.data)
-            position = request.data.get("position")
-            column, row = position.split("_")
-            board_id = int(request.data.get("board_id"))
-            assert bool(row) and bool(column), MESSAGES["SYS002"].value
-        except (
-            AssertionError,
-            ValueError,
-            AttributeError,
-            ValidationError,
-            PyValidationError,
-            TypeError,
-        ) as ex:
-            errors = ex
-            messages.error(request, [str(error) for error in ex.args])
-        try:
-            with transaction.atomic():
-                board = Board.objects.get(id=board_id)
-                user = request.user
-                if board.player_circle == user:
-                    if isinstance(board.positions_circle[column], list):
-                        board.positions_circle[column].append(int(row))
-                    else:
-                        board.positions_circle[column] = [int(row)]
-                    positions_circle = board.positions_circle[column]
-                    positions_circle.sort()
-                else:
-                    if isinstance(board.positions_cross[column], list):
-                        board.positions_cross[column].append(int(row))
-                    else:
-                        board.positions_cross[column] = [int(row)]
-                    positions_cross = board.positions_cross[column]
-                    positions_cross.sort()
-                board.status = check_game_status(board)
-                board.save()
-        except ObjectDoesNotExist as ex:
+            move = NewMoveStructure(**request.data)
+            board_id = move.board_id
+            result = services.play_move(move.board_id, move.position, request.user)
+        except (ValidationError, PyValidationError, TypeError) as ex:
             board_id = None
             errors = ex
             messages.error(request, [str(error) for error in ex.args])
@@ -74,13 +50,22 @@ class BoardGameplay(viewsets.GenericViewSet, APIView):
             errors = ex
             messages.error(request, [str(error) for error in ex.args])
         if not errors:
-            if board.status == 1:
+            if result.status == 1 and result.computer_move is not None:
+                messages.success(
+                    request,
+                    _("The computer played {}, your turn.").format(
+                        engine.cell_name(result.computer_move)
+                    ),
+                )
+            elif result.status == 1:
                 messages.success(
                     request, _("Great! Now wait for your opponent to play.")
                 )
-            elif board.status in [2, 3]:
+            elif result.status in [2, 3] and result.computer_move is not None:
+                messages.info(request, _("The computer won!"))
+            elif result.status in [2, 3]:
                 messages.success(request, _("Your victory!"))
-            elif board.status == 4:
+            elif result.status == 4:
                 messages.info(request, _("Draw!"))
         if board_id:
             return HttpResponseRedirect(
@@ -100,18 +85,39 @@ class BoardGameplay(viewsets.GenericViewSet, APIView):
         """Just like the previous one, but intended to return Response objects for POSTMAN interactions and API
         documentation."""
         try:
-            position = request.data.get("position")
-            column, row = position.split("_")
-            board_id = int(request.data.get("board_id"))
-            assert bool(row) and bool(column), MESSAGES["SYS002"].value
-        except (
-            AssertionError,
-            ValueError,
-            ValidationError,
-            AttributeError,
-            PyValidationError,
-            TypeError,
-        ) as ex:
+            move = NewMoveStructure(**request.data)
+        except (ValidationError, PyValidationError, TypeError) as ex:
+            return Response(
+                {
+                    "type": "PRECONDITION_FAILED",
+                    "errors": [str(error) for error in ex.args],
+                },
+                status=status.HTTP_412_PRECONDITION_FAILED,
+            )
+        try:
+            result = services.play_move(move.board_id, move.position, request.user)
+        except Exception as ex:
+            return Response(
+                {"type": "BAD_REQUEST", "errors": [str(error) for error in ex.args]},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return Response(
+            {"success": True, "message": get_result_message(result)},
+            status=status.HTTP_200_OK,
+        )
+
+    @swagger_auto_schema(
+        method="post",
+        operation_description=_("Make moves on many boards at once."),
+        request_body=make_many_plays_body,
+        responses=make_many_plays_response_dict,
+    )
+    @action(detail=False, methods=["post"])
+    def api_make_many_plays(self, request):
+        """Every move is played on its own, the results list how each of them went in the order they were sent."""
+        try:
+            payload = NewMovesStructure(**request.data)
+        except (PyValidationError, TypeError) as ex:
             return Response(
                 {
                     "type": "PRECONDITION_FAILED",
@@ -119,111 +125,214 @@ class BoardGameplay(viewsets.GenericViewSet, APIView):
                 },
                 status=status.HTTP_412_PRECONDITION_FAILED,
             )
+        results, moves = [None] * len(payload.moves), []
+        for index, item in enumerate(payload.moves):
+            try:
+                move = NewMoveStructure(**item)
+            except (ValidationError, PyValidationError, TypeError) as ex:
+                board_id = item.get("board_id") if isinstance(item, dict) else None
+                results[index] = {
+                    "board_id": board_id,
+                    "success": False,
+                    "errors": get_error_messages(ex),
+                }
+            else:
+                moves.append((index, move))
+
+        played = services.play_moves(
+            [(move.board_id, move.position) for index, move in moves], request.user
+        )
+        for (index, move), result in zip(moves, played):
+            if isinstance(result, ValidationError):
+                results[index] = {
+                    "board_id": move.board_id,
+                    "success": False,
+                    "errors": result.messages,
+                }
+            else:
+                results[index] = {
+                    "board_id": move.board_id,
+                    "success": True,
+                    "message": get_result_message(result),
+                }
+        return Response({"results": results}, status=status.HTTP_200_OK)
+
+    @swagger_auto_schema(
+        method="get",
+        operation_description=_("Get the best move for the side to play."),
+        manual_parameters=[board_id_parameter],
+        responses=hint_response_dict,
+    )
+    @action(detail=False, methods=["get"])
+    def api_hint(self, request):
+        """Answers straight from the solved positions table."""
+        try:
+            board_id = int(request.query_params.get("board_id"))
+            if not 0 < board_id <= constants.MAX_ID:
+                raise ValueError(board_id)
+        except (ValueError, TypeError):
+            return Response(
+                {"type": "PRECONDITION_FAILED", "errors": [MESSAGES["SYS006"].value]},
+                status=status.HTTP_412_PRECONDITION_FAILED,
+            )
         try:
-            with transaction.atomic():
-                NewMoveStructure(**request.data)
-                board = Board.objects.get(id=board_id)
-                user = request.user
-                if board.player_circle == user:
-                    if isinstance(board.positions_circle[column], list):
-                        board.positions_circle[column].append(int(row))
-                    else:
-                        board.positions_circle[column] = [int(row)]
-                    positions_circle = board.positions_circle[column]
-                    positions_circle.sort()
-                else:
-                    if isinstance(board.positions_cross[column], list):
-                        board.positions_cross[column].append(int(row))
-                    else:
-                        board.positions_cross[column] = [int(row)]
-                    positions_cross = board.positions_cross[column]
-                    positions_cross.sort()
-                board.status = check_game_status(board)
-                board.save()
+            board = Board.objects.get(id=board_id)
         except ObjectDoesNotExist as ex:
             return Response(
                 {"type": "BAD_REQUEST", "errors": [str(error) for error in ex.args]},
                 status=status.HTTP_400_BAD_REQUEST,
             )
-        except Exception as ex:
+        entry = solved.lookup(board.game_state)
+        if entry is None or entry.status != constants.UNFINISHED:
+            error = MESSAGES["SYS008" if entry is None else "SYS007"].value
+            return Response(
+                {"type": "BAD_REQUEST", "errors": [error]},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return Response(
+            {"position": engine.cell_name(entry.best_move), "value": entry.value},
+            status=status.HTTP_200_OK,
+        )
+
+
+class BoardCreation(viewsets.GenericViewSet, APIView):
+    permission_classes = [permissions.IsAdminUser]
+    serializer_class = NewBoardsStructureSerializer
+
+    @swagger_auto_schema(
+        method="post",
+        operation_description=_("Create many games at once, e.g. for a tournament."),
+        request_body=create_boards_body,
+        responses=create_boards_response_dict,
+    )
+    @action(detail=False, methods=["post"])
+    def api_create_boards(self, request):
+        """Either every pairing gets its game or none does."""
+        try:
+            payload = NewBoardsStructure(**request.data)
+        except (PyValidationError, TypeError) as ex:
+            return Response(
+                {
+                    "type": "PRECONDITION_FAILED",
+                    "errors": [str(error) for error in ex.args],
+                },
+                status=status.HTTP_412_PRECONDITION_FAILED,
+            )
+        try:
+            ids = services.create_boards(
+                (pairing.player_cross, pairing.player_circle)
+                for pairing in payload.boards
+            )
+        except ValidationError as ex:
             return Response(
                 {"type": "BAD_REQUEST", "errors": [str(error) for error in ex.args]},
                 status=status.HTTP_400_BAD_REQUEST,
             )
-        if board.status == 1:
-            message = _("Great! Now wait for your opponent to play.")
-        elif board.status in [2, 3]:
-            message = _("Your Victory!")
-        else:
-            message = _("Draw.")
+        return Response({"success": True, "ids": ids}, status=status.HTTP_201_CREATED)
+
+
+class PlayerRatings(viewsets.GenericViewSet, APIView):
+    permission_classes = [permissions.AllowAny]
+
+    @swagger_auto_schema(
+        method="get",
+        operation_description=_("Get a page of the players' leaderboard."),
+        manual_parameters=leaderboard_parameters,
+        responses=leaderboard_response_dict,
+    )
+    @action(detail=False, methods=["get"])
+    def api_leaderboard(self, request):
+        """Pages are keyed by the last player of the previous one, so any page costs the same to read."""
+        try:
+            query = LeaderboardStructure(**request.query_params.dict())
+        except PyValidationError as ex:
+            # 'after_user' can only be wrong by not being an ID, it's otherwise taken from the previous page.
+            errors = [
+                MESSAGES["SYS006"].value
+                if error["loc"] == ("after_user",)
+                else error["msg"]
+                for error in ex.errors()
+            ]
+            return Response(
+                {"type": "PRECONDITION_FAILED", "errors": errors},
+                status=status.HTTP_412_PRECONDITION_FAILED,
+            )
+        after = None
+        if query.after_user is not None:
+            after = (query.after_rating, query.after_user)
+        players = stats.get_leaderboard(after=after, limit=query.limit)
+        results = [
+            {
+                "user_id": player["user_id"],
+                "username": player["user__username"],
+                "rating": player["rating"],
+            }
+            for player in players
+        ]
+        next_page = None
+        if len(results) == query.limit:
+            next_page = {
+                "after_rating": results[-1]["rating"],
+                "after_user": results[-1]["user_id"],
+            }
         return Response(
-            {"success": True, "message": message},
+            {"results": results, "next": next_page}, status=status.HTTP_200_OK
+        )
+
+    @swagger_auto_schema(
+        method="get",
+        operation_description=_("Get the leaderboard position of a player."),
+        manual_parameters=[user_id_parameter],
+        responses=rank_response_dict,
+    )
+    @action(detail=False, methods=["get"])
+    def api_rank(self, request):
+        try:
+            user_id = int(request.query_params.get("user_id", request.user.pk))
+            if not 0 < user_id <= constants.MAX_ID:
+                raise ValueError(user_id)
+        except (ValueError, TypeError):
+            return Response(
+                {"type": "PRECONDITION_FAILED", "errors": [MESSAGES["SYS006"].value]},
+                status=status.HTTP_412_PRECONDITION_FAILED,
+            )
+        rank = stats.get_rank(user_id)
+        if rank is None:
+            return Response(
+                {"type": "BAD_REQUEST", "errors": [MESSAGES["SYS014"].value]},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return Response(
+            {"user_id": user_id, "rank": rank[0], "rating": rank[1]},
             status=status.HTTP_200_OK,
         )
 
 
 make_movement = BoardGameplay.as_view({"post": "make_a_play"})
 api_make_movement = BoardGameplay.as_view({"post": "api_make_a_play"})
+api_make_movements = BoardGameplay.as_view({"post": "api_make_many_plays"})
+api_hint = BoardGameplay.as_view({"get": "api_hint"})
+api_create_boards = BoardCreation.as_view({"post": "api_create_boards"})
+api_leaderboard = PlayerRatings.as_view({"get": "api_leaderboard"})
+api_rank = PlayerRatings.as_view({"get": "api_rank"})
 
 
-def check_game_status(board):
-    total_moves = 0
-    status = board.status
-
-    # Check for diagonal victory
-    if (
-        1 in board.positions_circle["A"]
-        and 2 in board.positions_circle["B"]
-        and 3 in board.positions_circle["C"]
-    ) or (
-        3 in board.positions_circle["A"]
-        and 2 in board.positions_circle["B"]
-        and 1 in board.positions_circle["C"]
-    ):
-        status = 3
-    elif (
-        1 in board.positions_cross["A"]
-        and 2 in board.positions_cross["B"]
-        and 3 in board.positions_cross["C"]
-    ) or (
-        3 in board.positions_cross["A"]
-        and 2 in board.positions_cross["B"]
-        and 1 in board.positions_cross["C"]
-    ):
-        status = 2
-
-    if status != board.status:
-        return status
-
-    # Check for column victories
-
-    for key, values in board.positions_circle.items():
-        total_moves += len(values)
-        if values == [1, 2, 3]:
-            status = 3
-
-    for key, values in board.positions_cross.items():
-        total_moves += len(values)
-        if values == [1, 2, 3]:
-            status = 2
-
-    if status != board.status:
-        return status
-
-    # Check for row victories
-    circle_column = set(board.positions_circle["A"]).intersection(
-        set(board.positions_circle["B"]), set(board.positions_circle["C"])
-    )
-    cross_column = set(board.positions_cross["A"]).intersection(
-        set(board.positions_cross["B"]), set(board.positions_cross["C"])
-    )
+def get_error_messages(ex):
+    """Messages of ``ex``, without the code and params Django's 'ValidationError' keeps in its args."""
+    if isinstance(ex, ValidationError):
+        return ex.messages
+    return [str(error) for error in ex.args]
 
-    if circle_column:
-        status = 3
-    elif cross_column:
-        status = 2
 
-    if status == board.status:
-        if total_moves == 9:
-            status = 4
-    return status
+def get_result_message(result):
+    if result.status == 1 and result.computer_move is not None:
+        return _("The computer played {}, your turn.").format(
+            engine.cell_name(result.computer_move)
+        )
+    elif result.status == 1:
+        return _("Great! Now wait for your opponent to play.")
+    elif result.status in [2, 3] and result.computer_move is not None:
+        return _("The computer won!")
+    elif result.status in [2, 3]:
+        return _("Your Victory!")
+    return _("Draw.")
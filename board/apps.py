@@ -6,4 +6,6 @@ class BoardConfig(AppConfig):
     name = "board"
 
     def ready(self):
-        from board import signals
+        from board import solved
+
+        solved.load_table()
@@ -0,0 +1,42 @@
+"""
+Computer player. It's a regular user, named after the 'BOARD_BOT_USERNAME' setting, whose moves are searched with
+'board.ai' right after its opponent plays. It's told apart from real accounts by having no usable password, which
+every signed up account has, and its username is reserved at signup by 'board.adapters.AccountAdapter'.
+"""
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import UNUSABLE_PASSWORD_PREFIX, make_password
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models import Q
+
+from board import ai
+
+User = get_user_model()
+
+
+def get_bot_username():
+    return getattr(settings, "BOARD_BOT_USERNAME", "computer")
+
+
+def get_bot_filter():
+    """Matches the computer player, and not a real account that took its username."""
+    return Q(username=get_bot_username(), password__startswith=UNUSABLE_PASSWORD_PREFIX)
+
+
+def get_bot_user():
+    user, created = User.objects.get_or_create(
+        username=get_bot_username(), defaults={"password": make_password(None)}
+    )
+    if user.has_usable_password():
+        raise ImproperlyConfigured(
+            f"'{user.username}' belongs to a real account, set 'BOARD_BOT_USERNAME' to a free username."
+        )
+    return user
+
+
+def is_bot(user):
+    return user.username == get_bot_username() and not user.has_usable_password()
+
+
+def choose_move(state):
+    return ai.best_move(state)
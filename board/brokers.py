@@ -0,0 +1,136 @@
+"""
+Backends carrying board events between processes.
+
+Every process keeps its own 'board.events.Broker' with the subscriptions of the streams it serves. Backends move
+published ``(channel, event)`` messages to the brokers of every process, handing each message over through the
+``deliver`` callable they are built with. The backend is picked with the 'BOARD_EVENTS_BACKEND' setting and built
+with the keyword arguments of 'BOARD_EVENTS_OPTIONS'.
+"""
+import json
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from django.core.exceptions import ImproperlyConfigured
+
+
+class BaseBackend:
+    def __init__(self, deliver):
+        self.deliver = deliver
+
+    def publish(self, messages):
+        """Sends every ``(channel, event)`` pair of ``messages`` at once."""
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class MemoryBackend(BaseBackend):
+    """Events never leave the process publishing them, enough for a single worker and for tests."""
+
+    def publish(self, messages):
+        for channel, event in messages:
+            self.deliver(channel, event)
+
+
+class SQLiteBackend(BaseBackend):
+    """
+    Stand-in for processes of a single host. Publishing appends rows to a shared SQLite file and every process polls
+    it for the rows appended since its last look, from a daemon thread. Rows older than ``retention`` seconds are
+    removed by publishers.
+    """
+
+    def __init__(self, deliver, path=None, poll_interval=0.2, retention=60):
+        super().__init__(deliver)
+        self.path = str(path or Path(tempfile.gettempdir()) / "board_events.sqlite3")
+        self.poll_interval = poll_interval
+        self.retention = retention
+        connection = self.connect()
+        with connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS events ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, created REAL, channel TEXT, payload TEXT)"
+            )
+            (self.last_id,) = connection.execute(
+                "SELECT COALESCE(MAX(id), 0) FROM events"
+            ).fetchone()
+        connection.close()
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.listen, daemon=True)
+        self.thread.start()
+
+    def connect(self):
+        return sqlite3.connect(self.path, timeout=5)
+
+    def publish(self, messages):
+        now = time.time()
+        connection = self.connect()
+        with connection:
+            connection.executemany(
+                "INSERT INTO events (created, channel, payload) VALUES (?, ?, ?)",
+                [(now, channel, json.dumps(event)) for channel, event in messages],
+            )
+            connection.execute(
+                "DELETE FROM events WHERE created < ?", (now - self.retention,)
+            )
+        connection.close()
+
+    def poll(self, connection):
+        rows = connection.execute(
+            "SELECT id, channel, payload FROM events WHERE id > ? ORDER BY id",
+            (self.last_id,),
+        ).fetchall()
+        for self.last_id, channel, payload in rows:
+            self.deliver(channel, json.loads(payload))
+
+    def listen(self):
+        connection = self.connect()
+        try:
+            while not self.stopped.wait(self.poll_interval):
+                try:
+                    self.poll(connection)
+                except sqlite3.OperationalError:
+                    # Locked by a publisher, the rows will still be there on the next poll.
+                    continue
+        finally:
+            connection.close()
+
+    def close(self):
+        self.stopped.set()
+        self.thread.join()
+
+
+class RedisBackend(BaseBackend):
+    """Redis pub/sub, or any server speaking its protocol. Requires the optional 'redis' package."""
+
+    def __init__(self, deliver, url="redis://localhost:6379/0", prefix="board-events:"):
+        super().__init__(deliver)
+        try:
+            import redis
+        except ImportError:
+            raise ImproperlyConfigured("RedisBackend requires the 'redis' package.")
+        self.prefix = prefix
+        self.client = redis.Redis.from_url(url)
+        self.pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+        self.pubsub.psubscribe(**{f"{prefix}*": self.on_message})
+        self.thread = self.pubsub.run_in_thread(sleep_time=1, daemon=True)
+
+    def publish(self, messages):
+        pipeline = self.client.pipeline(transaction=False)
+        for channel, event in messages:
+            pipeline.publish(f"{self.prefix}{channel}", json.dumps(event))
+        pipeline.execute()
+
+    def on_message(self, message):
+        channel = message["channel"]
+        if isinstance(channel, bytes):
+            channel = channel.decode()
+        self.deliver(channel[len(self.prefix) :], json.loads(message["data"]))
+
+    def close(self):
+        self.thread.stop()
+        self.pubsub.close()
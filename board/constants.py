@@ -1,12 +1,36 @@
 from django.utils.translation import gettext_lazy as _
 
+UNFINISHED = 1
+CROSS_VICTORY = 2
+CIRCLE_VICTORY = 3
+DRAW = 4
+
 STATUS = (
-    (1, _("Unfinished")),
-    (2, _("Cross Victory")),
-    (3, _("Circle Victory")),
-    (4, _("Draw")),
+    (UNFINISHED, _("Unfinished")),
+    (CROSS_VICTORY, _("Cross Victory")),
+    (CIRCLE_VICTORY, _("Circle Victory")),
+    (DRAW, _("Draw")),
 )
 
+# Largest id a 64 bits primary key holds, database drivers raise for bigger ones instead of finding nothing.
+MAX_ID = 2**63 - 1
+
+COLUMNS = ("A", "B", "C")
+ROWS = (1, 2, 3)
+
 
 def get_default_positions():
-    return {"A": [], "B": [], "C": []}
+    return {column: [] for column in COLUMNS}
+
+
+ROUND_ROBIN = 1
+SWISS = 2
+
+TOURNAMENT_FORMATS = (
+    (ROUND_ROBIN, _("Round Robin")),
+    (SWISS, _("Swiss")),
+)
+
+# Points are counted in halves, so draws don't need a decimal field.
+VICTORY_POINTS = 2
+DRAW_POINTS = 1
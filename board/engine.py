@@ -0,0 +1,163 @@
+"""
+Bitboard representation of a tic-tac-toe game.
+
+Each side is stored as a bit mask where bit ``row * columns + column`` (both zero based) is set when that side has
+played the cell. The classic game uses a 3x3 grid, columns going from 'A' to 'C' and rows from 1 to 3, but the
+geometry is general so m x n boards with k-in-a-row can be evaluated the same way.
+"""
+from typing import NamedTuple
+
+from board import constants
+
+DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+
+class Geometry:
+    """Precomputed winning lines of a ``columns`` x ``rows`` board where ``k`` aligned cells win."""
+
+    def __init__(self, columns=3, rows=3, k=3):
+        if k > max(columns, rows):
+            raise ValueError("k can't be greater than the board's largest side.")
+        self.columns = columns
+        self.rows = rows
+        self.k = k
+        self.size = columns * rows
+        self.full = (1 << self.size) - 1
+        self.lines = tuple(self._build_lines())
+        self.lines_through = tuple(
+            tuple(line for line in self.lines if line >> cell & 1)
+            for cell in range(self.size)
+        )
+
+    def _build_lines(self):
+        for row in range(self.rows):
+            for column in range(self.columns):
+                for row_step, column_step in DIRECTIONS:
+                    last_row = row + row_step * (self.k - 1)
+                    last_column = column + column_step * (self.k - 1)
+                    if not (
+                        0 <= last_row < self.rows and 0 <= last_column < self.columns
+                    ):
+                        continue
+                    start = row * self.columns + column
+                    step = row_step * self.columns + column_step
+                    yield sum(1 << start + step * i for i in range(self.k))
+
+
+CLASSIC = Geometry()
+FULL_BOARD = CLASSIC.full
+WINNING_LINES = CLASSIC.lines
+
+
+class GameState(NamedTuple):
+    cross: int = 0
+    circle: int = 0
+
+    @property
+    def occupied(self):
+        return self.cross | self.circle
+
+    @property
+    def circle_to_move(self):
+        return circle_to_move(self.cross, self.circle)
+
+
+def pack(state):
+    """Both sides' masks in a single integer, circle's bits following cross' ones."""
+    return state.cross | state.circle << CLASSIC.size
+
+
+def unpack(cells):
+    return GameState(cross=cells & FULL_BOARD, circle=cells >> CLASSIC.size)
+
+
+def cell_index(column, row):
+    """Returns the bit index of a cell, raising ValueError for anything outside the board."""
+    size = len(constants.COLUMNS)
+    return constants.ROWS.index(int(row)) * size + constants.COLUMNS.index(column)
+
+
+def cell_name(index):
+    row, column = divmod(index, len(constants.COLUMNS))
+    return f"{constants.COLUMNS[column]}_{constants.ROWS[row]}"
+
+
+def positions_to_mask(positions):
+    mask = 0
+    for column, rows in positions.items():
+        for row in rows or []:
+            mask |= 1 << cell_index(column, row)
+    return mask
+
+
+def mask_to_positions(mask):
+    positions = constants.get_default_positions()
+    for index in iter_cells(mask):
+        row, column = divmod(index, len(constants.COLUMNS))
+        positions[constants.COLUMNS[column]].append(constants.ROWS[row])
+    return positions
+
+
+def to_string(state, geometry=CLASSIC):
+    """One character per cell in bit order, 'X' for cross, 'O' for circle and '-' for empty cells."""
+    return "".join(
+        "X" if state.cross >> index & 1 else "O" if state.circle >> index & 1 else "-"
+        for index in range(geometry.size)
+    )
+
+
+def iter_cells(mask):
+    while mask:
+        lowest = mask & -mask
+        yield lowest.bit_length() - 1
+        mask ^= lowest
+
+
+def has_won(mask, geometry=CLASSIC):
+    for line in geometry.lines:
+        if mask & line == line:
+            return True
+    return False
+
+
+def game_status(cross, circle, geometry=CLASSIC):
+    """Status of the game, as in 'board.constants.STATUS', for the given cross and circle masks."""
+    if has_won(circle, geometry):
+        return constants.CIRCLE_VICTORY
+    if has_won(cross, geometry):
+        return constants.CROSS_VICTORY
+    if cross | circle == geometry.full:
+        return constants.DRAW
+    return constants.UNFINISHED
+
+
+def circle_to_move(cross, circle):
+    """Circles always open the game, so it's their turn whenever both sides have played the same amount of moves."""
+    return circle.bit_count() == cross.bit_count()
+
+
+def apply_move(state, cell, circle=None, geometry=CLASSIC):
+    """
+    Plays ``cell`` on an unfinished ``state`` and returns the new state along with the game status after the move.
+    Only the lines going through ``cell`` are checked, since a previously unfinished game can't be won anywhere else.
+    The side playing is taken from the move parity unless ``circle`` says otherwise.
+    """
+    if not 0 <= cell < geometry.size:
+        raise ValueError(f"Cell {cell} is outside the board.")
+    bit = 1 << cell
+    if state.occupied & bit:
+        raise ValueError(f"Cell {cell} is already taken.")
+    if circle is None:
+        circle = state.circle_to_move
+    if circle:
+        state = GameState(state.cross, state.circle | bit)
+        mask, victory = state.circle, constants.CIRCLE_VICTORY
+    else:
+        state = GameState(state.cross | bit, state.circle)
+        mask, victory = state.cross, constants.CROSS_VICTORY
+    for line in geometry.lines_through[cell]:
+        if mask & line == line:
+            return state, victory
+    if state.occupied == geometry.full:
+        return state, constants.DRAW
+    return state, constants.UNFINISHED
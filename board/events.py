@@ -0,0 +1,153 @@
+"""
+Publish/subscribe of board changes, feeding the server-sent events streams of 'board.views'.
+
+Channels are plain strings, 'board:<id>' for everybody watching a game and 'user:<id>' for the player whose turn it
+is. Subscribers are asyncio queues living in the ASGI event loop of the process serving their stream, and events
+reach the processes with subscribers through the backend configured with 'BOARD_EVENTS_BACKEND', see
+'board.brokers'. Events are handed over to the loop with 'call_soon_threadsafe', since backends deliver them from
+the request threads committing moves or from their own listening threads.
+"""
+import asyncio
+import threading
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+BOARD, TURN = "board", "turn"
+
+
+def get_queue_size():
+    return getattr(settings, "BOARD_EVENTS_QUEUE_SIZE", 16)
+
+
+def get_coalesce_interval():
+    return getattr(settings, "BOARD_EVENTS_COALESCE_INTERVAL", 0.1)
+
+
+def board_channel(board_id):
+    return f"{BOARD}:{board_id}"
+
+
+def user_channel(user_id):
+    return f"user:{user_id}"
+
+
+def _deliver(queue, channel, event):
+    """Slow subscribers lose their oldest events, every event carries the whole board so the latest is enough."""
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait((channel, event))
+
+
+class Broker:
+    def __init__(self):
+        self._subscribers = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def subscribe(self, *channels):
+        """
+        Yields a queue getting a ``(channel, event)`` pair for every event published on any of ``channels``. It has
+        to be used within the event loop the queue is read from.
+        """
+        # Processes only serving streams still need the backend listening for events.
+        get_backend()
+        subscriber = (asyncio.get_running_loop(), asyncio.Queue(get_queue_size()))
+        with self._lock:
+            for channel in channels:
+                self._subscribers.setdefault(channel, set()).add(subscriber)
+        try:
+            yield subscriber[1]
+        finally:
+            with self._lock:
+                for channel in channels:
+                    subscribers = self._subscribers[channel]
+                    subscribers.discard(subscriber)
+                    if not subscribers:
+                        del self._subscribers[channel]
+
+    def publish(self, channel, event):
+        """Hands ``event`` over to the subscribers of ``channel``, returning how many there were."""
+        with self._lock:
+            subscribers = tuple(self._subscribers.get(channel, ()))
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(_deliver, queue, channel, event)
+            except RuntimeError:
+                # The loop was closed, its subscriptions go away with it.
+                pass
+        return len(subscribers)
+
+
+class Publisher:
+    """
+    Publishes board events in batches. Events added within 'BOARD_EVENTS_COALESCE_INTERVAL' seconds of each other are
+    sent together, and only the latest version of every board is, so a burst of moves on a board sends a single
+    notification. A zero interval publishes right away.
+    """
+
+    def __init__(self):
+        self._pending = {}
+        self._timer = None
+        self._lock = threading.Lock()
+
+    def add(self, events):
+        interval = get_coalesce_interval()
+        with self._lock:
+            for event in events:
+                pending = self._pending.get(event["board_id"])
+                if pending is None or event["version"] >= pending["version"]:
+                    self._pending[event["board_id"]] = event
+            if interval > 0 and self._timer is None:
+                self._timer = threading.Timer(interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        if interval <= 0:
+            self.flush()
+
+    def flush(self):
+        with self._lock:
+            pending, self._pending, self._timer = self._pending, {}, None
+        messages = []
+        for event in pending.values():
+            messages.append((board_channel(event["board_id"]), event))
+            if event["next_player_id"] is not None:
+                messages.append((user_channel(event["next_player_id"]), event))
+        if messages:
+            get_backend().publish(messages)
+
+
+broker = Broker()
+publisher = Publisher()
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_backend():
+    """The backend of this process, built on first use."""
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            backend_class = import_string(
+                getattr(settings, "BOARD_EVENTS_BACKEND", "board.brokers.MemoryBackend")
+            )
+            _backend = backend_class(
+                broker.publish, **getattr(settings, "BOARD_EVENTS_OPTIONS", {})
+            )
+        return _backend
+
+
+def board_event(board):
+    return {
+        "board_id": board.pk,
+        "cells": board.cells,
+        "status": board.status,
+        "version": board.version,
+        "next_player_id": board.next_player_id,
+    }
+
+
+def publish_boards(events):
+    """Publishes every board event to the board's viewers, and to the player who has to move next."""
+    publisher.add(events)
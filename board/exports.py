@@ -0,0 +1,127 @@
+"""
+Exports of finished games for analysis, one line per game or per move, as NDJSON or CSV. Rows are read with
+'QuerySet.iterator' and written as they come, so memory stays the same however many games are exported. Both the
+'export_games' command and the 'board:export_games' view are built on 'iter_export'.
+"""
+import csv
+import datetime
+import json
+
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from board import constants, engine
+from board.models import Board, Move
+
+FORMATS = ("ndjson", "csv")
+LEVELS = ("boards", "moves")
+FINISHED = (constants.CROSS_VICTORY, constants.CIRCLE_VICTORY, constants.DRAW)
+
+BOARD_FIELDS = (
+    "id",
+    "created_at",
+    "updated_at",
+    "player_cross",
+    "player_circle",
+    "status",
+    "board",
+)
+MOVE_FIELDS = ("board_id", "ply", "player", "position", "created_at")
+
+
+def parse_moment(value):
+    """Aware datetime of an ISO 8601 date or datetime, dates meaning their midnight. Raises ValueError otherwise."""
+    moment = parse_datetime(value)
+    if moment is None:
+        date = parse_date(value)
+        if date is None:
+            raise ValueError(value)
+        moment = datetime.datetime.combine(date, datetime.time())
+    if timezone.is_naive(moment):
+        moment = timezone.make_aware(moment)
+    return moment
+
+
+def get_games(since=None, until=None, user_id=None, status=None):
+    """
+    Finished games created from ``since`` and before ``until``, played by ``user_id`` and ending with ``status`` when
+    given.
+    """
+    games = Board.objects.exclude(status=constants.UNFINISHED)
+    if since is not None:
+        games = games.filter(created_at__gte=since)
+    if until is not None:
+        games = games.filter(created_at__lt=until)
+    if user_id is not None:
+        games = games.filter(Q(player_cross=user_id) | Q(player_circle=user_id))
+    if status is not None:
+        games = games.filter(status=status)
+    return games
+
+
+def iter_boards(games, chunk_size):
+    rows = (
+        games.order_by("created_at", "pk")
+        .values_list(
+            "pk",
+            "created_at",
+            "updated_at",
+            "player_cross__username",
+            "player_circle__username",
+            "status",
+            "cells",
+        )
+        .iterator(chunk_size=chunk_size)
+    )
+    for pk, created_at, updated_at, player_cross, player_circle, status, cells in rows:
+        yield (
+            pk,
+            created_at.isoformat(),
+            updated_at.isoformat(),
+            player_cross,
+            player_circle,
+            status,
+            engine.to_string(engine.unpack(cells)),
+        )
+
+
+def iter_moves(games, chunk_size):
+    rows = (
+        Move.objects.filter(board__in=games.values("pk"))
+        .order_by("board_id", "ply")
+        .values_list("board", "ply", "player__username", "cell", "created_at")
+        .iterator(chunk_size=chunk_size)
+    )
+    for board_id, ply, player, cell, created_at in rows:
+        yield board_id, ply, player, engine.cell_name(cell), created_at.isoformat()
+
+
+class Echo:
+    """File-like object handing back what 'csv.writer' writes to it, instead of buffering it."""
+
+    def write(self, value):
+        return value
+
+
+def to_ndjson(fields, rows):
+    for row in rows:
+        yield json.dumps(dict(zip(fields, row))) + "\n"
+
+
+def to_csv(fields, rows):
+    writer = csv.writer(Echo())
+    yield writer.writerow(fields)
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def iter_export(games, level="boards", format="ndjson", chunk_size=2000):
+    """Lines of the export of ``games``, one per game or per move depending on ``level``."""
+    if level == "moves":
+        fields, rows = MOVE_FIELDS, iter_moves(games, chunk_size)
+    else:
+        fields, rows = BOARD_FIELDS, iter_boards(games, chunk_size)
+    if format == "csv":
+        return to_csv(fields, rows)
+    return to_ndjson(fields, rows)
@@ -1,6 +1,8 @@
 from django import forms
 from django.contrib.auth import get_user_model
+from django.utils.translation import gettext_lazy as _
 
+from board import bot
 from board.models import Board
 
 User = get_user_model()
@@ -8,12 +10,30 @@ User = get_user_model()
 
 class CreateBoardForm(forms.ModelForm):
     cross_or_circle = forms.ChoiceField(choices=((1, "Circle"), (2, "Cross")))
-    opponent = forms.ModelChoiceField(queryset=None, to_field_name="username")
+    opponent = forms.ModelChoiceField(
+        queryset=None, to_field_name="username", required=False
+    )
+    against_computer = forms.BooleanField(
+        label=_("Play against the computer"), required=False
+    )
 
     def __init__(self, user_id=None, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.fields["opponent"].queryset = User.objects.exclude(id=user_id)
+        self.fields["opponent"].queryset = User.objects.exclude(id=user_id).exclude(
+            bot.get_bot_filter()
+        )
+
+    def clean(self):
+        cleaned_data = super().clean()
+        if not cleaned_data.get("against_computer") and not cleaned_data.get(
+            "opponent"
+        ):
+            if "opponent" not in self.errors:
+                self.add_error(
+                    "opponent", self.fields["opponent"].error_messages["required"]
+                )
+        return cleaned_data
 
     class Meta:
         model = Board
-        fields = ["cross_or_circle", "opponent"]
+        fields = ["cross_or_circle", "opponent", "against_computer"]
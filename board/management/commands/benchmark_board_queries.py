@@ -0,0 +1,155 @@
+import random
+import time
+from types import SimpleNamespace
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.db.models import Q
+
+from board import constants
+from board.filters import BoardFilter
+from board.models import Board
+
+User = get_user_model()
+
+STATUSES = [
+    constants.UNFINISHED,
+    constants.CROSS_VICTORY,
+    constants.CIRCLE_VICTORY,
+    constants.DRAW,
+]
+
+
+class Rollback(Exception):
+    pass
+
+
+def filtered(using, user, **data):
+    """Games of ``user`` through 'board.filters.BoardFilter', the same as the board list filters them."""
+    queryset = Board.objects.using(using).filter(
+        Q(player_cross=user) | Q(player_circle=user)
+    )
+    return BoardFilter(data, queryset, request=SimpleNamespace(user=user)).qs
+
+
+def get_queries(using, user):
+    """The board access patterns of the app, named after where they come from."""
+    boards = Board.objects.using(using)
+    return {
+        "list as cross": boards.filter(player_cross=user)
+        .only("player_cross", "player_circle", "status", "created_at")
+        .order_by("-created_at", "-pk")[:9],
+        "player_type=circle": filtered(using, user, player_type="circle")[:8],
+        "won=won": filtered(using, user, won="won")[:8],
+        "won=draw": filtered(using, user, won="draw")[:8],
+        "finished games": boards.exclude(status=constants.UNFINISHED)
+        .order_by("created_at", "pk")
+        .values_list("player_cross", "player_circle", "status")[:2000],
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        "Seeds a large amount of games and prints the plan and timing of every board query, without and with the "
+        "indexes of 'Board.Meta'. Everything happens within a transaction that is rolled back, nothing is left "
+        "behind. Needs a database with transactional DDL, like SQLite or PostgreSQL. Dropping the indexes locks the "
+        "whole board table until the end, so it refuses to run on the default database unless forced to."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--database",
+            required=True,
+            help="Database to benchmark, preferably a copy of the one serving the app.",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Run on the default database, blocking every query on its boards meanwhile.",
+        )
+        parser.add_argument("--boards", type=int, default=100000, help="Games to seed.")
+        parser.add_argument(
+            "--users", type=int, default=200, help="Players the games are dealt to."
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=5,
+            help="Times every query is run, the fastest run is shown.",
+        )
+
+    def handle(self, *args, **options):
+        database = options["database"]
+        if database not in connections.databases:
+            raise CommandError(f"Unknown database: {database}.")
+        if database == DEFAULT_DB_ALIAS and not options["force"]:
+            raise CommandError(
+                "Benchmarking locks the board table of the database until it ends, use a copy of it or pass --force "
+                "to run it on the default database anyway."
+            )
+        try:
+            with transaction.atomic(using=database):
+                self.run(options)
+                raise Rollback
+        except Rollback:
+            pass
+
+    def run(self, options):
+        database = options["database"]
+        users = User.objects.using(database).bulk_create(
+            [User(username=f"benchmark-{index}") for index in range(options["users"])]
+        )
+        for start in range(0, options["boards"], 5000):
+            boards = []
+            for _ in range(start, min(start + 5000, options["boards"])):
+                player_cross, player_circle = random.sample(users, 2)
+                boards.append(
+                    Board(
+                        player_cross=player_cross,
+                        player_circle=player_circle,
+                        status=random.choice(STATUSES),
+                    )
+                )
+            Board.objects.using(database).bulk_create(boards)
+        self.stdout.write(
+            f"Seeded {options['boards']} games between {options['users']} players."
+        )
+
+        # Only used to write the statements, entering it would fail within a transaction on SQLite.
+        connection = connections[database]
+        editor = connection.schema_editor(collect_sql=True)
+        indexes = [
+            (index.remove_sql(Board, editor), index.create_sql(Board, editor))
+            for index in Board._meta.indexes
+        ]
+        queries = get_queries(database, users[0])
+        with connection.cursor() as cursor:
+            for remove_sql, create_sql in indexes:
+                cursor.execute(str(remove_sql))
+            before = self.measure(queries, options["repeat"])
+            for remove_sql, create_sql in indexes:
+                cursor.execute(str(create_sql))
+            cursor.execute("ANALYZE")
+            after = self.measure(queries, options["repeat"])
+
+        for name in queries:
+            self.stdout.write(self.style.MIGRATE_HEADING(f"\n{name}"))
+            for label, (elapsed, plan) in [
+                ("without indexes", before[name]),
+                ("with indexes", after[name]),
+            ]:
+                self.stdout.write(f"  {label}: {elapsed * 1000:.2f} ms")
+                for line in plan.splitlines():
+                    self.stdout.write(f"    {line}")
+
+    def measure(self, queries, repeat):
+        results = {}
+        for name, queryset in queries.items():
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                list(queryset.all())
+                timings.append(time.perf_counter() - start)
+            results[name] = (min(timings), queryset.explain())
+        return results
@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from board import solved
+
+
+class Command(BaseCommand):
+    help = "Solves every tic-tac-toe position and writes the table memory-mapped by 'board.solved'."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--path",
+            default=None,
+            help="Where to write the table, defaults to 'BOARD_SOLVED_TABLE_PATH'.",
+        )
+
+    def handle(self, *args, **options):
+        path = solved.write_table(options["path"])
+        self.stdout.write(self.style.SUCCESS(f"Solved table written to {path}."))
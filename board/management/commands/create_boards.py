@@ -0,0 +1,47 @@
+import csv
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+
+from board import services
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = "Creates a game for every 'cross_username,circle_username' line of a CSV file, all of them or none at all."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="CSV file with one pairing per line.")
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=None,
+            help="Rows inserted per query, defaults to 'BOARD_BULK_BATCH_SIZE'.",
+        )
+
+    def handle(self, *args, **options):
+        pairings = []
+        with open(options["path"], newline="") as file:
+            for line, row in enumerate(csv.reader(file), start=1):
+                if not any(value.strip() for value in row):
+                    continue
+                if len(row) != 2:
+                    raise CommandError(f"Line {line} should have two usernames.")
+                pairings.append((row[0].strip(), row[1].strip()))
+        usernames = {username for pairing in pairings for username in pairing}
+        ids = dict(
+            User.objects.filter(username__in=usernames).values_list("username", "pk")
+        )
+        missing = sorted(usernames - ids.keys())
+        if missing:
+            raise CommandError(f"Unknown users: {', '.join(missing)}.")
+        try:
+            board_ids = services.create_boards(
+                [(ids[cross], ids[circle]) for cross, circle in pairings],
+                batch_size=options["batch_size"],
+            )
+        except ValidationError as ex:
+            raise CommandError(ex.messages[0])
+        self.stdout.write(self.style.SUCCESS(f"Created {len(board_ids)} boards."))
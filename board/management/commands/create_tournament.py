@@ -0,0 +1,54 @@
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+
+from board import bot, constants, services
+
+User = get_user_model()
+
+FORMATS = {"round-robin": constants.ROUND_ROBIN, "swiss": constants.SWISS}
+
+
+class Command(BaseCommand):
+    help = "Creates a tournament and pairs its first round."
+
+    def add_arguments(self, parser):
+        parser.add_argument("name")
+        parser.add_argument("--format", choices=FORMATS, default="swiss")
+        parser.add_argument(
+            "--rounds",
+            type=int,
+            default=None,
+            help="Defaults to everybody meeting once in round robins, and log2 of the players in Swiss ones.",
+        )
+        parser.add_argument(
+            "usernames",
+            nargs="*",
+            help="Players in seeding order, every active user but the computer when none is given.",
+        )
+
+    def handle(self, *args, **options):
+        usernames = options["usernames"]
+        if usernames:
+            users = User.objects.in_bulk(usernames, field_name="username")
+            missing = [username for username in usernames if username not in users]
+            if missing:
+                raise CommandError(f"Unknown users: {', '.join(missing)}.")
+            users = [users[username] for username in usernames]
+        else:
+            users = (
+                User.objects.filter(is_active=True)
+                .exclude(bot.get_bot_filter())
+                .order_by("date_joined", "pk")
+            )
+        try:
+            tournament = services.create_tournament(
+                options["name"], FORMATS[options["format"]], users, options["rounds"]
+            )
+        except ValidationError as ex:
+            raise CommandError(ex.messages[0])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Created tournament {tournament.pk} with {tournament.rounds} rounds."
+            )
+        )
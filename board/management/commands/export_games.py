@@ -0,0 +1,75 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from board import exports
+
+User = get_user_model()
+
+
+def moment(value):
+    try:
+        return exports.parse_moment(value)
+    except ValueError:
+        raise CommandError(f"'{value}' isn't a valid date.")
+
+
+class Command(BaseCommand):
+    help = (
+        "Writes every finished game, or every move of them, as NDJSON or CSV. Games are streamed from the database "
+        "so any amount of them can be exported."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--format", choices=exports.FORMATS, default="ndjson")
+        parser.add_argument(
+            "--level",
+            choices=exports.LEVELS,
+            default="boards",
+            help="One line per game or per move.",
+        )
+        parser.add_argument(
+            "--since", type=moment, help="Games created from this date on."
+        )
+        parser.add_argument(
+            "--until", type=moment, help="Games created before this date."
+        )
+        parser.add_argument("--user", help="Username of a player of the games.")
+        parser.add_argument("--status", type=int, choices=exports.FINISHED)
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=2000,
+            help="Rows fetched per query.",
+        )
+        parser.add_argument(
+            "--output", help="File to write to, the standard output by default."
+        )
+
+    def handle(self, *args, **options):
+        user_id = None
+        if options["user"]:
+            user_id = (
+                User.objects.filter(username=options["user"])
+                .values_list("pk", flat=True)
+                .first()
+            )
+            if user_id is None:
+                raise CommandError(f"Unknown user: {options['user']}.")
+        games = exports.get_games(
+            since=options["since"],
+            until=options["until"],
+            user_id=user_id,
+            status=options["status"],
+        )
+        lines = exports.iter_export(
+            games,
+            level=options["level"],
+            format=options["format"],
+            chunk_size=options["chunk_size"],
+        )
+        if options["output"]:
+            with open(options["output"], "w", newline="") as file:
+                file.writelines(lines)
+        else:
+            for line in lines:
+                self.stdout.write(line, ending="")
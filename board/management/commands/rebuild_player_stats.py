@@ -0,0 +1,61 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from board import stats
+
+User = get_user_model()
+
+
+def rebuild_chunk(user_ids, chunk_size):
+    try:
+        return stats.rebuild_player_stats(user_ids, chunk_size=chunk_size)
+    finally:
+        # Worker threads open their own connections, which would be left open otherwise.
+        connections.close_all()
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuilds the stats of every player from their finished games, a chunk of players at a time with every "
+        "chunk in its own transaction."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=2000,
+            help="Players per chunk, also rows fetched per query.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Chunks rebuilt in parallel, each worker uses a database connection of its own.",
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options["chunk_size"]
+        user_ids = list(User.objects.order_by("pk").values_list("pk", flat=True))
+        chunks = [
+            user_ids[start : start + chunk_size]
+            for start in range(0, len(user_ids), chunk_size)
+        ]
+        if options["workers"] > 1:
+            with ThreadPoolExecutor(max_workers=options["workers"]) as executor:
+                written = sum(
+                    executor.map(rebuild_chunk, chunks, [chunk_size] * len(chunks))
+                )
+        else:
+            written = sum(
+                stats.rebuild_player_stats(chunk, chunk_size=chunk_size)
+                for chunk in chunks
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rebuilt the stats of {written} players in {len(chunks)} chunks."
+            )
+        )
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from board import stats
+
+
+class Command(BaseCommand):
+    help = (
+        "Rates every player from scratch by replaying their finished games in the order they were created. Run "
+        "'rebuild_player_stats' first, players without stats aren't rated."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=2000,
+            help="Games fetched per query, also ratings written per query.",
+        )
+
+    def handle(self, *args, **options):
+        rated = stats.recalculate_ratings(chunk_size=options["chunk_size"])
+        self.stdout.write(self.style.SUCCESS(f"Rated {rated} players."))
@@ -0,0 +1,47 @@
+# Generated by Django 4.2.6 on 2026-10-18 16:40
+
+from django.db import migrations
+
+
+def rebuild_nodes(apps, schema_editor):
+    """
+    The player to move is now derived from the number of moves played, circles always opening the game, so going
+    forwards the Nodes rows are simply dropped. Going backwards they are rebuilt from that same rule.
+    """
+    Board = apps.get_model("board", "Board")
+    Nodes = apps.get_model("board", "Nodes")
+    nodes = []
+    for board in Board.objects.only(
+        "player_cross_id",
+        "player_circle_id",
+        "positions_cross",
+        "positions_circle",
+        "status",
+    ).iterator(chunk_size=2000):
+        next_player_id = None
+        if board.status == 1:
+            circle_moves = sum(
+                len(rows or []) for rows in board.positions_circle.values()
+            )
+            cross_moves = sum(
+                len(rows or []) for rows in board.positions_cross.values()
+            )
+            if circle_moves == cross_moves:
+                next_player_id = board.player_circle_id
+            else:
+                next_player_id = board.player_cross_id
+        nodes.append(Nodes(board_id=board.pk, next_player_id=next_player_id))
+    Nodes.objects.bulk_create(nodes, batch_size=2000)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("board", "0004_alter_nodes_board"),
+    ]
+
+    operations = [
+        migrations.RunPython(migrations.RunPython.noop, rebuild_nodes),
+        migrations.DeleteModel(
+            name="Nodes",
+        ),
+    ]
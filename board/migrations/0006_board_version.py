@@ -0,0 +1,19 @@
+# Generated by Django 4.2.6 on 2026-10-18 16:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("board", "0005_fold_nodes_into_board_turns"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="board",
+            name="version",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Version"
+            ),
+        ),
+    ]
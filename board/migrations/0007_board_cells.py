@@ -0,0 +1,80 @@
+# Generated by Django 4.2.6 on 2026-10-18 16:42
+
+from django.db import migrations, models
+
+COLUMNS = ("A", "B", "C")
+ROWS = (1, 2, 3)
+
+
+def positions_to_mask(positions):
+    mask = 0
+    for column, rows in (positions or {}).items():
+        for row in rows or []:
+            mask |= 1 << ROWS.index(int(row)) * len(COLUMNS) + COLUMNS.index(column)
+    return mask
+
+
+def mask_to_positions(mask):
+    positions = {column: [] for column in COLUMNS}
+    for index in range(len(COLUMNS) * len(ROWS)):
+        if mask >> index & 1:
+            row, column = divmod(index, len(COLUMNS))
+            positions[COLUMNS[column]].append(ROWS[row])
+    return positions
+
+
+def encode_cells(apps, schema_editor):
+    Board = apps.get_model("board", "Board")
+    boards = []
+    for board in Board.objects.only("positions_cross", "positions_circle").iterator(
+        chunk_size=2000
+    ):
+        board.cells = positions_to_mask(board.positions_cross) | positions_to_mask(
+            board.positions_circle
+        ) << len(COLUMNS) * len(ROWS)
+        boards.append(board)
+        if len(boards) == 2000:
+            Board.objects.bulk_update(boards, ["cells"])
+            boards = []
+    Board.objects.bulk_update(boards, ["cells"])
+
+
+def decode_cells(apps, schema_editor):
+    Board = apps.get_model("board", "Board")
+    size = len(COLUMNS) * len(ROWS)
+    boards = []
+    for board in Board.objects.only("cells").iterator(chunk_size=2000):
+        board.positions_cross = mask_to_positions(board.cells & (1 << size) - 1)
+        board.positions_circle = mask_to_positions(board.cells >> size)
+        boards.append(board)
+        if len(boards) == 2000:
+            Board.objects.bulk_update(boards, ["positions_cross", "positions_circle"])
+            boards = []
+    Board.objects.bulk_update(boards, ["positions_cross", "positions_circle"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("board", "0006_board_version"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="board",
+            name="cells",
+            field=models.PositiveIntegerField(
+                default=0,
+                help_text="Cells played by cross in the lowest 9 bits, circle's right after.",
+                verbose_name="Cells",
+            ),
+        ),
+        migrations.RunPython(encode_cells, decode_cells),
+        migrations.RemoveField(
+            model_name="board",
+            name="positions_circle",
+        ),
+        migrations.RemoveField(
+            model_name="board",
+            name="positions_cross",
+        ),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 4.2.6 on 2026-10-18 16:43
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("board", "0007_board_cells"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Move",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("ply", models.PositiveSmallIntegerField(verbose_name="Ply")),
+                ("cell", models.PositiveSmallIntegerField(verbose_name="Cell")),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "board",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="moves",
+                        to="board.board",
+                        verbose_name="Board",
+                    ),
+                ),
+                (
+                    "player",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="moves",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="Player",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["board", "ply"],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="move",
+            constraint=models.UniqueConstraint(
+                fields=("board", "ply"), name="unique_board_ply"
+            ),
+        ),
+    ]
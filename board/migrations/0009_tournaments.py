@@ -0,0 +1,151 @@
+# Generated by Django 4.2.6 on 2026-10-18 16:48
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("board", "0008_move"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Tournament",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=100, verbose_name="Name")),
+                (
+                    "format",
+                    models.PositiveSmallIntegerField(
+                        choices=[(1, "Round Robin"), (2, "Swiss")],
+                        verbose_name="Format",
+                    ),
+                ),
+                ("rounds", models.PositiveSmallIntegerField(verbose_name="Rounds")),
+                (
+                    "current_round",
+                    models.PositiveSmallIntegerField(
+                        default=0, verbose_name="Current Round"
+                    ),
+                ),
+                (
+                    "finished",
+                    models.BooleanField(default=False, verbose_name="Finished"),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "ordering": ["-created_at"],
+            },
+        ),
+        migrations.CreateModel(
+            name="TournamentPlayer",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "seed",
+                    models.PositiveIntegerField(
+                        help_text="Ranking before the first round.", verbose_name="Seed"
+                    ),
+                ),
+                (
+                    "points",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="Two points per victory and one per draw.",
+                        verbose_name="Points",
+                    ),
+                ),
+                (
+                    "crosses",
+                    models.PositiveSmallIntegerField(
+                        default=0, verbose_name="Games as Cross"
+                    ),
+                ),
+                (
+                    "circles",
+                    models.PositiveSmallIntegerField(
+                        default=0, verbose_name="Games as Circle"
+                    ),
+                ),
+                (
+                    "byes",
+                    models.PositiveSmallIntegerField(default=0, verbose_name="Byes"),
+                ),
+            ],
+            options={
+                "ordering": ["tournament", "seed"],
+            },
+        ),
+        migrations.AddField(
+            model_name="board",
+            name="round",
+            field=models.PositiveSmallIntegerField(
+                blank=True, null=True, verbose_name="Round"
+            ),
+        ),
+        migrations.AddField(
+            model_name="tournamentplayer",
+            name="tournament",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="players",
+                to="board.tournament",
+                verbose_name="Tournament",
+            ),
+        ),
+        migrations.AddField(
+            model_name="tournamentplayer",
+            name="user",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="tournaments",
+                to=settings.AUTH_USER_MODEL,
+                verbose_name="User",
+            ),
+        ),
+        migrations.AddField(
+            model_name="board",
+            name="tournament",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="boards",
+                to="board.tournament",
+                verbose_name="Tournament",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="tournamentplayer",
+            constraint=models.UniqueConstraint(
+                fields=("tournament", "user"), name="unique_tournament_user"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="board",
+            index=models.Index(
+                fields=["tournament", "round", "status"],
+                name="board_tournament_round_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,144 @@
+# Generated by Django 4.2.6 on 2026-10-18 17:00
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Max
+from django.db.models.functions import Coalesce
+
+# Result of the cross and circle players for every finished status.
+RESULTS = {
+    2: ("victories", "defeats"),
+    3: ("defeats", "victories"),
+    4: ("draws", "draws"),
+}
+
+
+def fill_player_stats(apps, schema_editor):
+    """Stats of every player from the games they already finished, replayed in the order they ended."""
+    Board = apps.get_model("board", "Board")
+    PlayerStats = apps.get_model("board", "PlayerStats")
+    stats = {}
+    games = (
+        Board.objects.exclude(status=1)
+        .annotate(played_at=Coalesce(Max("moves__created_at"), "created_at"))
+        .order_by("played_at", "pk")
+        .values_list("player_cross", "player_circle", "status", "played_at")
+    )
+    for player_cross, player_circle, status, played_at in games.iterator(
+        chunk_size=2000
+    ):
+        cross_result, circle_result = RESULTS[status]
+        for user_id, side, result in [
+            (player_cross, "cross", cross_result),
+            (player_circle, "circle", circle_result),
+        ]:
+            if user_id not in stats:
+                stats[user_id] = PlayerStats(user_id=user_id)
+            player = stats[user_id]
+            setattr(player, f"games_as_{side}", getattr(player, f"games_as_{side}") + 1)
+            setattr(
+                player,
+                f"{result}_as_{side}",
+                getattr(player, f"{result}_as_{side}") + 1,
+            )
+            if result == "victories":
+                player.streak = player.streak + 1 if player.streak > 0 else 1
+            elif result == "defeats":
+                player.streak = player.streak - 1 if player.streak < 0 else -1
+            else:
+                player.streak = 0
+            player.last_played_at = played_at
+    PlayerStats.objects.bulk_create(stats.values(), batch_size=2000)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("board", "0009_tournaments"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PlayerStats",
+            fields=[
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="player_stats",
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="User",
+                    ),
+                ),
+                (
+                    "games_as_circle",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="Games as Circle"
+                    ),
+                ),
+                (
+                    "victories_as_circle",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="Victories as Circle"
+                    ),
+                ),
+                (
+                    "defeats_as_circle",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="Defeats as Circle"
+                    ),
+                ),
+                (
+                    "draws_as_circle",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="Draws as Circle"
+                    ),
+                ),
+                (
+                    "games_as_cross",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="Games as Cross"
+                    ),
+                ),
+                (
+                    "victories_as_cross",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="Victories as Cross"
+                    ),
+                ),
+                (
+                    "defeats_as_cross",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="Defeats as Cross"
+                    ),
+                ),
+                (
+                    "draws_as_cross",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="Draws as Cross"
+                    ),
+                ),
+                (
+                    "streak",
+                    models.IntegerField(
+                        default=0,
+                        help_text="Victories in a row when positive, defeats in a row when negative.",
+                        verbose_name="Current Streak",
+                    ),
+                ),
+                (
+                    "last_played_at",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="Last Played"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name_plural": "Player stats",
+            },
+        ),
+        migrations.RunPython(fill_player_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.6 on 2026-10-18 17:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("board", "0010_player_stats"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="playerstats",
+            name="rating",
+            field=models.FloatField(default=1200.0, verbose_name="Rating"),
+        ),
+        migrations.AddIndex(
+            model_name="playerstats",
+            index=models.Index(
+                fields=["-rating", "user"], name="player_stats_rating_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 4.2.6 on 2026-10-18 17:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("board", "0011_player_rating"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="board",
+            options={"ordering": ["-created_at", "-pk"]},
+        ),
+        migrations.AddIndex(
+            model_name="board",
+            index=models.Index(
+                fields=["player_cross", "-created_at", "-id"],
+                name="board_cross_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="board",
+            index=models.Index(
+                fields=["player_circle", "-created_at", "-id"],
+                name="board_circle_created_idx",
+            ),
+        ),
+    ]
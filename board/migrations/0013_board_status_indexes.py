@@ -0,0 +1,34 @@
+# Generated by Django 4.2.6 on 2026-10-18 17:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("board", "0012_board_user_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="board",
+            index=models.Index(
+                fields=["player_cross", "status", "-created_at", "-id"],
+                name="board_cross_status_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="board",
+            index=models.Index(
+                fields=["player_circle", "status", "-created_at", "-id"],
+                name="board_circle_status_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="board",
+            index=models.Index(
+                condition=models.Q(("status", 1), _negated=True),
+                fields=["created_at", "id"],
+                name="board_finished_created_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 4.2.6 on 2026-10-18 17:20
+
+import django.utils.timezone
+from django.db import migrations, models
+from django.db.models import F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def set_updated_at(apps, schema_editor):
+    """Existing boards were last changed by their latest move, or when created if there's none."""
+    Board = apps.get_model("board", "Board")
+    Move = apps.get_model("board", "Move")
+    latest_move = Move.objects.filter(board=OuterRef("pk")).order_by("-ply")
+    Board.objects.update(
+        updated_at=Coalesce(
+            Subquery(latest_move.values("created_at")[:1]), F("created_at")
+        )
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("board", "0013_board_status_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="board",
+            name="updated_at",
+            field=models.DateTimeField(
+                auto_now=True, default=django.utils.timezone.now
+            ),
+            preserve_default=False,
+        ),
+        migrations.RunPython(set_updated_at, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,16 @@
+# Generated by Django 4.2.6 on 2026-10-18 17:41
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("board", "0014_board_updated_at"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="move",
+            options={"ordering": ["board_id", "ply"]},
+        ),
+    ]
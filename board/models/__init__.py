@@ -1,2 +1,4 @@
 from .board import Board
-from .nodes import Nodes
+from .move import Move
+from .player_stats import PlayerStats
+from .tournament import Tournament, TournamentPlayer
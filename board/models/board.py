@@ -4,10 +4,40 @@ from django.db import models
 from django.shortcuts import reverse
 from django.utils.translation import gettext_lazy as _
 
-from board import constants
+from board import constants, engine
 from utils.messages import MESSAGES
 
 
+class Positions(dict):
+    """
+    Rows played by one side in each column, as the board used to store them. Assigning a column's rows writes them
+    back into the board's cells, the lists themselves are copies.
+    """
+
+    def __init__(self, board, circle):
+        state = board.game_state
+        super().__init__(
+            engine.mask_to_positions(state.circle if circle else state.cross)
+        )
+        self.board = board
+        self.circle = circle
+
+    def __setitem__(self, column, rows):
+        super().__setitem__(column, rows)
+        self._write()
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._write()
+
+    def _write(self):
+        state, mask = self.board.game_state, engine.positions_to_mask(self)
+        if self.circle:
+            self.board.game_state = state._replace(circle=mask)
+        else:
+            self.board.game_state = state._replace(cross=mask)
+
+
 class Board(models.Model):
     player_cross = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -22,19 +52,77 @@ class Board(models.Model):
         related_name="circle",
     )
     created_at = models.DateTimeField(auto_now_add=True)
+    # Services writing boards with 'update' or 'bulk_update' set it themselves.
+    updated_at = models.DateTimeField(auto_now=True)
 
-    positions_cross = models.JSONField(
-        verbose_name=_("Positions played by cross"),
-        default=constants.get_default_positions,
-    )
-    positions_circle = models.JSONField(
-        verbose_name=_("Positions played by circle"),
-        default=constants.get_default_positions,
+    cells = models.PositiveIntegerField(
+        verbose_name=_("Cells"),
+        default=0,
+        help_text=_(
+            "Cells played by cross in the lowest 9 bits, circle's right after."
+        ),
     )
 
     status = models.IntegerField(
         verbose_name=_("Game Status"), choices=constants.STATUS, default=1
     )
+    version = models.PositiveIntegerField(
+        verbose_name=_("Version"), default=0, editable=False
+    )
+    tournament = models.ForeignKey(
+        "board.Tournament",
+        verbose_name=_("Tournament"),
+        on_delete=models.CASCADE,
+        related_name="boards",
+        null=True,
+        blank=True,
+    )
+    round = models.PositiveSmallIntegerField(
+        verbose_name=_("Round"), null=True, blank=True
+    )
+
+    @property
+    def game_state(self):
+        return engine.unpack(self.cells)
+
+    @game_state.setter
+    def game_state(self, state):
+        self.cells = engine.pack(state)
+
+    @property
+    def positions_cross(self):
+        return Positions(self, circle=False)
+
+    @positions_cross.setter
+    def positions_cross(self, positions):
+        mask = engine.positions_to_mask(positions)
+        self.game_state = self.game_state._replace(cross=mask)
+
+    @property
+    def positions_circle(self):
+        return Positions(self, circle=True)
+
+    @positions_circle.setter
+    def positions_circle(self, positions):
+        mask = engine.positions_to_mask(positions)
+        self.game_state = self.game_state._replace(circle=mask)
+
+    @property
+    def next_player_id(self):
+        """Circles always open the game, so the player to move follows from the number of moves played."""
+        if self.status != constants.UNFINISHED:
+            return None
+        if self.game_state.circle_to_move:
+            return self.player_circle_id
+        return self.player_cross_id
+
+    @property
+    def next_player(self):
+        if self.next_player_id is None:
+            return None
+        if self.next_player_id == self.player_circle_id:
+            return self.player_circle
+        return self.player_cross
 
     def get_absolute_url(self):
         return reverse("board:board_play", kwargs={"pk": self.pk})
@@ -45,4 +133,34 @@ class Board(models.Model):
     #         raise ValidationError(MESSAGES["SYS001"].value)
 
     class Meta:
-        ordering = ["-created_at"]
+        ordering = ["-created_at", "-pk"]
+        indexes = [
+            # Games of a user, newest first, as listed by 'board.views.BoardList'.
+            models.Index(
+                fields=["player_cross", "-created_at", "-id"],
+                name="board_cross_created_idx",
+            ),
+            models.Index(
+                fields=["player_circle", "-created_at", "-id"],
+                name="board_circle_created_idx",
+            ),
+            # Games of a user by result, newest first, for 'board.filters.VictoryFilter'.
+            models.Index(
+                fields=["player_cross", "status", "-created_at", "-id"],
+                name="board_cross_status_idx",
+            ),
+            models.Index(
+                fields=["player_circle", "status", "-created_at", "-id"],
+                name="board_circle_status_idx",
+            ),
+            # Finished games in the order they were created, replayed by 'board.stats.recalculate_ratings'.
+            models.Index(
+                fields=["created_at", "id"],
+                condition=~models.Q(status=constants.UNFINISHED),
+                name="board_finished_created_idx",
+            ),
+            models.Index(
+                fields=["tournament", "round", "status"],
+                name="board_tournament_round_idx",
+            ),
+        ]
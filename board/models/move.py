@@ -0,0 +1,31 @@
+from django.conf import settings
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from board import engine
+from board.models import Board
+
+
+class Move(models.Model):
+    board = models.ForeignKey(
+        Board, verbose_name=_("Board"), on_delete=models.CASCADE, related_name="moves"
+    )
+    ply = models.PositiveSmallIntegerField(verbose_name=_("Ply"))
+    player = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        verbose_name=_("Player"),
+        on_delete=models.CASCADE,
+        related_name="moves",
+    )
+    cell = models.PositiveSmallIntegerField(verbose_name=_("Cell"))
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    @property
+    def position(self):
+        return engine.cell_name(self.cell)
+
+    class Meta:
+        ordering = ["board_id", "ply"]
+        constraints = [
+            models.UniqueConstraint(fields=["board", "ply"], name="unique_board_ply")
+        ]
@@ -0,0 +1,59 @@
+from django.conf import settings
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from board.ratings import INITIAL_RATING
+
+
+class PlayerStats(models.Model):
+    """Results of every finished game of a user, kept up to date by 'board.stats.record_results'."""
+
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        verbose_name=_("User"),
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="player_stats",
+    )
+    games_as_circle = models.PositiveIntegerField(
+        verbose_name=_("Games as Circle"), default=0
+    )
+    victories_as_circle = models.PositiveIntegerField(
+        verbose_name=_("Victories as Circle"), default=0
+    )
+    defeats_as_circle = models.PositiveIntegerField(
+        verbose_name=_("Defeats as Circle"), default=0
+    )
+    draws_as_circle = models.PositiveIntegerField(
+        verbose_name=_("Draws as Circle"), default=0
+    )
+    games_as_cross = models.PositiveIntegerField(
+        verbose_name=_("Games as Cross"), default=0
+    )
+    victories_as_cross = models.PositiveIntegerField(
+        verbose_name=_("Victories as Cross"), default=0
+    )
+    defeats_as_cross = models.PositiveIntegerField(
+        verbose_name=_("Defeats as Cross"), default=0
+    )
+    draws_as_cross = models.PositiveIntegerField(
+        verbose_name=_("Draws as Cross"), default=0
+    )
+    streak = models.IntegerField(
+        verbose_name=_("Current Streak"),
+        default=0,
+        help_text=_(
+            "Victories in a row when positive, defeats in a row when negative."
+        ),
+    )
+    last_played_at = models.DateTimeField(
+        verbose_name=_("Last Played"), null=True, blank=True
+    )
+    rating = models.FloatField(verbose_name=_("Rating"), default=INITIAL_RATING)
+
+    class Meta:
+        verbose_name_plural = _("Player stats")
+        indexes = [
+            # Leaderboard pages and ranks are read straight from this index.
+            models.Index(fields=["-rating", "user"], name="player_stats_rating_idx")
+        ]
@@ -0,0 +1,62 @@
+from django.conf import settings
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from board import constants
+
+
+class Tournament(models.Model):
+    name = models.CharField(verbose_name=_("Name"), max_length=100)
+    format = models.PositiveSmallIntegerField(
+        verbose_name=_("Format"), choices=constants.TOURNAMENT_FORMATS
+    )
+    rounds = models.PositiveSmallIntegerField(verbose_name=_("Rounds"))
+    current_round = models.PositiveSmallIntegerField(
+        verbose_name=_("Current Round"), default=0
+    )
+    finished = models.BooleanField(verbose_name=_("Finished"), default=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.name
+
+    class Meta:
+        ordering = ["-created_at"]
+
+
+class TournamentPlayer(models.Model):
+    tournament = models.ForeignKey(
+        Tournament,
+        verbose_name=_("Tournament"),
+        on_delete=models.CASCADE,
+        related_name="players",
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        verbose_name=_("User"),
+        on_delete=models.CASCADE,
+        related_name="tournaments",
+    )
+    seed = models.PositiveIntegerField(
+        verbose_name=_("Seed"), help_text=_("Ranking before the first round.")
+    )
+    points = models.PositiveIntegerField(
+        verbose_name=_("Points"),
+        default=0,
+        help_text=_("Two points per victory and one per draw."),
+    )
+    crosses = models.PositiveSmallIntegerField(
+        verbose_name=_("Games as Cross"), default=0
+    )
+    circles = models.PositiveSmallIntegerField(
+        verbose_name=_("Games as Circle"), default=0
+    )
+    byes = models.PositiveSmallIntegerField(verbose_name=_("Byes"), default=0)
+
+    class Meta:
+        ordering = ["tournament", "seed"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["tournament", "user"], name="unique_tournament_user"
+            )
+        ]
@@ -0,0 +1,33 @@
+"""
+Elo ratings of players, updated every time one of their games finishes. Both players of a game start from
+'INITIAL_RATING' and exchange points depending on how unexpected the result was given their ratings, a 400 points
+difference meaning the stronger player is expected to score ten times as much as the weaker one.
+"""
+from django.conf import settings
+
+from board import constants
+
+INITIAL_RATING = 1200.0
+
+# Score of the cross player for every finished status, circle's being the rest up to 1.
+CROSS_SCORES = {
+    constants.CROSS_VICTORY: 1.0,
+    constants.CIRCLE_VICTORY: 0.0,
+    constants.DRAW: 0.5,
+}
+
+
+def get_k_factor():
+    return getattr(settings, "BOARD_ELO_K_FACTOR", 32)
+
+
+def expected_score(rating, opponent_rating):
+    return 1 / (1 + 10 ** ((opponent_rating - rating) / 400))
+
+
+def rate_game(cross_rating, circle_rating, status):
+    """Returns the new ratings of the cross and circle players of a game finished with ``status``."""
+    change = get_k_factor() * (
+        CROSS_SCORES[status] - expected_score(cross_rating, circle_rating)
+    )
+    return cross_rating + change, circle_rating - change
@@ -0,0 +1,394 @@
+"""
+Game flow shared by every view that creates boards or plays moves on them. Views only parse their payload and turn
+the returned results, or the raised ValidationError, into their own kind of response.
+"""
+from dataclasses import dataclass
+from functools import partial
+from typing import Optional
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from board import bot, constants, engine, events, solved, stats, tournaments
+from board.models import Board, Move, Tournament, TournamentPlayer
+from utils.messages import MESSAGES
+
+User = get_user_model()
+
+
+@dataclass(frozen=True)
+class MoveResult:
+    board: Board
+    cell: int
+    status: int
+    computer_move: Optional[int] = None
+
+    @property
+    def position(self):
+        return engine.cell_name(self.cell)
+
+
+def get_move_attempts():
+    return getattr(settings, "BOARD_MOVE_ATTEMPTS", 3)
+
+
+def get_bulk_batch_size():
+    return getattr(settings, "BOARD_BULK_BATCH_SIZE", 500)
+
+
+def get_board(board_id):
+    """Loads the board a move is played on along with its players."""
+    if not 0 < board_id <= constants.MAX_ID:
+        raise ValidationError(MESSAGES["SYS006"].value)
+    try:
+        return Board.objects.select_related("player_circle", "player_cross").get(
+            id=board_id
+        )
+    except Board.DoesNotExist:
+        raise ValidationError(
+            MESSAGES["SYS003"].value.format(f"{Board._meta.verbose_name.title()}")
+        )
+
+
+def validate_move(board, position, user):
+    """
+    Checks a move against the already loaded ``board`` row, returning the cell to play and whether circle is the side
+    playing it.
+    """
+    try:
+        cell = engine.cell_index(*position)
+    except ValueError:
+        raise ValidationError(MESSAGES["SYS004"].value)
+
+    state = board.game_state
+    entry = solved.lookup(state)
+    if entry is None:
+        legal_moves = engine.FULL_BOARD & ~state.occupied
+        circle_to_move = state.circle_to_move
+    elif entry.status != constants.UNFINISHED:
+        raise ValidationError(MESSAGES["SYS007"].value)
+    else:
+        legal_moves, circle_to_move = entry.legal_moves, entry.circle_to_move
+
+    if not legal_moves >> cell & 1:
+        raise ValidationError(MESSAGES["SYS005"].value)
+
+    if user.pk not in (board.player_circle_id, board.player_cross_id):
+        raise ValidationError(MESSAGES["SYS009"].value)
+
+    playing_circle = user.pk == board.player_circle_id
+    if playing_circle != circle_to_move:
+        raise ValidationError(MESSAGES["SYS010"].value)
+
+    return cell, playing_circle
+
+
+def _apply(board, cell, circle):
+    """Plays ``cell`` on ``board``, returning the unsaved 'Move' logging it."""
+    state = board.game_state
+    board.game_state, board.status = engine.apply_move(state, cell, circle=circle)
+    return Move(
+        board=board,
+        ply=state.occupied.bit_count() + 1,
+        player_id=board.player_circle_id if circle else board.player_cross_id,
+        cell=cell,
+    )
+
+
+def _computer_reply(board, circle):
+    """Plays for the computer if it's the one playing ``circle``, returning its logged move."""
+    player = board.player_circle if circle else board.player_cross
+    if board.status != constants.UNFINISHED or not bot.is_bot(player):
+        return None
+    return _apply(board, bot.choose_move(board.game_state), circle)
+
+
+def _commit(board, moves):
+    """
+    Writes the board only if nobody else did since it was read, appending ``moves`` to its log, and returns whether
+    it was written. No row is locked, concurrent moves on the same board are detected by its version instead. The
+    board row stays the snapshot every read is served from, the log is only ever appended to.
+    """
+    updated_at = timezone.now()
+    updated = Board.objects.filter(pk=board.pk, version=board.version).update(
+        cells=board.cells,
+        status=board.status,
+        version=F("version") + 1,
+        updated_at=updated_at,
+    )
+    if updated:
+        board.version += 1
+        board.updated_at = updated_at
+        Move.objects.bulk_create(moves)
+    return bool(updated)
+
+
+def _publish(boards):
+    """Lets live viewers know about ``boards`` once the transaction writing them is committed."""
+    board_events = [events.board_event(board) for board in boards]
+    if board_events:
+        transaction.on_commit(partial(events.publish_boards, board_events))
+
+
+def play_move(board_id, position, user):
+    """
+    Plays ``position`` for ``user``, and the computer's reply if it's their opponent, with a single read and a single
+    update of the board. When another move gets in between both, the board is read and the move validated again, up
+    to 'BOARD_MOVE_ATTEMPTS' times.
+    """
+    for attempt in range(get_move_attempts()):
+        with transaction.atomic():
+            board = get_board(board_id)
+            cell, circle = validate_move(board, position, user)
+            moves = [_apply(board, cell, circle)]
+            computer_move = _computer_reply(board, not circle)
+            if computer_move is not None:
+                moves.append(computer_move)
+            if _commit(board, moves):
+                _publish([board])
+                if board.status != constants.UNFINISHED:
+                    stats.record_results([board])
+                    if board.tournament_id:
+                        transaction.on_commit(
+                            partial(advance_tournament, board.tournament_id)
+                        )
+                return MoveResult(
+                    board=board,
+                    cell=cell,
+                    status=board.status,
+                    computer_move=computer_move.cell if computer_move else None,
+                )
+    raise ValidationError(MESSAGES["SYS011"].value)
+
+
+def play_moves(moves, user):
+    """
+    Plays many ``(board_id, position)`` moves for ``user`` at once, returning, in the same order, the 'MoveResult' of
+    every move or the ValidationError rejecting it. An invalid move doesn't stop the others from being played. Boards
+    are read with a single query, locking them until the end of the transaction, and written back with a single bulk
+    update which also moves their versions forward for moves played one at a time.
+    """
+    results, logged, changed = [], [], {}
+    with transaction.atomic():
+        boards = (
+            Board.objects.select_for_update(of=("self",))
+            .select_related("player_circle", "player_cross")
+            .in_bulk(
+                {
+                    board_id
+                    for board_id, position in moves
+                    if 0 < board_id <= constants.MAX_ID
+                }
+            )
+        )
+        for board_id, position in moves:
+            try:
+                if not 0 < board_id <= constants.MAX_ID:
+                    raise ValidationError(MESSAGES["SYS006"].value)
+                if board_id not in boards:
+                    raise ValidationError(
+                        MESSAGES["SYS003"].value.format(
+                            f"{Board._meta.verbose_name.title()}"
+                        )
+                    )
+                board = boards[board_id]
+                cell, circle = validate_move(board, position, user)
+            except ValidationError as ex:
+                results.append(ex)
+                continue
+            logged.append(_apply(board, cell, circle))
+            computer_move = _computer_reply(board, not circle)
+            if computer_move is not None:
+                logged.append(computer_move)
+            changed[board.pk] = board
+            results.append(
+                MoveResult(
+                    board=board,
+                    cell=cell,
+                    status=board.status,
+                    computer_move=computer_move.cell if computer_move else None,
+                )
+            )
+
+        updated_at = timezone.now()
+        for board in changed.values():
+            board.version += 1
+            board.updated_at = updated_at
+        Board.objects.bulk_update(
+            changed.values(),
+            ["cells", "status", "version", "updated_at"],
+            batch_size=get_bulk_batch_size(),
+        )
+        Move.objects.bulk_create(logged, batch_size=get_bulk_batch_size())
+        _publish(changed.values())
+        finished = [
+            board for board in changed.values() if board.status != constants.UNFINISHED
+        ]
+        stats.record_results(finished)
+        for tournament_id in {
+            board.tournament_id for board in finished if board.tournament_id
+        }:
+            transaction.on_commit(partial(advance_tournament, tournament_id))
+    return results
+
+
+def create_board(player_cross, player_circle):
+    """Creates a new game, letting the computer open it when it plays circles."""
+    with transaction.atomic():
+        board = Board.objects.create(
+            player_cross=player_cross, player_circle=player_circle
+        )
+        opening = _computer_reply(board, circle=True)
+        if opening is not None:
+            _commit(board, [opening])
+        _publish([board])
+    return board
+
+
+def create_boards(pairings, batch_size=None, **fields):
+    """
+    Creates a game for every ``(player_cross_id, player_circle_id)`` pair, returning the new boards' ids in the same
+    order. Every pairing is checked before anything is written, boards and the computer's openings are then inserted
+    in batches of 'BOARD_BULK_BATCH_SIZE' rows within a single transaction. Any other ``fields`` are set on every
+    board.
+    """
+    pairings = [(int(cross), int(circle)) for cross, circle in pairings]
+    users = User.objects.only("username", "password").in_bulk(
+        {player for pairing in pairings for player in pairing}
+    )
+    for cross, circle in pairings:
+        if cross == circle:
+            raise ValidationError(MESSAGES["SYS001"].value)
+        if cross not in users or circle not in users:
+            raise ValidationError(
+                MESSAGES["SYS003"].value.format(f"{User._meta.verbose_name.title()}")
+            )
+
+    bot_ids = {pk for pk, user in users.items() if bot.is_bot(user)}
+    boards, moves, opening = [], [], None
+    for cross, circle in pairings:
+        board = Board(player_cross_id=cross, player_circle_id=circle, **fields)
+        if circle in bot_ids:
+            # Every game starts from the same empty board, so the opening is only searched once.
+            if opening is None:
+                opening = bot.choose_move(board.game_state)
+            moves.append(_apply(board, opening, circle=True))
+        boards.append(board)
+
+    batch_size = batch_size or get_bulk_batch_size()
+    with transaction.atomic():
+        Board.objects.bulk_create(boards, batch_size=batch_size)
+        Move.objects.bulk_create(moves, batch_size=batch_size)
+        _publish(boards)
+    return [board.pk for board in boards]
+
+
+def _pair_round(tournament, players, round_number):
+    """Pairs ``round_number`` and creates its boards, leaving ``players`` to be saved by the caller."""
+    if tournament.format == constants.ROUND_ROBIN:
+        pairs, bye = tournaments.round_robin_pairings(players, round_number)
+    else:
+        played = {
+            frozenset(pairing)
+            for pairing in tournament.boards.values_list(
+                "player_cross", "player_circle"
+            )
+        }
+        pairs, bye = tournaments.swiss_pairings(players, played, round_number)
+    for cross, circle in pairs:
+        cross.crosses += 1
+        circle.circles += 1
+    if bye is not None:
+        bye.byes += 1
+        if tournament.format == constants.SWISS:
+            bye.points += constants.VICTORY_POINTS
+    create_boards(
+        [(cross.user_id, circle.user_id) for cross, circle in pairs],
+        tournament=tournament,
+        round=round_number,
+    )
+
+
+def _score_round(tournament, players, round_number):
+    players = {player.user_id: player for player in players}
+    for cross, circle, status in tournament.boards.filter(
+        round=round_number
+    ).values_list("player_cross", "player_circle", "status"):
+        if status == constants.CROSS_VICTORY:
+            players[cross].points += constants.VICTORY_POINTS
+        elif status == constants.CIRCLE_VICTORY:
+            players[circle].points += constants.VICTORY_POINTS
+        elif status == constants.DRAW:
+            players[cross].points += constants.DRAW_POINTS
+            players[circle].points += constants.DRAW_POINTS
+
+
+def _save_players(players):
+    TournamentPlayer.objects.bulk_update(
+        players,
+        ["points", "crosses", "circles", "byes"],
+        batch_size=get_bulk_batch_size(),
+    )
+
+
+def create_tournament(name, format, users, rounds=None):
+    """Registers ``users``, seeded in the given order, and pairs the first round."""
+    users = list(users)
+    if len(users) < 2:
+        raise ValidationError(MESSAGES["SYS012"].value)
+    if len({user.pk for user in users}) != len(users):
+        raise ValidationError(MESSAGES["SYS013"].value)
+    with transaction.atomic():
+        tournament = Tournament.objects.create(
+            name=name,
+            format=format,
+            rounds=rounds or tournaments.default_rounds(format, len(users)),
+            current_round=1,
+        )
+        players = TournamentPlayer.objects.bulk_create(
+            [
+                TournamentPlayer(tournament=tournament, user_id=user.pk, seed=seed)
+                for seed, user in enumerate(users, start=1)
+            ],
+            batch_size=get_bulk_batch_size(),
+        )
+        _pair_round(tournament, players, 1)
+        _save_players(players)
+    return tournament
+
+
+def advance_tournament(tournament_id):
+    """
+    Scores the current round once none of its games is unfinished, and pairs the next one unless it was the last,
+    returning whether the tournament moved on. The round is claimed with a conditional update, so games finishing at
+    the same time can't score or pair it twice.
+    """
+    tournament = Tournament.objects.get(pk=tournament_id)
+    current_round = tournament.current_round
+    if (
+        tournament.finished
+        or tournament.boards.filter(
+            round=current_round, status=constants.UNFINISHED
+        ).exists()
+    ):
+        return False
+    finished = current_round >= tournament.rounds
+    with transaction.atomic():
+        claimed = Tournament.objects.filter(
+            pk=tournament.pk, current_round=current_round, finished=False
+        ).update(
+            current_round=current_round if finished else current_round + 1,
+            finished=finished,
+        )
+        if not claimed:
+            return False
+        players = list(tournament.players.all())
+        _score_round(tournament, players, current_round)
+        if not finished:
+            _pair_round(tournament, players, current_round + 1)
+        _save_players(players)
+    return True
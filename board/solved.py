@@ -0,0 +1,107 @@
+"""
+Solved table of every classic tic-tac-toe position.
+
+Positions are keyed by their base-3 id, where the digit of each cell is 0 when empty, 1 for cross and 2 for circle.
+Every one of the 3 ** 9 ids gets a fixed size record, unreachable positions being left as zeros, so answering any
+question about a position is a single offset into the table. The table is generated once with the
+'build_solved_table' management command and memory-mapped at startup, letting every worker process share the same
+pages.
+"""
+import mmap
+import struct
+from pathlib import Path
+from typing import NamedTuple
+
+from django.conf import settings
+
+from board import constants, engine
+
+POWERS = tuple(3**cell for cell in range(engine.CLASSIC.size))
+TABLE_SIZE = 3**engine.CLASSIC.size
+# status, circle to move, value for the side to move, best move (-1 if none), legal moves mask.
+RECORD = struct.Struct("<BBbbH")
+DEFAULT_PATH = Path(__file__).resolve().parent / "data" / "solved_positions.bin"
+
+_table = None
+
+
+class Entry(NamedTuple):
+    status: int
+    circle_to_move: bool
+    value: int
+    best_move: int
+    legal_moves: int
+
+
+def state_id(state):
+    return sum(POWERS[cell] for cell in engine.iter_cells(state.cross)) + 2 * sum(
+        POWERS[cell] for cell in engine.iter_cells(state.circle)
+    )
+
+
+def build_table():
+    """Solves the game from the empty board and returns the packed table."""
+    table = bytearray(RECORD.size * TABLE_SIZE)
+    values = {}
+
+    def solve(state, status):
+        key = state_id(state)
+        if key in values:
+            return values[key]
+        circle = state.circle_to_move
+        if status != constants.UNFINISHED:
+            # The side to move has just lost, or nobody can win anymore.
+            value = 0 if status == constants.DRAW else -1
+            best_move, legal_moves = -1, 0
+        else:
+            legal_moves = engine.FULL_BOARD & ~state.occupied
+            value, best_move = -2, -1
+            for cell in engine.iter_cells(legal_moves):
+                child_value = -solve(*engine.apply_move(state, cell, circle=circle))
+                if child_value > value:
+                    value, best_move = child_value, cell
+        RECORD.pack_into(
+            table, key * RECORD.size, status, circle, value, best_move, legal_moves
+        )
+        values[key] = value
+        return value
+
+    solve(engine.GameState(), constants.UNFINISHED)
+    return bytes(table)
+
+
+def write_table(path=None):
+    path = Path(path or get_table_path())
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(build_table())
+    return path
+
+
+def get_table_path():
+    return Path(getattr(settings, "BOARD_SOLVED_TABLE_PATH", DEFAULT_PATH))
+
+
+def load_table(path=None):
+    """Memory-maps the table file, solving the game in memory if the file hasn't been generated."""
+    global _table
+    path = Path(path or get_table_path())
+    try:
+        with open(path, "rb") as file:
+            table = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (FileNotFoundError, ValueError):
+        table = build_table()
+    if len(table) != RECORD.size * TABLE_SIZE:
+        table = build_table()
+    _table = table
+    return _table
+
+
+def lookup(state):
+    """Returns the 'Entry' for ``state``, or None if the position can't be reached in a legal game."""
+    if state.cross & state.circle:
+        return None
+    table = _table if _table is not None else load_table()
+    entry = Entry(*RECORD.unpack_from(table, state_id(state) * RECORD.size))
+    if not entry.status:
+        return None
+    return entry._replace(circle_to_move=bool(entry.circle_to_move))
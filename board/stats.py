@@ -0,0 +1,232 @@
+"""
+Game statistics of every user. Results are added to 'board.models.PlayerStats' by the same transaction finishing a
+game, so showing them only takes reading a row by its primary key and counting the games still being played. They
+aren't cached, a process-local cache would keep serving stale rows to the other processes.
+Ratings are kept in the same rows, see 'board.ratings', and the leaderboard is read from their index.
+"""
+from django.db import transaction
+from django.db.models import Case, Count, F, Max, Q, Value, When
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from board import constants, ratings
+from board.models import Board, PlayerStats
+
+# Result of the cross and circle players for every finished status.
+RESULTS = {
+    constants.CROSS_VICTORY: ("victories", "defeats"),
+    constants.CIRCLE_VICTORY: ("defeats", "victories"),
+    constants.DRAW: ("draws", "draws"),
+}
+
+DASHBOARD_FIELDS = (
+    "games_as_circle",
+    "victories_as_circle",
+    "draws_as_circle",
+    "games_as_cross",
+    "victories_as_cross",
+    "draws_as_cross",
+)
+
+
+def get_user_stats(user_id):
+    """
+    Dashboard of a user. Finished games come from their 'PlayerStats' row, the games they're still playing are counted
+    on top of them from the board indexes.
+    """
+    stats = PlayerStats.objects.filter(pk=user_id).values(*DASHBOARD_FIELDS).first()
+    stats = stats or dict.fromkeys(DASHBOARD_FIELDS, 0)
+    playing = Board.objects.filter(
+        Q(player_circle=user_id) | Q(player_cross=user_id),
+        status=constants.UNFINISHED,
+    ).aggregate(
+        games_as_circle=Count("pk", filter=Q(player_circle=user_id)),
+        games_as_cross=Count("pk", filter=Q(player_cross=user_id)),
+    )
+    for field, games in playing.items():
+        stats[field] += games
+    return stats
+
+
+def iter_results(player_cross, player_circle, status):
+    """Yields the ``(user_id, side, result)`` of both players of a finished game."""
+    cross_result, circle_result = RESULTS[status]
+    yield player_cross, "cross", cross_result
+    yield player_circle, "circle", circle_result
+
+
+STREAKS = {
+    "victories": Case(When(streak__gt=0, then=F("streak") + 1), default=Value(1)),
+    "defeats": Case(When(streak__lt=0, then=F("streak") - 1), default=Value(-1)),
+    "draws": Value(0),
+}
+
+
+def record_results(boards, played_at=None):
+    """
+    Adds the results of the just finished ``boards`` to their players' stats, within the transaction finishing them.
+    Rows are only ever updated in the database, so concurrent games of the same player can't overwrite each other.
+    """
+    boards = [board for board in boards if board.status != constants.UNFINISHED]
+    if not boards:
+        return
+    played_at = played_at or timezone.now()
+    PlayerStats.objects.bulk_create(
+        [
+            PlayerStats(user_id=user_id)
+            for board in boards
+            for user_id in (board.player_cross_id, board.player_circle_id)
+        ],
+        ignore_conflicts=True,
+    )
+    # Every player of the batch is locked at once and in the same order by every transaction, so batches sharing
+    # players can't deadlock. Ratings are read once and carried from game to game, each one rating the next.
+    current = dict(
+        PlayerStats.objects.select_for_update()
+        .filter(
+            pk__in={
+                user_id
+                for board in boards
+                for user_id in (board.player_cross_id, board.player_circle_id)
+            }
+        )
+        .order_by("pk")
+        .values_list("pk", "rating")
+    )
+    for board in boards:
+        players = (board.player_cross_id, board.player_circle_id)
+        new_ratings = dict(
+            zip(
+                players,
+                ratings.rate_game(
+                    current[players[0]], current[players[1]], board.status
+                ),
+            )
+        )
+        current.update(new_ratings)
+        for user_id, side, result in iter_results(*players, board.status):
+            PlayerStats.objects.filter(pk=user_id).update(
+                **{
+                    f"games_as_{side}": F(f"games_as_{side}") + 1,
+                    f"{result}_as_{side}": F(f"{result}_as_{side}") + 1,
+                    "streak": STREAKS[result],
+                    "last_played_at": played_at,
+                    "rating": new_ratings[user_id],
+                }
+            )
+
+
+def add_result(stats, side, result, played_at):
+    """Same as 'record_results' does in the database, for a 'PlayerStats' being rebuilt in memory."""
+    setattr(stats, f"games_as_{side}", getattr(stats, f"games_as_{side}") + 1)
+    setattr(stats, f"{result}_as_{side}", getattr(stats, f"{result}_as_{side}") + 1)
+    if result == "victories":
+        stats.streak = stats.streak + 1 if stats.streak > 0 else 1
+    elif result == "defeats":
+        stats.streak = stats.streak - 1 if stats.streak < 0 else -1
+    else:
+        stats.streak = 0
+    stats.last_played_at = played_at
+
+
+def compute_player_stats(user_ids, chunk_size=2000):
+    """
+    Stats of ``user_ids`` from every game they finished, streamed in the order the games ended so streaks come out
+    right. Users without finished games are left out.
+    """
+    user_ids = set(user_ids)
+    stats = {}
+    games = (
+        Board.objects.exclude(status=constants.UNFINISHED)
+        .filter(Q(player_cross__in=user_ids) | Q(player_circle__in=user_ids))
+        .annotate(played_at=Coalesce(Max("moves__created_at"), "created_at"))
+        .order_by("played_at", "pk")
+        .values_list("player_cross", "player_circle", "status", "played_at")
+    )
+    for player_cross, player_circle, status, played_at in games.iterator(
+        chunk_size=chunk_size
+    ):
+        for user_id, side, result in iter_results(player_cross, player_circle, status):
+            if user_id in user_ids:
+                if user_id not in stats:
+                    stats[user_id] = PlayerStats(user_id=user_id)
+                add_result(stats[user_id], side, result, played_at)
+    return list(stats.values())
+
+
+def rebuild_player_stats(user_ids, chunk_size=2000):
+    """
+    Replaces the stats of ``user_ids`` with the ones computed from their games, returning how many were written.
+    Ratings depend on every opponent's games so they are kept, 'recalculate_ratings' rebuilds them.
+    """
+    user_ids = list(user_ids)
+    stats = compute_player_stats(user_ids, chunk_size=chunk_size)
+    with transaction.atomic():
+        kept = dict(
+            PlayerStats.objects.filter(pk__in=user_ids).values_list("pk", "rating")
+        )
+        for player in stats:
+            player.rating = kept.get(player.user_id, ratings.INITIAL_RATING)
+        PlayerStats.objects.filter(pk__in=user_ids).delete()
+        PlayerStats.objects.bulk_create(stats, batch_size=chunk_size)
+    return len(stats)
+
+
+def recalculate_ratings(chunk_size=2000):
+    """
+    Rates every player from scratch by replaying all finished games in the order they were created. Games are
+    streamed and only the rating of every player is kept in memory. Returns how many players were rated, players
+    without a 'PlayerStats' row are skipped so stats should be rebuilt first.
+    """
+    current = {}
+    games = (
+        Board.objects.exclude(status=constants.UNFINISHED)
+        .order_by("created_at", "pk")
+        .values_list("player_cross", "player_circle", "status")
+    )
+    for player_cross, player_circle, status in games.iterator(chunk_size=chunk_size):
+        current[player_cross], current[player_circle] = ratings.rate_game(
+            current.get(player_cross, ratings.INITIAL_RATING),
+            current.get(player_circle, ratings.INITIAL_RATING),
+            status,
+        )
+    with transaction.atomic():
+        PlayerStats.objects.exclude(pk__in=current).update(
+            rating=ratings.INITIAL_RATING
+        )
+        PlayerStats.objects.bulk_update(
+            [
+                PlayerStats(user_id=user_id, rating=rating)
+                for user_id, rating in current.items()
+            ],
+            ["rating"],
+            batch_size=chunk_size,
+        )
+    return len(current)
+
+
+def get_leaderboard(after=None, limit=20):
+    """
+    Page of ``limit`` players by rating, best first. ``after`` is the ``(rating, user_id)`` of the last player of the
+    previous page, pages start right after it in the rating index instead of skipping every player before them.
+    """
+    players = PlayerStats.objects.order_by("-rating", "user_id")
+    if after is not None:
+        rating, user_id = after
+        players = players.filter(
+            Q(rating__lt=rating) | Q(rating=rating, user_id__gt=user_id)
+        )
+    return list(players.values("user_id", "user__username", "rating")[:limit])
+
+
+def get_rank(user_id):
+    """
+    Returns ``(rank, rating)`` of a user, or None if they haven't finished any game. Players with the same rating share
+    their rank, which is one more than the players rated above, counted from the rating index.
+    """
+    rating = (
+        PlayerStats.objects.filter(pk=user_id).values_list("rating", flat=True).first()
+    )
+    if rating is None:
+        return None
+    return PlayerStats.objects.filter(rating__gt=rating).count() + 1, rating
@@ -1,15 +1,27 @@
 import django_tables2 as tables
+from django.shortcuts import reverse
 from django.utils.html import format_html
-from django.utils.translation import gettext_lazy as _
 
 from board.models import Board
 
 
 class BoardTable(tables.Table):
+    """
+    Rows only read the usernames of both players and the status, load them with 'select_related' and 'only' along
+    the lines of 'board.views.BoardList.get_queryset' to render a page in a single query.
+    """
+
     class Meta:
         model = Board
         fields = ("player_circle", "player_cross", "status")
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Reversed once per table, rows only fill in their id.
+        self.play_url = reverse("board:board_play", kwargs={"pk": 0}).replace(
+            "/0/", "/{}/"
+        )
+
     def render_player_circle(self, value, record):
         return value.username
 
@@ -17,12 +29,4 @@ class BoardTable(tables.Table):
         return value.username
 
     def render_status(self, value, record):
-        url = record.get_absolute_url()
-        if value == "Unfinished":
-            return format_html(f"<a href={url}>{_('Unfinished')}</a>")
-        elif value == "Cross Victory":
-            return format_html(f"<a href={url}>{_('Cross Victory')}</a>")
-        elif value == "Circle Victory":
-            return format_html(f"<a href={url}>{_('Circle Victory')}</a>")
-        elif value == "Draw":
-            return format_html(f"<a href={url}>{_('Draw')}</a>")
+        return format_html("<a href={}>{}</a>", self.play_url.format(record.pk), value)
@@ -1,35 +1,75 @@
+"""
+Grid of a game for 'board/includes/get_table_form.html'. The HTML of every cell in each of its states is built once,
+so rendering a grid only picks and joins pieces, and rendered grids are cached under the board's cells and whether
+the viewer is the one to move, which is all they depend on. Boards in the same position share their grids, and boards
+changed by any writer, not only 'board.services', never get a stale one.
+"""
 from django import template
+from django.conf import settings
+from django.core.cache import cache
+
+from board import constants, engine
 
 register = template.Library()
 
+EMPTY, CROSS, CIRCLE, PLAYABLE = range(4)
 
-@register.inclusion_tag(
-    filename="board/includes/get_table_form.html", takes_context=True
+HEADER = (
+    "<table border='1|0'><tr><td></td>"
+    + "".join(f"<td>{column}</td>" for column in constants.COLUMNS)
+    + "</tr>"
 )
-def get_table(context, board, user):
-    from board.models import Board
+ROW_STARTS = tuple(f"<tr><td>{row}</td>" for row in constants.ROWS)
+
 
-    board = Board.objects.get(id=board)
-    table_string = (
-        "<table border='1|0'><tr><td></td><td>A</td><td>B</td><td>C</td></tr>"
+def _cell_pieces(index):
+    column, row = engine.cell_name(index).split("_")
+    return (
+        "<td></td>",
+        "<td>X</td>",
+        "<td>O</td>",
+        f"<td><input type='radio' name='position' value={column}_{row}>{column}{row}</td>",
     )
-    if board.nodes.next_player is not None:
-        next_player = True if board.nodes.next_player.pk == user else False
-    else:
-        next_player = False
-    for row in range(1, 4):
-        table_string += f"<tr><td>{row}</td>"
-        for column in ["A", "B", "C"]:
-            if row in board.positions_circle[column]:
-                table_string += "<td>O</td>"
-            elif row in board.positions_cross[column]:
-                table_string += "<td>X</td>"
+
+
+CELLS = tuple(_cell_pieces(index) for index in range(engine.CLASSIC.size))
+
+
+def get_cache_timeout():
+    return getattr(settings, "BOARD_TABLE_CACHE_TIMEOUT", 60 * 60)
+
+
+def get_cache_key(board, next_player):
+    return f"board:table:{board.cells}:{'player' if next_player else 'viewer'}"
+
+
+def render_grid(cells, next_player):
+    state = engine.unpack(cells)
+    size = len(constants.COLUMNS)
+    pieces = [HEADER]
+    for row, row_start in enumerate(ROW_STARTS):
+        pieces.append(row_start)
+        for index in range(row * size, (row + 1) * size):
+            bit = 1 << index
+            if state.circle & bit:
+                pieces.append(CELLS[index][CIRCLE])
+            elif state.cross & bit:
+                pieces.append(CELLS[index][CROSS])
             else:
-                if next_player:
-                    table_string += f"<td><input type='radio' name='position' value={column}_{row}>{column}{row}</td>"
-                else:
-                    table_string += "<td></td>"
-        table_string += "</tr>"
-    table_string += "</table>"
+                pieces.append(CELLS[index][PLAYABLE if next_player else EMPTY])
+        pieces.append("</tr>")
+    pieces.append("</table>")
+    return "".join(pieces)
+
 
+@register.inclusion_tag(
+    filename="board/includes/get_table_form.html", takes_context=True
+)
+def get_table(context, board, user):
+    next_player = board.next_player_id is not None and board.next_player_id == user
+    key = get_cache_key(board, next_player)
+    table_string = cache.get(key)
+    if table_string is None:
+        table_string = render_grid(board.cells, next_player)
+        cache.set(key, table_string, get_cache_timeout())
     return {"table_string": table_string, "next_player": next_player, "board": board}
@@ -0,0 +1,57 @@
+from django.test import SimpleTestCase
+
+from board import ai, engine, solved
+
+
+class SearcherTests(SimpleTestCase):
+    """Tests for 'board.ai' negamax search."""
+
+    def test_matches_solved_table(self):
+        """Test to check every move chosen keeps the game-theoretic value of the position."""
+        searcher = ai.Searcher()
+        success = []
+        pending, seen = [engine.GameState()], set()
+        while pending:
+            state = pending.pop()
+            key = solved.state_id(state)
+            if key in seen:
+                continue
+            seen.add(key)
+            entry = solved.lookup(state)
+            if entry.status != 1:
+                continue
+            cell, score = searcher.best_move(state)
+            child, status = engine.apply_move(state, cell)
+            child_value = (
+                -solved.lookup(child).value if status == 1 else int(status != 4)
+            )
+            success.extend(
+                [(score > 0) - (score < 0) == entry.value, child_value == entry.value]
+            )
+            pending.extend(
+                engine.apply_move(state, move)[0]
+                for move in engine.iter_cells(engine.FULL_BOARD & ~state.occupied)
+            )
+        self.assertTrue(all(success))
+
+    def test_symmetries(self):
+        """Test to check rotated and mirrored positions share the same transposition table key."""
+        searcher = ai.Searcher()
+        corners = [0, 2, 6, 8]
+        keys = {
+            searcher.canonical(engine.GameState(circle=1 << cell)) for cell in corners
+        }
+        success = [
+            len(keys) == 1,
+            len(searcher.symmetries) == 7,
+            len(ai.Searcher(engine.Geometry(4, 3, 3), max_depth=2).symmetries) == 3,
+        ]
+        self.assertTrue(all(success))
+
+    def test_larger_board(self):
+        """Test to check depth limited searches on bigger boards block an immediate threat."""
+        geometry = engine.Geometry(columns=5, rows=5, k=4)
+        # Circle has three in a row on the first row and cross has to block the only open end.
+        state = engine.GameState(cross=0b1 | 1 << 7 | 1 << 14, circle=0b1110 | 1 << 24)
+        cell = ai.best_move(state, geometry=geometry, max_depth=2)
+        self.assertEqual(cell, 4)
@@ -0,0 +1,86 @@
+from django.test import SimpleTestCase
+
+from board import constants, engine
+
+
+class EngineTests(SimpleTestCase):
+    """Tests for 'board.engine' bitboard helpers."""
+
+    def test_positions_round_trip(self):
+        """Test to check positions dicts and masks convert back and forth without losing information."""
+        positions = {"A": [1, 3], "B": [2], "C": []}
+        mask = engine.positions_to_mask(positions)
+        success = [
+            mask == 0b001010001,
+            engine.mask_to_positions(mask) == positions,
+            engine.positions_to_mask(constants.get_default_positions()) == 0,
+            engine.cell_name(engine.cell_index("C", 2)) == "C_2",
+        ]
+        self.assertTrue(all(success))
+
+    def test_invalid_cells(self):
+        """Test to check cells outside the board are rejected."""
+        for column, row in [("D", 1), ("A", 4), ("A", "x"), ("a", 1)]:
+            with self.assertRaises(ValueError):
+                engine.cell_index(column, row)
+
+    def test_game_status(self):
+        """Test to check every winning line, draws and unfinished games are detected."""
+        success = [engine.game_status(line, 0) == 2 for line in engine.WINNING_LINES]
+        success.extend(
+            [engine.game_status(0, line) == 3 for line in engine.WINNING_LINES]
+        )
+        cross = engine.positions_to_mask({"A": [3], "B": [1, 2], "C": [3]})
+        circle = engine.positions_to_mask({"A": [1, 2], "B": [3], "C": [1, 2]})
+        success.extend(
+            [
+                len(engine.WINNING_LINES) == 8,
+                engine.game_status(cross, circle) == 4,
+                engine.game_status(0, 0) == 1,
+                engine.circle_to_move(0, 0),
+                not engine.circle_to_move(0, 1),
+            ]
+        )
+        self.assertTrue(all(success))
+
+    def test_apply_move(self):
+        """Test to check incremental evaluation matches a full board scan and rejects taken cells."""
+        state = engine.GameState()
+        outcomes = []
+        for cell in [4, 0, 8, 2, 1, 7, 6, 3]:
+            state, outcome = engine.apply_move(state, cell)
+            outcomes.append(outcome == engine.game_status(state.cross, state.circle))
+        state, outcome = engine.apply_move(state, 5)
+        success = [
+            all(outcomes),
+            outcome == 4,
+            [len(lines) for lines in engine.CLASSIC.lines_through]
+            == [3, 2, 3, 2, 4, 2, 3, 2, 3],
+        ]
+        with self.assertRaises(ValueError):
+            engine.apply_move(engine.GameState(circle=1), 0)
+        self.assertTrue(all(success))
+
+    def test_larger_geometry(self):
+        """Test to check k-in-a-row is detected on boards bigger than the classic one."""
+        geometry = engine.Geometry(columns=7, rows=6, k=4)
+        state = engine.GameState()
+        for cell in [0, 7, 1, 8, 2, 9]:
+            state, outcome = engine.apply_move(state, cell, geometry=geometry)
+        success = [outcome == 1, len(geometry.lines) == 69]
+        state, outcome = engine.apply_move(state, 3, geometry=geometry)
+        success.append(outcome == 3)
+        with self.assertRaises(ValueError):
+            engine.Geometry(columns=3, rows=3, k=4)
+        self.assertTrue(all(success))
+
+    def test_to_string(self):
+        """Test to check boards are written one character per cell, starting from 'A_1' and row by row."""
+        state = engine.GameState(
+            cross=1 << engine.cell_index("A", 1), circle=1 << engine.cell_index("B", 2)
+        )
+        success = [
+            engine.to_string(state) == "X---O----",
+            engine.to_string(engine.GameState()) == "-" * 9,
+        ]
+        self.assertTrue(all(success))
@@ -0,0 +1,41 @@
+from django.test import SimpleTestCase
+
+from board import constants, engine, solved
+
+
+class SolvedTableTests(SimpleTestCase):
+    """Tests for 'board.solved' positions table."""
+
+    def test_shipped_table(self):
+        """Test to check the shipped table matches a freshly solved one and covers every reachable position."""
+        table = solved.build_table()
+        reachable = sum(
+            1 for key in range(solved.TABLE_SIZE) if table[key * solved.RECORD.size]
+        )
+        success = [
+            reachable == 5478,
+            bytes(solved.load_table()) == table,
+        ]
+        self.assertTrue(all(success))
+
+    def test_lookup(self):
+        """Test to check entries describe the position and unreachable ones are ignored."""
+        empty = solved.lookup(engine.GameState())
+        cross = engine.positions_to_mask({"A": [3], "B": [1, 2], "C": [3]})
+        circle = engine.positions_to_mask({"A": [1, 2], "B": [3], "C": [1, 2]})
+        draw = solved.lookup(engine.GameState(cross, circle))
+        # Circle threatens A_3 and cross has to block it.
+        threat = solved.lookup(engine.GameState(cross=0b000010000, circle=0b000001001))
+        success = [
+            empty.status == constants.UNFINISHED,
+            empty.circle_to_move is True,
+            empty.value == 0,
+            empty.legal_moves == engine.FULL_BOARD,
+            draw.status == constants.DRAW,
+            draw.legal_moves == 0,
+            engine.cell_name(threat.best_move) == "A_3",
+            threat.circle_to_move is False,
+            solved.lookup(engine.GameState(cross=0b11)) is None,
+            solved.lookup(engine.GameState(cross=1, circle=1)) is None,
+        ]
+        self.assertTrue(all(success))
@@ -0,0 +1,78 @@
+from types import SimpleNamespace
+
+from django.test import SimpleTestCase
+
+from board import constants, tournaments
+
+
+def make_players(amount):
+    return [
+        SimpleNamespace(user_id=seed, seed=seed, points=0, crosses=0, circles=0, byes=0)
+        for seed in range(1, amount + 1)
+    ]
+
+
+class TournamentPairingsTests(SimpleTestCase):
+    """Tests for 'board.tournaments' pairings."""
+
+    def test_round_robin(self):
+        """Test to check everybody meets everybody else once, with balanced sides and one rest each when odd."""
+        success = []
+        for amount in (6, 7):
+            players = make_players(amount)
+            rounds = tournaments.default_rounds(constants.ROUND_ROBIN, amount)
+            games, byes = [], []
+            for round_number in range(1, rounds + 1):
+                pairs, bye = tournaments.round_robin_pairings(players, round_number)
+                for cross, circle in pairs:
+                    cross.crosses += 1
+                    circle.circles += 1
+                games.extend(
+                    frozenset((cross.user_id, circle.user_id))
+                    for cross, circle in pairs
+                )
+                byes.append(bye)
+            success.extend(
+                [
+                    len(games) == len(set(games)) == amount * (amount - 1) // 2,
+                    all(
+                        abs(player.crosses - player.circles) <= 1 for player in players
+                    ),
+                    byes == [None] * rounds
+                    if amount % 2 == 0
+                    else sorted(bye.user_id for bye in byes) == list(range(1, 8)),
+                ]
+            )
+        self.assertTrue(all(success))
+
+    def test_swiss(self):
+        """Test to check players meet the closest ranked opponent they haven't played yet."""
+        players = make_players(7)
+        for player, points in zip(players, (4, 4, 2, 2, 2, 0, 0)):
+            player.points = points
+        players[6].byes = 1
+        played = {frozenset((1, 2)), frozenset((3, 4))}
+        pairs, bye = tournaments.swiss_pairings(players, played, 3)
+        success = [
+            bye.user_id == 6,
+            sorted(sorted((cross.user_id, circle.user_id)) for cross, circle in pairs)
+            == [[1, 3], [2, 4], [5, 7]],
+        ]
+        self.assertTrue(all(success))
+
+    def test_sides(self):
+        """Test to check whoever played cross the most plays circle, ties alternating between rounds."""
+        first, second = make_players(2)
+        first.crosses = 1
+        success = [
+            tournaments.assign_sides(first, second, 1) == (second, first),
+            tournaments.assign_sides(second, first, 1) == (second, first),
+        ]
+        first.crosses = 0
+        success.extend(
+            [
+                tournaments.assign_sides(first, second, 1) == (first, second),
+                tournaments.assign_sides(first, second, 2) == (second, first),
+            ]
+        )
+        self.assertTrue(all(success))
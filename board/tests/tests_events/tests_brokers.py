@@ -0,0 +1,110 @@
+import tempfile
+import time
+from pathlib import Path
+from unittest import skipIf
+from unittest.mock import patch
+
+from django.core.exceptions import ImproperlyConfigured
+from django.test import SimpleTestCase
+
+from board import brokers, events
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.05)
+    return condition()
+
+
+def make_event(board_id, version, next_player_id=None):
+    return {
+        "board_id": board_id,
+        "cells": 0,
+        "status": 1,
+        "version": version,
+        "next_player_id": next_player_id,
+    }
+
+
+class PublisherTests(SimpleTestCase):
+    """Tests for 'board.events.Publisher' batches."""
+
+    def test_coalescing(self):
+        """Test to check a burst of events sends a single batch with the latest version of every board."""
+        sent = []
+        backend = brokers.MemoryBackend(lambda channel, event: sent.append(channel))
+        publisher = events.Publisher()
+        with patch.object(events, "get_backend", return_value=backend):
+            with self.settings(BOARD_EVENTS_COALESCE_INTERVAL=0.2):
+                publisher.add([make_event(1, 1, next_player_id=2)])
+                publisher.add([make_event(1, 3), make_event(2, 1, next_player_id=2)])
+                publisher.add([make_event(1, 2, next_player_id=2)])
+                success = [not sent, wait_for(lambda: sent)]
+            with self.settings(BOARD_EVENTS_COALESCE_INTERVAL=0):
+                publisher.add([make_event(3, 1)])
+        success.append(sent == ["board:1", "board:2", "user:2", "board:3"])
+        self.assertTrue(all(success))
+
+
+class BackendTests(SimpleTestCase):
+    """Tests for 'board.brokers' backends."""
+
+    def test_sqlite(self):
+        """Test to check events published by a process reach every process sharing the file, only once."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "events.sqlite3"
+            received = [], []
+            backends = [
+                brokers.SQLiteBackend(
+                    lambda channel, event, index=index: received[index].append(
+                        (channel, event)
+                    ),
+                    path=path,
+                    poll_interval=0.05,
+                )
+                for index in range(2)
+            ]
+            backends[0].publish([("board:1", make_event(1, 1)), ("user:2", {})])
+            backends[1].publish([("board:1", make_event(1, 2))])
+            success = [
+                wait_for(lambda: all(len(messages) == 3 for messages in received)),
+            ]
+            time.sleep(0.2)
+            for backend in backends:
+                backend.close()
+        success.extend(
+            [
+                received[0] == received[1],
+                [channel for channel, event in received[0]]
+                == ["board:1", "user:2", "board:1"],
+                received[0][2][1]["version"] == 2,
+            ]
+        )
+        self.assertTrue(all(success))
+
+    @skipIf(redis is not None, "The optional 'redis' package is installed.")
+    def test_redis_requires_package(self):
+        """Test to check the Redis backend explains its optional requirement."""
+        with self.assertRaises(ImproperlyConfigured):
+            brokers.RedisBackend(lambda channel, event: None)
+
+    def test_configured_backend(self):
+        """Test to check the backend comes from the settings and delivers into this process' broker."""
+        with patch.object(events, "_backend", None):
+            with self.settings(
+                BOARD_EVENTS_BACKEND="board.brokers.MemoryBackend",
+                BOARD_EVENTS_OPTIONS={},
+            ):
+                backend = events.get_backend()
+                success = [
+                    isinstance(backend, brokers.MemoryBackend),
+                    events.get_backend() is backend,
+                    backend.deliver == events.broker.publish,
+                ]
+        self.assertTrue(all(success))
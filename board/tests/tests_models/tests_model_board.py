@@ -1,6 +1,8 @@
 import datetime
+from io import StringIO
 
 from django.contrib.auth import get_user_model
+from django.core.management import CommandError, call_command
 from django.shortcuts import reverse
 from django.test import TestCase
 
@@ -128,3 +130,58 @@ class BoardModelTests(TestCase):
         queryset1 = Board.objects.all()
         queryset2 = Board.objects.order_by("-created_at").all()
         self.assertQuerysetEqual(queryset1, queryset2)
+
+    def test_next_player_property(self):
+        """Test to check the player to move follows from the number of moves played and the game status."""
+        values = {"player_circle": self.user1, "player_cross": self.user2}
+        instance, instance_errors = create_test_instance(values=values, model=Board)
+        success = [instance.next_player == self.user1]
+        instance.positions_circle["B"] = [2]
+        success.append(instance.next_player == self.user2)
+        instance.positions_cross["A"] = [1]
+        success.append(instance.next_player_id == self.user1.pk)
+        instance.status = 4
+        success.append(instance.next_player is None)
+        self.assertTrue(all(success))
+
+    def test_positions_accessors(self):
+        """Test to check the positions dicts read from and write back into the single cells column."""
+        values = {"player_circle": self.user1, "player_cross": self.user2}
+        instance, instance_errors = create_test_instance(values=values, model=Board)
+        instance.positions_circle["A"] = [1, 3]
+        instance.positions_cross = {"A": [], "B": [2], "C": []}
+        instance.save()
+        instance = Board.objects.get(pk=instance.pk)
+        success = [
+            instance.cells == 0b000010000 | 0b001000001 << 9,
+            instance.positions_circle == {"A": [1, 3], "B": [], "C": []},
+            instance.positions_cross == {"A": [], "B": [2], "C": []},
+            Board(cells=0).positions_cross == {"A": [], "B": [], "C": []},
+        ]
+        self.assertTrue(all(success))
+
+    def test_benchmark_board_queries_command(self):
+        """
+        Test to check the benchmark only runs on the default database when forced to, uses the indexes of the model and
+        leaves neither games nor users behind.
+        """
+        users = User.objects.count()
+        out = StringIO()
+        with self.assertRaises(CommandError):
+            call_command("benchmark_board_queries", database="default", stdout=out)
+        call_command(
+            "benchmark_board_queries",
+            database="default",
+            force=True,
+            boards=200,
+            users=5,
+            repeat=1,
+            stdout=out,
+        )
+        success = [
+            "board_cross_created_idx" in out.getvalue(),
+            "board_finished_created_idx" in out.getvalue(),
+            not Board.objects.exists(),
+            User.objects.count() == users,
+        ]
+        self.assertTrue(all(success))
@@ -0,0 +1,32 @@
+from django.contrib.auth import get_user_model
+from django.db import IntegrityError
+from django.test import TestCase
+
+from board.models import Board, Move
+
+User = get_user_model()
+
+
+class MoveModelTests(TestCase):
+    """Tests for 'board.models.Move' model."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user1 = User.objects.create_user(username="Erick", password="abc*.123")
+        cls.user2 = User.objects.create_user(username="Erick1", password="abc*.123")
+        cls.board = Board.objects.create(
+            player_circle=cls.user1, player_cross=cls.user2
+        )
+
+    def test_move_log(self):
+        """Test to check moves are kept in the order they were played and a ply can't be logged twice."""
+        Move.objects.create(board=self.board, ply=2, player=self.user2, cell=8)
+        Move.objects.create(board=self.board, ply=1, player=self.user1, cell=4)
+        success = [
+            [move.position for move in self.board.moves.all()] == ["B_2", "C_3"],
+            # Ordered by the columns of the unique index, without joining the boards.
+            "board_board" not in str(Move.objects.all().query),
+        ]
+        with self.assertRaises(IntegrityError):
+            Move.objects.create(board=self.board, ply=2, player=self.user1, cell=0)
+        self.assertTrue(all(success))
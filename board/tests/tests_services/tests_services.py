@@ -0,0 +1,341 @@
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ImproperlyConfigured, ValidationError
+from django.db.models import F
+from django.shortcuts import reverse
+from django.test import TestCase
+
+from board import bot, constants, engine, services
+from board.models import Board, Move
+from utils.messages import MESSAGES
+
+User = get_user_model()
+
+
+class PlayMoveTests(TestCase):
+    """Tests for 'board.services.play_move'."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user1 = User.objects.create_user(username="Erick", password="abc*.123")
+        cls.user2 = User.objects.create_user(username="Erick1", password="abc*.123")
+        cls.board = Board.objects.create(
+            player_circle=cls.user1, player_cross=cls.user2
+        )
+
+    def test_turns(self):
+        """Test to check turns are handed over after every move and removed once the game is over."""
+        success = []
+        for user, position, status, next_player in [
+            (self.user1, ("A", "1"), 1, self.user2),
+            (self.user2, ("B", "1"), 1, self.user1),
+            (self.user1, ("A", "2"), 1, self.user2),
+            (self.user2, ("B", "2"), 1, self.user1),
+            (self.user1, ("A", "3"), 3, None),
+        ]:
+            result = services.play_move(self.board.pk, position, user)
+            success.extend(
+                [
+                    isinstance(result, services.MoveResult),
+                    result.status == status,
+                    result.position == "_".join(position),
+                    Board.objects.get(pk=self.board.pk).next_player == next_player,
+                ]
+            )
+        with self.assertRaises(ValidationError):
+            services.play_move(self.board.pk, ("C", "3"), self.user2)
+        with self.assertRaises(ValidationError):
+            services.play_move(10**23, ("C", "3"), self.user2)
+        success.append(
+            list(
+                Move.objects.filter(board=self.board).values_list(
+                    "ply", "player", "cell"
+                )
+            )
+            == [
+                (1, self.user1.pk, 0),
+                (2, self.user2.pk, 1),
+                (3, self.user1.pk, 3),
+                (4, self.user2.pk, 4),
+                (5, self.user1.pk, 6),
+            ]
+        )
+        self.assertTrue(all(success))
+
+    def test_concurrent_moves(self):
+        """Test to check a move committed in between a read and its write is detected through the board version."""
+        validate_move = services.validate_move
+
+        def interleaved_move(board, position, user):
+            if board.version == 0:
+                # Somebody else plays the same cell right after this board was read.
+                Board.objects.filter(pk=board.pk).update(
+                    cells=engine.pack(engine.GameState(circle=1)),
+                    version=F("version") + 1,
+                )
+            return validate_move(board, position, user)
+
+        with patch.object(services, "validate_move", side_effect=interleaved_move):
+            with self.assertRaises(ValidationError) as context:
+                services.play_move(self.board.pk, ("A", "1"), self.user1)
+
+        board = Board.objects.get(pk=self.board.pk)
+        success = [
+            str(context.exception.messages[0]) == "Position already taken.",
+            board.version == 1,
+            board.positions_circle == {"A": [1], "B": [], "C": []},
+            not Move.objects.filter(board=board).exists(),
+        ]
+
+        with patch.object(services, "_commit", return_value=False):
+            with self.assertRaises(ValidationError) as context:
+                services.play_move(self.board.pk, ("B", "1"), self.user2)
+        success.append(
+            str(context.exception.messages[0])
+            == "The board changed while playing, please try again."
+        )
+        self.assertTrue(all(success))
+
+    def test_create_board_against_computer(self):
+        """Test to check the computer opens the games it plays as circle and hands the turn over."""
+        computer = bot.get_bot_user()
+        board = services.create_board(player_cross=self.user1, player_circle=computer)
+        board.refresh_from_db()
+        success = [
+            board.game_state.circle.bit_count() == 1,
+            board.next_player == self.user1,
+        ]
+        result = services.play_move(board.pk, ("A", "1"), self.user1)
+        success.extend(
+            [
+                result.computer_move is not None,
+                Board.objects.get(pk=board.pk).next_player == self.user1,
+                list(board.moves.values_list("ply", "player"))
+                == [
+                    (1, computer.pk),
+                    (2, self.user1.pk),
+                    (3, computer.pk),
+                ],
+            ]
+        )
+        self.assertTrue(all(success))
+
+
+class BotTests(TestCase):
+    """Tests for 'board.bot' computer player."""
+
+    def test_bot_identity(self):
+        """Test to check only the account made for the computer plays by itself, and its username can't be signed up."""
+        computer = bot.get_bot_user()
+        success = [
+            bot.is_bot(computer),
+            bot.get_bot_user() == computer,
+            not User.objects.filter(bot.get_bot_filter()).exclude(pk=computer.pk),
+        ]
+        response = self.client.post(
+            reverse("account_signup"),
+            {
+                "username": "Computer",
+                "password1": "abc*.123-abc",
+                "password2": "abc*.123-abc",
+            },
+        )
+        success.extend(
+            [
+                response.status_code == 200,
+                MESSAGES["SYS018"].value in response.context["form"].errors["username"],
+            ]
+        )
+        with self.settings(BOARD_BOT_USERNAME="Erick"):
+            user = User.objects.create_user(username="Erick", password="abc*.123")
+            success.extend(
+                [
+                    not bot.is_bot(user),
+                    not User.objects.filter(bot.get_bot_filter()).exists(),
+                ]
+            )
+            with self.assertRaises(ImproperlyConfigured):
+                bot.get_bot_user()
+        self.assertTrue(all(success))
+
+
+class PlayMovesTests(TestCase):
+    """Tests for 'board.services.play_moves'."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user1 = User.objects.create_user(username="Erick", password="abc*.123")
+        cls.user2 = User.objects.create_user(username="Erick1", password="abc*.123")
+        cls.boards = [
+            Board.objects.create(player_circle=cls.user1, player_cross=cls.user2)
+            for _ in range(3)
+        ]
+
+    def test_play_moves(self):
+        """Test to check valid moves are played even when others in the same batch are rejected."""
+        first, second, third = self.boards
+        third.positions_circle["A"] = [1]
+        third.save()
+        # Boards, then the update and the log, plus the transaction's savepoint and release.
+        with self.assertNumQueries(5):
+            results = services.play_moves(
+                [
+                    (first.pk, ("A", "1")),
+                    (1000, ("A", "1")),
+                    (second.pk, ("B", "2")),
+                    (third.pk, ("A", "2")),
+                    (first.pk, ("A", "1")),
+                    (10**23, ("A", "1")),
+                ],
+                self.user1,
+            )
+        boards = Board.objects.in_bulk([board.pk for board in self.boards])
+        success = [
+            len(results) == 6,
+            results[0].position == "A_1",
+            str(results[1].messages[0]) == "Board object does not exist.",
+            results[2].position == "B_2",
+            str(results[3].messages[0]) == "It's not your turn.",
+            str(results[4].messages[0]) == "Position already taken.",
+            str(results[5].messages[0]) == MESSAGES["SYS006"].value,
+            boards[first.pk].positions_circle == {"A": [1], "B": [], "C": []},
+            boards[first.pk].version == 1,
+            boards[second.pk].next_player == self.user2,
+            boards[third.pk].version == 0,
+            Move.objects.count() == 2,
+        ]
+        self.assertTrue(all(success))
+
+
+class CreateBoardsTests(TestCase):
+    """Tests for 'board.services.create_boards'."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user1 = User.objects.create_user(username="Erick", password="abc*.123")
+        cls.user2 = User.objects.create_user(username="Erick1", password="abc*.123")
+        cls.user3 = User.objects.create_user(username="Erick2", password="abc*.123")
+        cls.computer = bot.get_bot_user()
+
+    def test_create_boards(self):
+        """Test to check every pairing gets its game, in order, and the computer opens the ones it plays as circle."""
+        pairings = [
+            (self.user1.pk, self.user2.pk),
+            (self.user2.pk, self.user3.pk),
+            (self.user3.pk, self.computer.pk),
+            (self.user1.pk, self.computer.pk),
+        ]
+        # Users, two batches of boards and a single one of moves, plus the transaction's savepoint and release.
+        with self.assertNumQueries(6):
+            ids = services.create_boards(pairings, batch_size=2)
+        boards = Board.objects.in_bulk(ids)
+        success = [
+            len(ids) == 4,
+            [(boards[pk].player_cross_id, boards[pk].player_circle_id) for pk in ids]
+            == pairings,
+            boards[ids[0]].cells == 0,
+            boards[ids[2]].next_player == self.user3,
+            boards[ids[2]].cells == boards[ids[3]].cells != 0,
+            Move.objects.filter(board__in=ids).count() == 2,
+        ]
+        self.assertTrue(all(success))
+
+    def test_invalid_pairings(self):
+        """Test to check no game is created when any of the pairings is invalid."""
+        success = []
+        for pairings, message in [
+            (
+                [(self.user1.pk, self.user2.pk), (self.user3.pk, self.user3.pk)],
+                "A single user can't play both teams.",
+            ),
+            (
+                [(self.user1.pk, self.user2.pk), (self.user3.pk, 1000)],
+                "User object does not exist.",
+            ),
+        ]:
+            with self.assertRaises(ValidationError) as context:
+                services.create_boards(pairings)
+            success.append(str(context.exception.messages[0]) == message)
+        success.append(not Board.objects.exists())
+        self.assertTrue(all(success))
+
+
+class TournamentTests(TestCase):
+    """Tests for 'board.services' tournament functions."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.users = [
+            User.objects.create_user(username=username, password="abc*.123")
+            for username in ("Erick", "Erick1", "Erick2")
+        ]
+
+    def finish_round(self, tournament):
+        """Circles win every game of the current round by playing the first column."""
+        for board in tournament.boards.filter(round=tournament.current_round):
+            for position, user in [
+                (("A", "1"), board.player_circle),
+                (("B", "1"), board.player_cross),
+                (("A", "2"), board.player_circle),
+                (("B", "2"), board.player_cross),
+                (("A", "3"), board.player_circle),
+            ]:
+                services.play_move(board.pk, position, user)
+
+    def test_create_tournament(self):
+        """Test to check tournaments need distinct players and get their first round paired right away."""
+        success = []
+        for users, message in [
+            (self.users[:1], "A tournament needs at least two players."),
+            (
+                [self.users[0], self.users[0]],
+                "A player can't be registered twice in a tournament.",
+            ),
+        ]:
+            with self.assertRaises(ValidationError) as context:
+                services.create_tournament("Cup", constants.SWISS, users)
+            success.append(str(context.exception.messages[0]) == message)
+
+        tournament = services.create_tournament("Cup", constants.SWISS, self.users)
+        bye = tournament.players.get(byes=1)
+        success.extend(
+            [
+                tournament.rounds == 2,
+                tournament.current_round == 1,
+                tournament.boards.filter(round=1).count() == 1,
+                bye.points == constants.VICTORY_POINTS,
+                bye.user_id == self.users[2].pk,
+            ]
+        )
+        self.assertTrue(all(success))
+
+    def test_round_robin(self):
+        """Test to check rounds only advance once every game is over, and the tournament finishes after the last one."""
+        tournament = services.create_tournament(
+            "League", constants.ROUND_ROBIN, self.users
+        )
+        success = [
+            tournament.rounds == 3,
+            services.advance_tournament(tournament.pk) is False,
+        ]
+        for round_number in range(1, 4):
+            with self.captureOnCommitCallbacks(execute=True):
+                self.finish_round(tournament)
+            tournament.refresh_from_db()
+            success.append(
+                tournament.current_round == min(round_number + 1, 3)
+                and tournament.finished == (round_number == 3)
+            )
+
+        players = list(tournament.players.all())
+        success.extend(
+            [
+                tournament.boards.count() == 3,
+                all(player.crosses == player.circles == 1 for player in players),
+                all(player.byes == 1 for player in players),
+                all(player.points == constants.VICTORY_POINTS for player in players),
+                services.advance_tournament(tournament.pk) is False,
+            ]
+        )
+        self.assertTrue(all(success))
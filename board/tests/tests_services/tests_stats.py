@@ -0,0 +1,125 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+
+from board import ratings, services, stats
+from board.models import Board, PlayerStats
+
+User = get_user_model()
+
+CIRCLE_WINS = [("A", "1"), ("B", "1"), ("A", "2"), ("B", "2"), ("A", "3")]
+CROSS_WINS = [("A", "1"), ("B", "1"), ("A", "2"), ("B", "2"), ("C", "3"), ("B", "3")]
+DRAW = [
+    ("B", "2"),
+    ("A", "1"),
+    ("C", "1"),
+    ("B", "1"),
+    ("B", "3"),
+    ("A", "3"),
+    ("A", "2"),
+    ("C", "2"),
+    ("C", "3"),
+]
+
+
+class PlayerStatsTests(TestCase):
+    """Tests for 'board.stats' player stats."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user1 = User.objects.create_user(username="Erick", password="abc*.123")
+        cls.user2 = User.objects.create_user(username="Erick1", password="abc*.123")
+
+    def play(self, player_circle, player_cross, positions):
+        board = Board.objects.create(
+            player_circle=player_circle, player_cross=player_cross
+        )
+        for ply, position in enumerate(positions):
+            player = player_circle if ply % 2 == 0 else player_cross
+            services.play_move(board.pk, position, player)
+        return board
+
+    def test_record_results(self):
+        """Test to check results and streaks are recorded as games finish, and rebuilding them gives the same rows."""
+        self.play(self.user1, self.user2, CIRCLE_WINS)
+        self.play(self.user2, self.user1, CROSS_WINS)
+        self.play(self.user1, self.user2, CIRCLE_WINS[:3])
+        first, second = PlayerStats.objects.in_bulk(
+            [self.user1.pk, self.user2.pk]
+        ).values()
+        success = [
+            (first.games_as_circle, first.victories_as_circle) == (1, 1),
+            (first.games_as_cross, first.victories_as_cross) == (1, 1),
+            first.streak == 2,
+            (second.defeats_as_circle, second.defeats_as_cross) == (1, 1),
+            second.streak == -2,
+        ]
+        self.play(self.user2, self.user1, DRAW)
+        first.refresh_from_db()
+        success.extend(
+            [
+                (first.draws_as_cross, first.streak) == (1, 0),
+                first.last_played_at is not None,
+            ]
+        )
+
+        recorded = list(PlayerStats.objects.order_by("pk").values())
+        PlayerStats.objects.all().delete()
+        call_command(
+            "rebuild_player_stats", chunk_size=1, stdout=open("/dev/null", "w")
+        )
+        call_command("recalculate_ratings", chunk_size=1, stdout=StringIO())
+        rebuilt = list(PlayerStats.objects.order_by("pk").values())
+        for row in recorded + rebuilt:
+            row.pop("last_played_at")
+        success.append(recorded == rebuilt)
+        self.assertTrue(all(success))
+
+    def test_ratings(self):
+        """Test to check ratings move by the same points between both players, and a draw between equals moves none."""
+        self.play(self.user1, self.user2, CIRCLE_WINS)
+        first, second = PlayerStats.objects.in_bulk(
+            [self.user1.pk, self.user2.pk]
+        ).values()
+        success = [
+            first.rating == ratings.INITIAL_RATING + 16,
+            second.rating == ratings.INITIAL_RATING - 16,
+        ]
+        self.play(self.user2, self.user1, CROSS_WINS)
+        first.refresh_from_db()
+        second.refresh_from_db()
+        success.extend(
+            [
+                ratings.INITIAL_RATING + 16
+                < first.rating
+                < ratings.INITIAL_RATING + 32,
+                first.rating + second.rating == 2 * ratings.INITIAL_RATING,
+                ratings.rate_game(1500, 1500, 4) == (1500, 1500),
+                stats.get_rank(self.user1.pk) == (1, first.rating),
+                stats.get_rank(self.user2.pk) == (2, second.rating),
+            ]
+        )
+        self.assertTrue(all(success))
+
+    def test_record_batch(self):
+        """Test to check games finished together are rated one after the other, locking their players only once."""
+        boards = Board.objects.bulk_create(
+            [
+                Board(player_circle=self.user1, player_cross=self.user2, status=3),
+                Board(player_circle=self.user2, player_cross=self.user1, status=2),
+            ]
+        )
+        second, first = ratings.rate_game(
+            ratings.INITIAL_RATING, ratings.INITIAL_RATING, 3
+        )
+        first, second = ratings.rate_game(first, second, 2)
+        # Creating the rows, locking them and two updates per game.
+        with self.assertNumQueries(6):
+            stats.record_results(boards)
+        success = [
+            PlayerStats.objects.get(pk=self.user1.pk).rating == first,
+            PlayerStats.objects.get(pk=self.user2.pk).rating == second,
+        ]
+        self.assertTrue(all(success))
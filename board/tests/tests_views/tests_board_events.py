@@ -0,0 +1,141 @@
+import asyncio
+import json
+import threading
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.shortcuts import reverse
+from django.test import SimpleTestCase, TestCase
+
+from board import events, services
+from board.models import Board
+
+User = get_user_model()
+
+
+def parse_event(chunk):
+    lines = dict(line.split(": ", 1) for line in chunk.decode().strip().split("\n"))
+    return lines["event"], json.loads(lines["data"])
+
+
+class BrokerTests(SimpleTestCase):
+    """Tests for 'board.events.Broker' pub/sub."""
+
+    async def test_publish(self):
+        """Test to check events published from other threads reach subscribers, dropping the oldest when full."""
+        broker = events.Broker()
+        with self.settings(BOARD_EVENTS_QUEUE_SIZE=2):
+            with broker.subscribe("board:1", "user:1") as queue:
+                publisher = threading.Thread(
+                    target=lambda: [
+                        broker.publish(channel, index)
+                        for index, channel in enumerate(
+                            ["board:1", "board:2", "user:1", "board:1"]
+                        )
+                    ]
+                )
+                publisher.start()
+                publisher.join()
+                await asyncio.sleep(0)
+                received = [queue.get_nowait(), queue.get_nowait()]
+        success = [
+            received == [("user:1", 2), ("board:1", 3)],
+            broker.publish("board:1", 4) == 0,
+            not broker._subscribers,
+        ]
+        self.assertTrue(all(success))
+
+
+class BoardEventsTests(TestCase):
+    """Tests for 'board:board_events' and 'board:user_events' views."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user1 = User.objects.create_user(username="Erick", password="abc*.123")
+        cls.user2 = User.objects.create_user(username="Erick1", password="abc*.123")
+        cls.board = Board.objects.create(
+            player_circle=cls.user1, player_cross=cls.user2
+        )
+
+        cls.url = reverse("board:board_events", kwargs={"pk": cls.board.pk})
+
+    def play(self, position, user):
+        with self.captureOnCommitCallbacks(execute=True):
+            services.play_move(self.board.pk, position, user)
+
+    async def test_authentication_required(self):
+        """Test to check that only authenticated users can follow boards, and only existing ones."""
+        response = await self.async_client.get(self.url)
+        success = [response.status_code == 403]
+        await sync_to_async(self.async_client.force_login)(self.user1)
+        for pk in [1000, 10**23]:
+            response = await self.async_client.get(
+                reverse("board:board_events", kwargs={"pk": pk})
+            )
+            success.append(response.status_code == 404)
+        self.assertTrue(all(success))
+
+    async def test_board_events(self):
+        """Test to check the stream starts with the current board, follows every committed move and ends in time."""
+        await sync_to_async(self.async_client.force_login)(self.user2)
+        with self.settings(BOARD_EVENTS_TIMEOUT=1):
+            response = await self.async_client.get(self.url)
+            stream = aiter(response.streaming_content)
+            retry = await anext(stream)
+            name, snapshot = parse_event(await anext(stream))
+            channel = events.board_channel(self.board.pk)
+            subscribed = channel in events.broker._subscribers
+            await sync_to_async(self.play)(("A", "1"), self.user1)
+            name, data = parse_event(await asyncio.wait_for(anext(stream), 5))
+            remaining = [chunk async for chunk in stream]
+        success = [
+            response["Content-Type"] == "text/event-stream",
+            retry.startswith(b"retry: "),
+            snapshot["version"] == 0,
+            snapshot["next_player_id"] == self.user1.pk,
+            subscribed,
+            name == "board",
+            data["version"] == 1,
+            data["next_player_id"] == self.user2.pk,
+            all(chunk == b": keep-alive\n\n" for chunk in remaining),
+            channel not in events.broker._subscribers,
+        ]
+        self.assertTrue(all(success))
+
+    async def test_user_events(self):
+        """Test to check players are told when it becomes their turn, and only then."""
+        await sync_to_async(self.async_client.force_login)(self.user2)
+        response = await self.async_client.get(reverse("board:user_events"))
+        stream = aiter(response.streaming_content)
+        await anext(stream)
+        await sync_to_async(self.play)(("A", "1"), self.user1)
+        name, data = parse_event(await asyncio.wait_for(anext(stream), 5))
+        await sync_to_async(self.play)(("B", "1"), self.user2)
+        with self.settings(BOARD_EVENTS_HEARTBEAT=0.1):
+            keep_alive = await asyncio.wait_for(anext(stream), 5)
+        success = [
+            name == "turn",
+            data["board_id"] == self.board.pk,
+            keep_alive == b": keep-alive\n\n",
+        ]
+        self.assertTrue(all(success))
+
+    async def test_live_updates(self):
+        """Test to check pages only listen to the event streams when served over ASGI."""
+        urls = [
+            reverse("board:board_play", kwargs={"pk": self.board.pk}),
+            reverse("board:board_list"),
+        ]
+        await sync_to_async(self.async_client.force_login)(self.user1)
+        await sync_to_async(self.client.force_login)(self.user1)
+        success = []
+        for url in urls:
+            asgi_response = await self.async_client.get(url)
+            wsgi_response = await sync_to_async(self.client.get)(url)
+            success.extend(
+                [
+                    b"EventSource" in asgi_response.content,
+                    b"EventSource" not in wsgi_response.content,
+                ]
+            )
+        self.assertTrue(all(success))
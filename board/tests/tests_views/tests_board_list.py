@@ -1,8 +1,11 @@
 from django.contrib.auth import get_user_model
+from django.db import connection
 from django.db.models import Q
 from django.shortcuts import reverse
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
+from board import services, stats
 from board.filters import BoardFilter
 from board.models import Board
 from board.tables import BoardTable
@@ -24,6 +27,9 @@ class BoardListTests(TestCase):
 
         cls.url = reverse("board:board_list")
 
+    def rebuild_stats(self):
+        stats.rebuild_player_stats([self.user1.pk, self.user2.pk])
+
     def test_authentication_required(self):
         """Test to check that only authenticated users can access this view."""
         success = []
@@ -72,15 +78,17 @@ class BoardListTests(TestCase):
             response.context_data["draws_as_cross"] == 0,
         ]
         success.extend(historic_record)
-        self.assertQuerysetEqual(
-            response.context_data["boards_as_circle"], self.user1.circle.all()
+        success.append(
+            response.context_data["games_as_circle"] == self.user1.circle.count()
         )
-        self.assertQuerysetEqual(
-            response.context_data["boards_as_cross"], self.user1.cross.all()
+        success.append(
+            response.context_data["games_as_cross"] == self.user1.cross.count()
         )
 
         self.board.status = 2
         self.board.save()
+        # Finished outside of 'board.services', which would record the result on its own.
+        self.rebuild_stats()
         response = self.client.get(self.url)
         historic_record = [
             response.context_data["victories_as_circle"] == 0,
@@ -99,11 +107,11 @@ class BoardListTests(TestCase):
             response.context_data["draws_as_cross"] == 0,
         ]
         success.extend(historic_record)
-        self.assertQuerysetEqual(
-            response.context_data["boards_as_circle"], self.user2.circle.all()
+        success.append(
+            response.context_data["games_as_circle"] == self.user2.circle.count()
         )
-        self.assertQuerysetEqual(
-            response.context_data["boards_as_cross"], self.user2.cross.all()
+        success.append(
+            response.context_data["games_as_cross"] == self.user2.cross.count()
         )
 
         self.client.logout()
@@ -116,15 +124,16 @@ class BoardListTests(TestCase):
             response.context_data["draws_as_cross"] == 0,
         ]
         success.extend(historic_record)
-        self.assertQuerysetEqual(
-            response.context_data["boards_as_circle"], self.user3.circle.all()
+        success.append(
+            response.context_data["games_as_circle"] == self.user3.circle.count()
         )
-        self.assertQuerysetEqual(
-            response.context_data["boards_as_cross"], self.user3.cross.all()
+        success.append(
+            response.context_data["games_as_cross"] == self.user3.cross.count()
         )
 
         self.board.status = 3
         self.board.save()
+        self.rebuild_stats()
 
         self.client.logout()
         self.client.force_login(user=self.user1)
@@ -136,11 +145,11 @@ class BoardListTests(TestCase):
             response.context_data["draws_as_cross"] == 0,
         ]
         success.extend(historic_record)
-        self.assertQuerysetEqual(
-            response.context_data["boards_as_circle"], self.user1.circle.all()
+        success.append(
+            response.context_data["games_as_circle"] == self.user1.circle.count()
         )
-        self.assertQuerysetEqual(
-            response.context_data["boards_as_cross"], self.user1.cross.all()
+        success.append(
+            response.context_data["games_as_cross"] == self.user1.cross.count()
         )
 
         self.client.logout()
@@ -153,11 +162,11 @@ class BoardListTests(TestCase):
             response.context_data["draws_as_cross"] == 0,
         ]
         success.extend(historic_record)
-        self.assertQuerysetEqual(
-            response.context_data["boards_as_circle"], self.user2.circle.all()
+        success.append(
+            response.context_data["games_as_circle"] == self.user2.circle.count()
         )
-        self.assertQuerysetEqual(
-            response.context_data["boards_as_cross"], self.user2.cross.all()
+        success.append(
+            response.context_data["games_as_cross"] == self.user2.cross.count()
         )
 
         self.client.logout()
@@ -170,15 +179,16 @@ class BoardListTests(TestCase):
             response.context_data["draws_as_cross"] == 0,
         ]
         success.extend(historic_record)
-        self.assertQuerysetEqual(
-            response.context_data["boards_as_circle"], self.user3.circle.all()
+        success.append(
+            response.context_data["games_as_circle"] == self.user3.circle.count()
         )
-        self.assertQuerysetEqual(
-            response.context_data["boards_as_cross"], self.user3.cross.all()
+        success.append(
+            response.context_data["games_as_cross"] == self.user3.cross.count()
         )
 
         self.board.status = 4
         self.board.save()
+        self.rebuild_stats()
 
         self.client.logout()
         self.client.force_login(user=self.user1)
@@ -190,11 +200,11 @@ class BoardListTests(TestCase):
             response.context_data["draws_as_cross"] == 0,
         ]
         success.extend(historic_record)
-        self.assertQuerysetEqual(
-            response.context_data["boards_as_circle"], self.user1.circle.all()
+        success.append(
+            response.context_data["games_as_circle"] == self.user1.circle.count()
         )
-        self.assertQuerysetEqual(
-            response.context_data["boards_as_cross"], self.user1.cross.all()
+        success.append(
+            response.context_data["games_as_cross"] == self.user1.cross.count()
         )
 
         self.client.logout()
@@ -207,11 +217,11 @@ class BoardListTests(TestCase):
             response.context_data["draws_as_cross"] == 1,
         ]
         success.extend(historic_record)
-        self.assertQuerysetEqual(
-            response.context_data["boards_as_circle"], self.user2.circle.all()
+        success.append(
+            response.context_data["games_as_circle"] == self.user2.circle.count()
         )
-        self.assertQuerysetEqual(
-            response.context_data["boards_as_cross"], self.user2.cross.all()
+        success.append(
+            response.context_data["games_as_cross"] == self.user2.cross.count()
         )
 
         self.client.logout()
@@ -224,13 +234,103 @@ class BoardListTests(TestCase):
             response.context_data["draws_as_cross"] == 0,
         ]
         success.extend(historic_record)
-        self.assertQuerysetEqual(
-            response.context_data["boards_as_circle"], self.user3.circle.all()
+        success.append(
+            response.context_data["games_as_circle"] == self.user3.circle.count()
+        )
+        success.append(
+            response.context_data["games_as_cross"] == self.user3.cross.count()
         )
-        self.assertQuerysetEqual(
-            response.context_data["boards_as_cross"], self.user3.cross.all()
+
+        self.assertTrue(all(success))
+
+    def test_statistics(self):
+        """
+        Test to check statistics take the stats row and a count of the games being played, and are up to date as soon
+        as one of the user's games ends.
+        """
+        self.board.positions_circle.update({"A": [1, 2]})
+        self.board.positions_cross.update({"B": [1, 2]})
+        self.board.save()
+        with self.assertNumQueries(2):
+            first = stats.get_user_stats(self.user1.pk)
+        services.play_move(self.board.pk, ("A", "3"), self.user1)
+        with self.assertNumQueries(2):
+            updated = stats.get_user_stats(self.user1.pk)
+        success = [
+            first["games_as_circle"] == 1,
+            first["victories_as_circle"] == 0,
+            updated["games_as_circle"] == 1,
+            updated["victories_as_circle"] == 1,
+            stats.get_user_stats(self.user2.pk)["games_as_cross"] == 1,
+        ]
+        self.assertTrue(all(success))
+
+    def test_keyset_pagination(self):
+        """Test to check pages hold the user's games, follow each other without gaps and never count or skip rows."""
+        Board.objects.bulk_create(
+            [
+                Board(player_circle=self.user1, player_cross=self.user2)
+                if index % 2
+                else Board(player_circle=self.user3, player_cross=self.user1)
+                for index in range(20)
+            ]
+            + [Board(player_circle=self.user2, player_cross=self.user3)]
         )
+        self.client.force_login(user=self.user1)
+        ids, queries, query = [], [], ""
+        while query is not None:
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.get(f"{self.url}?{query}")
+            queries.extend(captured["sql"] for captured in context.captured_queries)
+            ids.extend(board.pk for board in response.context_data["board_list"])
+            query = response.context_data.get("next_page_query")
+        expected = Board.objects.filter(
+            Q(player_cross=self.user1) | Q(player_circle=self.user1)
+        ).values_list("pk", flat=True)
+        success = [
+            ids == list(expected),
+            # Paginators count the rows as "__count", the statistics only count the games being played.
+            not any('"__count"' in sql or "OFFSET" in sql for sql in queries),
+            "first_page_query" in response.context_data,
+        ]
+        # Well formed but impossible dates, and ids out of range, are read as no cursor at all.
+        created = response.context_data["board_list"][0].created_at.isoformat()
+        for query in [
+            {"after_created": "2020-13-45T00:00:00", "after_id": ids[0]},
+            {"after_created": created, "after_id": 10**23},
+            {"after_created": created, "after_id": 0},
+        ]:
+            response = self.client.get(self.url, query)
+            success.extend(
+                [
+                    response.status_code == 200,
+                    [board.pk for board in response.context_data["board_list"]]
+                    == ids[:8],
+                ]
+            )
+        self.assertTrue(all(success))
 
+    def test_table_queries(self):
+        """Test to check pages render in the same queries no matter their rows, and rows link to their games."""
+        Board.objects.bulk_create(
+            [
+                Board(player_circle=self.user1, player_cross=self.user2)
+                for _ in range(10)
+            ]
+        )
+        self.client.force_login(user=self.user1)
+        queries, query = [], ""
+        while query is not None:
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.get(f"{self.url}?{query}")
+            queries.append(len(context.captured_queries))
+            query = response.context_data.get("next_page_query")
+        success = [
+            len(queries) == 2,
+            queries[0] == queries[1],
+            f'href={reverse("board:board_play", kwargs={"pk": self.board.pk})}>'
+            in response.content.decode(),
+        ]
         self.assertTrue(all(success))
 
     def test_filter(self):
@@ -1,10 +1,13 @@
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.db.models import Q
 from django.shortcuts import reverse
 from django.test import TestCase
 
 from board.forms import CreateBoardForm
 from board.models import Board
+from board.templatetags.tables import get_cache_key, get_table
 
 User = get_user_model()
 
@@ -56,3 +59,77 @@ class BoardPlayTests(TestCase):
             ]
         )
         self.assertTrue(all(success))
+
+    def test_get_table(self):
+        """Test to check the grid is rendered without queries, cached until the cells of the board change."""
+        cache.clear()
+        with self.assertNumQueries(0):
+            player = get_table({}, self.board, self.user1.pk)["table_string"]
+            viewer = get_table({}, self.board, self.user2.pk)["table_string"]
+        cached = cache.get(get_cache_key(self.board, True))
+        # Changed without going through 'board.services', which moves the version forward.
+        self.board.positions_circle["B"] = [2]
+        updated = get_table({}, self.board, self.user2.pk)
+        success = [
+            "value=A_1>A1" in player,
+            "input" not in viewer,
+            cached == player,
+            updated["next_player"],
+            "<td>O</td>" in updated["table_string"],
+            "value=A_1>A1" in updated["table_string"],
+            "<td>O</td>" in get_table({}, self.board, self.user1.pk)["table_string"],
+        ]
+        self.assertTrue(all(success))
+
+    def test_conditional_get(self):
+        """
+        Test to check unchanged pages are answered with 304 from a single query until the board or the viewer's form
+        change, and that pages are always revalidated and never stored when showing messages.
+        """
+        self.client.force_login(user=self.user1)
+        response = self.client.get(self.url)
+        etag = response["ETag"]
+        success = [
+            response.status_code == 200,
+            "no-cache" in response["Cache-Control"],
+            "Last-Modified" in response,
+        ]
+        # Session, user and board.
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        success.extend([response.status_code == 304, response["ETag"] == etag])
+
+        # Logging in again rotates the CSRF secret, the form of the cached page wouldn't be accepted anymore.
+        self.client.cookies.pop(settings.CSRF_COOKIE_NAME)
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        success.append(response.status_code == 200)
+
+        self.client.force_login(user=self.user2)
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=response["ETag"])
+        success.append(response.status_code == 200)
+
+        self.client.force_login(user=self.user1)
+        response = self.client.post(
+            reverse("board:make_movement"),
+            {"board_id": self.board.pk, "position": "B_2"},
+            follow=True,
+        )
+        success.extend(
+            [
+                len(response.context["messages"]) == 1,
+                "no-store" in response["Cache-Control"],
+                "ETag" not in response,
+            ]
+        )
+
+        self.board.status = 4
+        self.board.save()
+        response = self.client.get(self.url)
+        success.extend(
+            [
+                response.status_code == 200,
+                "no-cache" in response["Cache-Control"],
+                "immutable" not in response["Cache-Control"],
+            ]
+        )
+        self.assertTrue(all(success))
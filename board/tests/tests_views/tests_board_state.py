@@ -0,0 +1,92 @@
+import json
+
+from django.contrib.auth import get_user_model
+from django.shortcuts import reverse
+from django.test import TestCase
+
+from board import services
+from board.models import Board
+
+User = get_user_model()
+
+
+class BoardStateTests(TestCase):
+    """Tests for 'board:board_state' and 'board:boards_state' views."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user1 = User.objects.create_user(username="Erick", password="abc*.123")
+        cls.user2 = User.objects.create_user(username="Erick1", password="abc*.123")
+        cls.board = Board.objects.create(
+            player_circle=cls.user1, player_cross=cls.user2
+        )
+
+        cls.url = reverse("board:board_state", kwargs={"pk": cls.board.pk})
+
+    def test_wrong_requests(self):
+        """Test to check anonymous users, missing boards and unsafe methods are refused."""
+        success = [self.client.get(self.url).status_code == 403]
+        self.client.force_login(user=self.user1)
+        success.extend(
+            [
+                self.client.get(
+                    reverse("board:board_state", kwargs={"pk": 1000})
+                ).status_code
+                == 404,
+                self.client.get(
+                    reverse("board:board_state", kwargs={"pk": 10**23})
+                ).status_code
+                == 404,
+                self.client.post(self.url).status_code == 405,
+            ]
+        )
+        self.assertTrue(all(success))
+
+    def test_conditional_get(self):
+        """Test to check the state is only sent again once a move changes it."""
+        self.client.force_login(user=self.user1)
+        response = self.client.get(self.url)
+        content = json.loads(response.content)
+        etag = response["ETag"]
+        success = [
+            response.status_code == 200,
+            content["id"] == self.board.pk,
+            content["board"] == "---------",
+            content["next_player_id"] == self.user1.pk,
+            self.client.get(self.url, HTTP_IF_NONE_MATCH=etag).status_code == 304,
+        ]
+        services.play_move(self.board.pk, ("B", "2"), self.user1)
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        content = json.loads(response.content)
+        success.extend(
+            [
+                response.status_code == 200,
+                response["ETag"] != etag,
+                content["next_player_id"] == self.user2.pk,
+                content["board"] == "----O----",
+            ]
+        )
+        self.assertTrue(all(success))
+
+    def test_batch(self):
+        """Test to check many boards are read in a single query, in the requested order, and bad batches are refused."""
+        other = Board.objects.create(
+            player_circle=self.user2, player_cross=self.user1, status=2
+        )
+        url = reverse("board:boards_state")
+        self.client.force_login(user=self.user1)
+        # Session, user and boards.
+        with self.assertNumQueries(3):
+            response = self.client.get(url, {"ids": f"{other.pk},1000,{self.board.pk}"})
+        content = json.loads(response.content)
+        success = [
+            response.status_code == 200,
+            [board["id"] for board in content["boards"]] == [other.pk, self.board.pk],
+            content["boards"][0]["next_player_id"] is None,
+            content["missing"] == [1000],
+        ]
+        with self.settings(BOARD_STATE_BATCH_SIZE=2):
+            for ids in ["", "a,1", "1,2,3", "1,99999999999999999999999", "0"]:
+                response = self.client.get(url, {"ids": ids})
+                success.append(response.status_code == 400)
+        self.assertTrue(all(success))
@@ -3,6 +3,7 @@ from django.db.models import Q
 from django.shortcuts import reverse
 from django.test import TestCase
 
+from board import bot
 from board.forms import CreateBoardForm
 from board.models import Board
 
@@ -114,3 +115,29 @@ class CreateBoardTests(TestCase):
         )
 
         self.assertTrue(all(success))
+
+    def test_against_computer(self):
+        """Test to check boards can be created against the computer, which opens the game when playing circles."""
+        success = []
+        self.client.force_login(user=self.user1)
+        response = self.client.post(
+            self.url, data={"cross_or_circle": 2, "against_computer": True}
+        )
+        computer = User.objects.get(username=bot.get_bot_username())
+        board = Board.objects.get(player_circle=computer, player_cross=self.user1)
+        success.extend(
+            [
+                response.status_code == 302,
+                not computer.has_usable_password(),
+                sum(len(rows) for rows in board.positions_circle.values()) == 1,
+            ]
+        )
+
+        response = self.client.post(self.url, data={"cross_or_circle": 1})
+        success.extend(
+            [
+                response.status_code == 200,
+                "opponent" in response.context_data["form"].errors,
+            ]
+        )
+        self.assertTrue(all(success))
@@ -0,0 +1,131 @@
+import csv
+import json
+from io import StringIO
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.shortcuts import reverse
+from django.test import TestCase
+
+from board import services
+from board.models import Board
+
+User = get_user_model()
+
+CIRCLE_WINS = [("A", "1"), ("B", "1"), ("A", "2"), ("B", "2"), ("A", "3")]
+
+
+class ExportGamesTests(TestCase):
+    """Tests for 'board:export_games' view and 'export_games' command."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user1 = User.objects.create_user(username="Erick", password="abc*.123")
+        cls.user2 = User.objects.create_user(username="Erick1", password="abc*.123")
+        cls.user3 = User.objects.create_user(
+            username="Erick2", password="abc*.123", is_staff=True
+        )
+        cls.finished = Board.objects.create(
+            player_circle=cls.user1, player_cross=cls.user2
+        )
+        for ply, position in enumerate(CIRCLE_WINS):
+            player = cls.user1 if ply % 2 == 0 else cls.user2
+            services.play_move(cls.finished.pk, position, player)
+        Board.objects.create(player_circle=cls.user2, player_cross=cls.user3)
+        Board.objects.create(player_circle=cls.user2, player_cross=cls.user3, status=4)
+
+        cls.url = reverse("board:export_games")
+
+    async def export(self, **params):
+        response = await self.async_client.get(self.url, params)
+        content = b"".join([chunk async for chunk in response.streaming_content])
+        return response, content.decode()
+
+    async def test_wrong_requests(self):
+        """Test to check only staff users can export, and invalid options are refused."""
+        response = await self.async_client.get(self.url)
+        success = [response.status_code == 403]
+        await sync_to_async(self.async_client.force_login)(self.user1)
+        response = await self.async_client.get(self.url)
+        success.append(response.status_code == 403)
+        await sync_to_async(self.async_client.force_login)(self.user3)
+        for params in [
+            {"format": "xml"},
+            {"level": "turns"},
+            {"status": 1},
+            {"since": "yesterday"},
+            {"user": "Nobody"},
+        ]:
+            response = await self.async_client.get(self.url, params)
+            success.append(response.status_code == 400)
+        self.assertTrue(all(success))
+
+    async def test_export_games(self):
+        """Test to check finished games are streamed one line each or one line per move, filtered by the options."""
+        await sync_to_async(self.async_client.force_login)(self.user3)
+        response, content = await self.export()
+        games = [json.loads(line) for line in content.splitlines()]
+        success = [
+            response.status_code == 200,
+            response["Content-Type"] == "application/x-ndjson",
+            response.streaming,
+            [game["status"] for game in games] == [3, 4],
+            games[0]["board"] == "OX-OX-O--",
+            games[0]["player_circle"] == "Erick",
+        ]
+        response, content = await self.export(user="Erick", status=3, level="moves")
+        moves = [json.loads(line) for line in content.splitlines()]
+        success.extend(
+            [
+                [move["position"] for move in moves]
+                == ["_".join(position) for position in CIRCLE_WINS],
+                {move["board_id"] for move in moves} == {self.finished.pk},
+            ]
+        )
+        response, content = await self.export(format="csv", since="2999-01-01")
+        success.extend(
+            [
+                response["Content-Type"] == "text/csv",
+                list(csv.reader(StringIO(content)))
+                == [
+                    [
+                        "id",
+                        "created_at",
+                        "updated_at",
+                        "player_cross",
+                        "player_circle",
+                        "status",
+                        "board",
+                    ]
+                ],
+            ]
+        )
+        self.assertTrue(all(success))
+
+    def test_export_games_wsgi(self):
+        """Test to check the export is streamed synchronously under WSGI, instead of being loaded whole."""
+        self.client.force_login(user=self.user3)
+        response = self.client.get(self.url)
+        games = [json.loads(line) for line in response.getvalue().decode().splitlines()]
+        success = [
+            response.status_code == 200,
+            response.streaming,
+            not response.is_async,
+            [game["status"] for game in games] == [3, 4],
+        ]
+        self.assertTrue(all(success))
+
+    def test_export_games_command(self):
+        """Test to check the command writes the same lines the view streams."""
+        out = StringIO()
+        call_command(
+            "export_games", format="csv", level="moves", chunk_size=2, stdout=out
+        )
+        rows = list(csv.reader(StringIO(out.getvalue())))
+        success = [
+            rows[0] == ["board_id", "ply", "player", "position", "created_at"],
+            len(rows) == len(CIRCLE_WINS) + 1,
+            rows[-1][1:4] == ["5", "Erick", "A_3"],
+        ]
+        self.assertTrue(all(success))
@@ -0,0 +1,88 @@
+"""
+Pairings of tournament rounds. Players are any objects with the fields of 'board.models.TournamentPlayer', nothing
+here touches the database so every round of a tournament can be paired in memory before its boards are inserted.
+"""
+import math
+
+from board import constants
+
+# How many of the waiting players a Swiss pairing looks through to avoid a rematch.
+SWISS_WINDOW = 8
+
+
+def default_rounds(format, players):
+    if format == constants.ROUND_ROBIN:
+        return players - 1 if players % 2 == 0 else players
+    return max(1, math.ceil(math.log2(players)))
+
+
+def assign_sides(first, second, round_number):
+    """
+    Returns ``(cross, circle)``, the player who played cross the most so far plays circle. Ties alternate every round
+    so the higher ranked player doesn't always get the same side.
+    """
+    first_balance = first.crosses - first.circles
+    second_balance = second.crosses - second.circles
+    if first_balance > second_balance or (
+        first_balance == second_balance and round_number % 2 == 0
+    ):
+        return second, first
+    return first, second
+
+
+def round_robin_pairings(players, round_number):
+    """
+    Pairs of the 1-based ``round_number`` following the circle method: the first seed stays in place while everybody
+    else rotates one table per round, so every player meets every other exactly once. Returns the pairs along with
+    the player resting this round, if any.
+    """
+    ranked = sorted(players, key=lambda player: player.seed)
+    if len(ranked) % 2:
+        ranked.append(None)
+    rest = ranked[1:]
+    shift = (round_number - 1) % len(rest)
+    ranked = ranked[:1] + rest[len(rest) - shift :] + rest[: len(rest) - shift]
+
+    pairs, bye = [], None
+    for table in range(len(ranked) // 2):
+        first, second = ranked[table], ranked[-table - 1]
+        if first is None or second is None:
+            bye = first or second
+        else:
+            pairs.append(assign_sides(first, second, round_number + table))
+    return pairs, bye
+
+
+def swiss_pairings(players, played, round_number):
+    """
+    Pairs players with the closest ranked one, by points and then seed, they haven't met yet. ``played`` holds a
+    frozenset of user ids for every game already paired. Only the next 'SWISS_WINDOW' waiting players are looked
+    through, so pairing is bound by sorting the players. Returns the pairs along with the player getting the bye, the
+    lowest ranked one that hasn't had one yet, when there's an odd amount of players.
+    """
+    ranked = sorted(players, key=lambda player: (-player.points, player.seed))
+    bye = None
+    if len(ranked) % 2:
+        index = next(
+            (
+                index
+                for index in range(len(ranked) - 1, -1, -1)
+                if not ranked[index].byes
+            ),
+            len(ranked) - 1,
+        )
+        bye = ranked.pop(index)
+
+    pairs, waiting = [], []
+    for player in ranked:
+        for index, other in enumerate(waiting[:SWISS_WINDOW]):
+            if frozenset((other.user_id, player.user_id)) not in played:
+                del waiting[index]
+                pairs.append(assign_sides(other, player, round_number))
+                break
+        else:
+            waiting.append(player)
+    # Whoever is left has met every close enough opponent, they get a rematch.
+    for index in range(0, len(waiting), 2):
+        pairs.append(assign_sides(waiting[index], waiting[index + 1], round_number))
+    return pairs, bye
@@ -1,13 +1,19 @@
 from django.urls import path
 
 from board.api import urls as api_urls
-from board.views import board_list, board_play, create_board
+from board.views import (board_events, board_list, board_play, board_state,
+                         boards_state, create_board, export_games, user_events)
 
 app_name = "board"
 urlpatterns = [
     path("", board_list, name="board_list"),
     path("board/create", create_board, name="board_create"),
     path("board/<int:pk>/play", board_play, name="board_play"),
+    path("board/<int:pk>/events", board_events, name="board_events"),
+    path("board/<int:pk>/state", board_state, name="board_state"),
+    path("boards/state", boards_state, name="boards_state"),
+    path("events", user_events, name="user_events"),
+    path("export", export_games, name="export_games"),
 ]
 
 urlpatterns += api_urls.urlpatterns
@@ -1,47 +1,126 @@
-from django.contrib.auth import get_user_model
+import asyncio
+import hashlib
+import heapq
+import json
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib import messages
+from django.contrib.auth import get_user, get_user_model
 from django.contrib.auth.decorators import login_required
+from django.core.exceptions import PermissionDenied
+from django.core.handlers.asgi import ASGIRequest
+from django.core.handlers.wsgi import WSGIRequest
 from django.db import transaction
 from django.db.models import Q
+from django.http import Http404, JsonResponse, StreamingHttpResponse
+from django.middleware.csrf import get_token
 from django.shortcuts import HttpResponseRedirect
 from django.urls import reverse_lazy
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.dateparse import parse_datetime
 from django.utils.decorators import method_decorator
+from django.utils.http import http_date, quote_etag
+from django.views.decorators.http import require_safe
 from django.views.generic import CreateView, DetailView, ListView
 from django_filters.views import FilterView
 from django_tables2 import SingleTableMixin
 
+from board import bot, constants, engine, events, exports, services, stats
 from board.filters import BoardFilter
 from board.forms import CreateBoardForm
 from board.models import Board
 from board.tables import BoardTable
+from utils.messages import MESSAGES
 
 User = get_user_model()
 
 
 @method_decorator(login_required, name="dispatch")
 class BoardList(SingleTableMixin, FilterView):
+    """
+    Games of the user, newest first. Pages are keyed by the ``created_at`` and ``id`` of the last game of the previous
+    page instead of counted from the first one, so every page costs the same to read and nothing is counted.
+    """
+
+    model = Board
     template_name = "board/board_list.html"
-    paginate_by = 8
+    page_size = 8
     table_class = BoardTable
+    table_pagination = False
     filterset_class = BoardFilter
     context_object_name = "board_list"
 
     def get_queryset(self):
         queryset = super().get_queryset()
-        queryset.filter(
-            Q(player_cross=self.request.user) | Q(player_circle=self.request.user)
+        return (
+            queryset.filter(
+                Q(player_cross=self.request.user) | Q(player_circle=self.request.user)
+            )
+            .select_related("player_cross", "player_circle")
+            .only(
+                "player_cross__username",
+                "player_circle__username",
+                "status",
+                "created_at",
+            )
+        )
+
+    def get_cursor(self):
+        try:
+            created_at = parse_datetime(self.request.GET.get("after_created", ""))
+            pk = int(self.request.GET.get("after_id", ""))
+            if not 0 < pk <= constants.MAX_ID:
+                raise ValueError(pk)
+        except ValueError:
+            return None
+        return None if created_at is None else (created_at, pk)
+
+    def paginate_keyset(self, queryset):
+        """
+        Returns the page after the cursor along with the game following it, if any. The games the user played as
+        cross and as circle are read apart, each from its own index, and merged.
+        """
+        cursor = self.get_cursor()
+        sides = []
+        for side in ("player_cross", "player_circle"):
+            boards = queryset.filter(**{side: self.request.user})
+            if cursor is not None:
+                created_at, pk = cursor
+                boards = boards.filter(
+                    Q(created_at__lt=created_at) | Q(created_at=created_at, pk__lt=pk)
+                )
+            sides.append(boards.order_by("-created_at", "-pk")[: self.page_size + 1])
+        boards = list(
+            islice(
+                heapq.merge(
+                    *sides, key=lambda board: (board.created_at, board.pk), reverse=True
+                ),
+                self.page_size + 1,
+            )
         )
-        return queryset
+        return boards[: self.page_size], len(boards) > self.page_size
+
+    def get_table_kwargs(self):
+        # Sorting a page would only shuffle its own rows.
+        return {"orderable": False}
 
     def get_context_data(self, *, object_list=None, **kwargs):
-        context = super().get_context_data(object_list=None, **kwargs)
-        games_as_circle = self.request.user.circle.all()
-        context["boards_as_circle"] = games_as_circle
-        context["victories_as_circle"] = games_as_circle.filter(status=3).count()
-        context["draws_as_circle"] = games_as_circle.filter(status=4).count()
-        games_as_cross = self.request.user.cross.all()
-        context["boards_as_cross"] = games_as_cross
-        context["victories_as_cross"] = games_as_cross.filter(status=2).count()
-        context["draws_as_cross"] = games_as_cross.filter(status=4).count()
+        self.object_list, has_next = self.paginate_keyset(self.object_list)
+        context = super().get_context_data(object_list=self.object_list, **kwargs)
+        query = self.request.GET.copy()
+        if "after_id" in query:
+            query.pop("after_created", None)
+            query.pop("after_id")
+            context["first_page_query"] = query.urlencode()
+        if has_next:
+            last = self.object_list[-1]
+            query["after_created"] = last.created_at.isoformat()
+            query["after_id"] = last.pk
+            context["next_page_query"] = query.urlencode()
+        context.update(stats.get_user_stats(self.request.user.pk))
+        context["live_updates"] = serves_events(self.request)
         return context
 
     def get_filterset_kwargs(self, filterset_class):
@@ -68,10 +147,13 @@ class CreateBoard(CreateView):
         try:
             with transaction.atomic():
                 cross_or_circle = int(form.cleaned_data["cross_or_circle"])
-                opponent = form.cleaned_data["opponent"]
+                if form.cleaned_data["against_computer"]:
+                    opponent = bot.get_bot_user()
+                else:
+                    opponent = form.cleaned_data["opponent"]
                 player_circle = self.request.user if cross_or_circle == 1 else opponent
                 player_cross = self.request.user if cross_or_circle == 2 else opponent
-                Board.objects.create(
+                services.create_board(
                     player_cross=player_cross,
                     player_circle=player_circle,
                 )
@@ -85,7 +167,314 @@ create_board = CreateBoard.as_view()
 
 @method_decorator(login_required, name="dispatch")
 class BoardPlay(DetailView):
-    model = Board
+    """
+    Answers 304 Not Modified, straight from the query loading the board, while neither the board nor the viewer's form
+    changed. The page is specific to the viewer so it's always revalidated, even for finished games, and pages showing
+    messages are never stored at all.
+    """
+
+    queryset = Board.objects.select_related("player_cross", "player_circle")
+
+    def get(self, request, *args, **kwargs):
+        self.object = self.get_object()
+        if len(messages.get_messages(request)):
+            response = self.render_to_response(
+                self.get_context_data(object=self.object)
+            )
+            patch_cache_control(response, private=True, no_store=True)
+            return response
+
+        # The page holds the viewer's own controls and a CSRF token, which changes with every login.
+        get_token(request)
+        csrf_secret = hashlib.sha256(request.META["CSRF_COOKIE"].encode()).hexdigest()
+        etag = get_board_etag(self.object, request.user.pk, csrf_secret[:16])
+        response = get_conditional_response(
+            request,
+            etag=etag,
+            last_modified=int(self.object.updated_at.timestamp()),
+        )
+        if response is None:
+            response = self.render_to_response(
+                self.get_context_data(object=self.object)
+            )
+        set_board_validators(response, self.object, etag)
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["live_updates"] = serves_events(self.request)
+        return context
 
 
 board_play = BoardPlay.as_view()
+
+
+def get_finished_max_age():
+    return getattr(settings, "BOARD_FINISHED_MAX_AGE", 60 * 60 * 24 * 365)
+
+
+def get_board_etag(board, *parts):
+    """Strong ETag of a board, changing with every move and with its status. ``parts`` tell apart its renderings."""
+    return quote_etag(
+        "-".join(
+            str(part)
+            for part in (board.pk, board.cells.bit_count(), board.status, *parts)
+        )
+    )
+
+
+def set_board_validators(response, board, etag):
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(board.updated_at.timestamp())
+
+
+def set_board_cache_headers(response, board, etag):
+    """Unfinished games are revalidated on every request, finished ones never change again."""
+    set_board_validators(response, board, etag)
+    if board.status == constants.UNFINISHED:
+        patch_cache_control(response, private=True, no_cache=True)
+    else:
+        patch_cache_control(
+            response, private=True, max_age=get_finished_max_age(), immutable=True
+        )
+    return response
+
+
+STATE_FIELDS = ("player_cross", "player_circle", "cells", "status", "updated_at")
+
+
+def get_state_batch_size():
+    return getattr(settings, "BOARD_STATE_BATCH_SIZE", 100)
+
+
+def serialize_board_state(board):
+    """Just what clients need to follow a game, with the board as one character per cell, see 'engine.to_string'."""
+    return {
+        "id": board.pk,
+        "status": board.status,
+        "next_player_id": board.next_player_id,
+        "board": engine.to_string(board.game_state),
+    }
+
+
+@require_safe
+def board_state(request, pk):
+    """State of a board for clients polling it, plain JSON without any of the API's machinery."""
+    if not request.user.is_authenticated:
+        raise PermissionDenied
+    if pk > constants.MAX_ID:
+        raise Http404
+    board = Board.objects.filter(pk=pk).only(*STATE_FIELDS).first()
+    if board is None:
+        raise Http404
+    etag = get_board_etag(board)
+    response = get_conditional_response(
+        request, etag=etag, last_modified=int(board.updated_at.timestamp())
+    )
+    if response is None:
+        response = JsonResponse(serialize_board_state(board))
+    return set_board_cache_headers(response, board, etag)
+
+
+@require_safe
+def boards_state(request):
+    """
+    State of every board of the comma separated ``ids``, up to 'BOARD_STATE_BATCH_SIZE' of them, read with a single
+    query. Boards are returned in the requested order, ids that don't exist are listed apart.
+    """
+    if not request.user.is_authenticated:
+        raise PermissionDenied
+    try:
+        ids = list(
+            dict.fromkeys(int(pk) for pk in request.GET.get("ids", "").split(",") if pk)
+        )
+        if not all(0 < pk <= constants.MAX_ID for pk in ids):
+            raise ValueError
+    except ValueError:
+        return JsonResponse(
+            {"type": "BAD_REQUEST", "errors": [MESSAGES["SYS006"].value]},
+            status=400,
+        )
+    batch_size = get_state_batch_size()
+    if not ids or len(ids) > batch_size:
+        return JsonResponse(
+            {
+                "type": "BAD_REQUEST",
+                "errors": [MESSAGES["SYS015"].value.format(batch_size)],
+            },
+            status=400,
+        )
+    boards = Board.objects.only(*STATE_FIELDS).in_bulk(ids)
+    return JsonResponse(
+        {
+            "boards": [serialize_board_state(boards[pk]) for pk in ids if pk in boards],
+            "missing": [pk for pk in ids if pk not in boards],
+        }
+    )
+
+
+def serves_events(request):
+    """
+    Whether pages should listen to the event streams. Only ASGI keeps them open without holding a worker, WSGI servers
+    would spend one on each open page and only send the events once the stream ends.
+    """
+    return isinstance(request, ASGIRequest)
+
+
+def get_events_heartbeat():
+    return getattr(settings, "BOARD_EVENTS_HEARTBEAT", 15)
+
+
+def get_events_timeout():
+    return getattr(settings, "BOARD_EVENTS_TIMEOUT", 300)
+
+
+def format_event(channel, data):
+    name = events.BOARD if channel.startswith(events.BOARD) else events.TURN
+    return f"event: {name}\ndata: {json.dumps(data)}\n\n"
+
+
+async def stream_events(channels, snapshot=None):
+    """
+    Server-sent events published on ``channels``, starting with the event returned by awaiting ``snapshot`` once
+    subscribed, so nothing committed in between is missed. Streams end after 'BOARD_EVENTS_TIMEOUT' seconds and
+    browsers reconnect on their own, which keeps the subscriptions of clients that went away from piling up.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + get_events_timeout()
+    with events.broker.subscribe(*channels) as queue:
+        yield f"retry: {get_events_heartbeat() * 1000}\n\n"
+        if snapshot is not None:
+            data = await snapshot()
+            if data is not None:
+                yield format_event(channels[0], data)
+        while loop.time() < deadline:
+            timeout = min(get_events_heartbeat(), deadline - loop.time())
+            try:
+                channel, data = await asyncio.wait_for(queue.get(), timeout)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+            else:
+                yield format_event(channel, data)
+
+
+def event_stream_response(stream):
+    response = StreamingHttpResponse(stream, content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    # Proxies buffering the response would hold events back.
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
+async def board_events(request, pk):
+    """Every change of a board, to be served by ASGI where idle streams only cost a subscription."""
+    user = await sync_to_async(get_user)(request)
+    if not user.is_authenticated:
+        raise PermissionDenied
+    if pk > constants.MAX_ID or not await Board.objects.filter(pk=pk).aexists():
+        raise Http404
+
+    async def snapshot():
+        board = await Board.objects.filter(pk=pk).afirst()
+        return None if board is None else events.board_event(board)
+
+    return event_stream_response(
+        stream_events([events.board_channel(pk)], snapshot=snapshot)
+    )
+
+
+async def user_events(request):
+    """Boards where it just became the logged user's turn."""
+    user = await sync_to_async(get_user)(request)
+    if not user.is_authenticated:
+        raise PermissionDenied
+    return event_stream_response(stream_events([events.user_channel(user.pk)]))
+
+
+EXPORT_CONTENT_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+def get_export_chunk_size():
+    return getattr(settings, "BOARD_EXPORT_CHUNK_SIZE", 2000)
+
+
+def iter_chunks(lines, chunk_size):
+    """Joins ``lines`` in chunks of ``chunk_size`` lines, so they aren't sent one by one."""
+    lines = iter(lines)
+    while chunk := "".join(islice(lines, chunk_size)):
+        yield chunk
+
+
+async def iter_in_thread(lines, chunk_size):
+    """
+    Serves a synchronous iterator to ASGI a chunk of lines at a time, read from the thread the ORM runs in. Handing it
+    over as it is would have Django load it whole before sending anything.
+    """
+    chunks = iter_chunks(lines, chunk_size)
+    read = sync_to_async(lambda: next(chunks, ""))
+    while chunk := await read():
+        yield chunk
+
+
+def export_error(error):
+    return JsonResponse({"type": "BAD_REQUEST", "errors": [error]}, status=400)
+
+
+async def export_games(request):
+    """
+    Finished games as an NDJSON or CSV download for staff users, see 'board.exports'. Takes the ``format``, ``level``,
+    ``since``, ``until``, ``user`` and ``status`` options of the 'export_games' command as query parameters.
+    """
+    user = await sync_to_async(get_user)(request)
+    if not user.is_staff:
+        raise PermissionDenied
+    format = request.GET.get("format", "ndjson")
+    level = request.GET.get("level", "boards")
+    for name, value, choices in [
+        ("format", format, exports.FORMATS),
+        ("level", level, exports.LEVELS),
+    ]:
+        if value not in choices:
+            return export_error(
+                MESSAGES["SYS017"].value.format(name, ", ".join(choices))
+            )
+    status = request.GET.get("status")
+    if status is not None:
+        if status not in [str(choice) for choice in exports.FINISHED]:
+            return export_error(
+                MESSAGES["SYS017"].value.format(
+                    "status", ", ".join(str(choice) for choice in exports.FINISHED)
+                )
+            )
+        status = int(status)
+    try:
+        since, until = (
+            exports.parse_moment(request.GET[name]) if name in request.GET else None
+            for name in ("since", "until")
+        )
+    except ValueError:
+        return export_error(MESSAGES["SYS016"].value)
+    user_id = None
+    if "user" in request.GET:
+        user_id = await (
+            User.objects.filter(username=request.GET["user"])
+            .values_list("pk", flat=True)
+            .afirst()
+        )
+        if user_id is None:
+            return export_error(MESSAGES["SYS003"].value.format("User"))
+
+    chunk_size = get_export_chunk_size()
+    games = exports.get_games(since=since, until=until, user_id=user_id, status=status)
+    lines = exports.iter_export(
+        games, level=level, format=format, chunk_size=chunk_size
+    )
+    # WSGI servers read the response on their own thread, they would load an asynchronous iterator whole instead.
+    if isinstance(request, WSGIRequest):
+        content = iter_chunks(lines, chunk_size)
+    else:
+        content = iter_in_thread(lines, chunk_size)
+    response = StreamingHttpResponse(content, content_type=EXPORT_CONTENT_TYPES[format])
+    response["Content-Disposition"] = f'attachment; filename="{level}.{format}"'
+    return response
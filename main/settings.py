@@ -137,4 +137,5 @@ STATIC_URL = "static/"
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 LOGIN_REDIRECT_URL = "/"
 ACCOUNT_AUTHENTICATED_LOGIN_REDIRECTS = True
+ACCOUNT_ADAPTER = "board.adapters.AccountAdapter"
 LOGOUT_REDIRECT_URL = ACCOUNT_SIGNUP_REDIRECT_URL = "/accounts/login"
@@ -10,3 +10,15 @@ class MESSAGES(Enum):
     SYS004 = _("Not a vaid position, columns go from 'A' to 'C' and rows from 1 to 3.")
     SYS005 = _("Position already taken.")
     SYS006 = _("Not a vaid ID, this field should be a numerical string.")
+    SYS007 = _("This game is already finished.")
+    SYS008 = _("This position can't be reached in a legal game.")
+    SYS009 = _("You are not playing this game.")
+    SYS010 = _("It's not your turn.")
+    SYS011 = _("The board changed while playing, please try again.")
+    SYS012 = _("A tournament needs at least two players.")
+    SYS013 = _("A player can't be registered twice in a tournament.")
+    SYS014 = _("This player hasn't finished any game yet.")
+    SYS015 = _("Up to {} boards can be requested at once.")
+    SYS016 = _("Not a valid date, dates go like '2023-10-31' or '2023-10-31T18:30'.")
+    SYS017 = _("'{}' should be one of: {}.")
+    SYS018 = _("This username is reserved, please choose another one.")